@@ -0,0 +1,2 @@
+# Licensed under a 3-clause BSD style license - see LICENSE.rst
+"""Performance benchmarks for Gammapy, to be run with asv."""
@@ -0,0 +1,152 @@
+# Licensed under a 3-clause BSD style license - see LICENSE.rst
+"""Synthetic observations and datasets used by the benchmarks.
+
+Everything is created from toy IRFs, so that the benchmarks do not depend
+on ``$GAMMAPY_DATA``.
+"""
+
+import numpy as np
+import astropy.units as u
+from astropy.coordinates import SkyCoord
+from gammapy.data import FixedPointingInfo, Observation, observatory_locations
+from gammapy.datasets import MapDataset
+from gammapy.irf import (
+    PSF3D,
+    Background2D,
+    EffectiveAreaTable2D,
+    EnergyDispersion2D,
+)
+from gammapy.makers import MapDatasetMaker
+from gammapy.maps import MapAxis, WcsGeom
+from gammapy.modeling.models import (
+    FoVBackgroundModel,
+    GaussianSpatialModel,
+    Models,
+    PointSpatialModel,
+    PowerLawSpectralModel,
+    SkyModel,
+)
+
+POINTING = SkyCoord(83.63, 22.01, unit="deg", frame="icrs")
+TARGET = SkyCoord(83.63, 22.51, unit="deg", frame="icrs")
+LIVETIME = 1 * u.h
+RANDOM_STATE = 0
+MAKER_SELECTION = ["exposure", "background", "psf", "edisp"]
+
+
+def make_irfs():
+    """Toy IRFs: parametrised effective area, Gaussian PSF, edisp and background."""
+    energy_axis_true = MapAxis.from_energy_bounds(
+        "0.03 TeV", "300 TeV", nbin=20, name="energy_true"
+    )
+    energy_axis = MapAxis.from_energy_bounds("0.03 TeV", "300 TeV", nbin=20)
+    offset_axis = MapAxis.from_bounds(0, 5, nbin=10, unit="deg", name="offset")
+    migra_axis = MapAxis.from_bounds(0.2, 5, nbin=50, node_type="edges", name="migra")
+    rad_axis = MapAxis.from_bounds(0, 1, nbin=50, unit="deg", name="rad")
+
+    aeff = EffectiveAreaTable2D.from_parametrization(
+        energy_axis_true=energy_axis_true, instrument="CTAO"
+    )
+    aeff = EffectiveAreaTable2D(
+        axes=[energy_axis_true, offset_axis],
+        data=aeff.data[:, :1] * np.ones(offset_axis.nbin),
+        unit=aeff.unit,
+        meta={"TELESCOP": "CTA", "INSTRUME": "Southern Array"},
+    )
+
+    edisp = EnergyDispersion2D.from_gauss(
+        energy_axis_true=energy_axis_true,
+        migra_axis=migra_axis,
+        offset_axis=offset_axis,
+        bias=0,
+        sigma=0.1,
+    )
+
+    sigma = 0.1 * u.deg
+    rad = rad_axis.center
+    data = np.exp(-0.5 * (rad / sigma) ** 2) / (2 * np.pi * sigma**2)
+    shape = (energy_axis_true.nbin, offset_axis.nbin, rad_axis.nbin)
+    psf = PSF3D(
+        axes=[energy_axis_true, offset_axis, rad_axis],
+        data=np.broadcast_to(data.to_value("sr-1"), shape),
+        unit="sr-1",
+    )
+
+    energy = energy_axis.center[:, np.newaxis].to_value("TeV")
+    offset = offset_axis.center.to_value("deg")
+    value = np.exp(-0.5 * (offset / 2) ** 2) * energy**-2.7
+    bkg = Background2D(axes=[energy_axis, offset_axis], unit="s-1 MeV-1 sr-1")
+    bkg.data = 1e-4 * value
+
+    return {"aeff": aeff, "edisp": edisp, "psf": psf, "bkg": bkg}
+
+
+def make_observation(livetime=LIVETIME, irfs=None):
+    """Observation pointed at `POINTING` with toy IRFs."""
+    if irfs is None:
+        irfs = make_irfs()
+
+    return Observation.create(
+        pointing=FixedPointingInfo(fixed_icrs=POINTING),
+        livetime=livetime,
+        irfs=irfs,
+        location=observatory_locations["ctao_south"],
+    )
+
+
+def make_geom(npix, nbin=5, binsz=0.02):
+    """Counts geometry centered on `TARGET`."""
+    energy_axis = MapAxis.from_energy_bounds("0.1 TeV", "100 TeV", nbin=nbin)
+    return WcsGeom.create(
+        skydir=TARGET, npix=npix, binsz=binsz, frame="icrs", axes=[energy_axis]
+    )
+
+
+def make_empty_dataset(npix, nbin=5, binsz=0.02, name="dataset"):
+    """Empty map dataset matching `make_geom`."""
+    geom = make_geom(npix=npix, nbin=nbin, binsz=binsz)
+    energy_axis_true = MapAxis.from_energy_bounds(
+        "0.05 TeV", "200 TeV", nbin=2 * nbin, name="energy_true"
+    )
+    migra_axis = MapAxis.from_bounds(0.2, 5, nbin=50, node_type="edges", name="migra")
+    return MapDataset.create(
+        geom=geom,
+        energy_axis_true=energy_axis_true,
+        migra_axis=migra_axis,
+        name=name,
+    )
+
+
+def make_models(dataset_name, extended=True):
+    """Source and background models for a dataset."""
+    if extended:
+        spatial_model = GaussianSpatialModel(
+            lon_0=TARGET.ra, lat_0=TARGET.dec, sigma="0.1 deg", frame="icrs"
+        )
+    else:
+        spatial_model = PointSpatialModel(
+            lon_0=TARGET.ra, lat_0=TARGET.dec, frame="icrs"
+        )
+
+    spectral_model = PowerLawSpectralModel(
+        index=2.3, amplitude="1e-11 cm-2 s-1 TeV-1", reference="1 TeV"
+    )
+    source = SkyModel(
+        spectral_model=spectral_model, spatial_model=spatial_model, name="source"
+    )
+    return Models([source, FoVBackgroundModel(dataset_name=dataset_name)])
+
+
+def make_map_dataset(
+    npix, nbin=5, binsz=0.02, extended=True, livetime=LIVETIME, name="dataset"
+):
+    """Map dataset reduced from a toy observation, with models and fake counts."""
+    observation = make_observation(livetime=livetime)
+    empty = make_empty_dataset(npix=npix, nbin=nbin, binsz=binsz, name=name)
+
+    maker = MapDatasetMaker(selection=MAKER_SELECTION)
+    dataset = maker.run(empty, observation)
+
+    dataset.models = make_models(dataset_name=name, extended=extended)
+    dataset.fake(random_state=RANDOM_STATE)
+    return dataset
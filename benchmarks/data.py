@@ -0,0 +1,35 @@
+# Licensed under a 3-clause BSD style license - see LICENSE.rst
+import numpy as np
+import astropy.units as u
+from astropy.coordinates import SkyCoord
+from astropy.table import Table
+from astropy.time import Time
+from regions import CircleSkyRegion
+from gammapy.data import EventList
+from .common import POINTING, RANDOM_STATE
+
+
+class EventListSelectRegion:
+    """Selection of events in a circular region."""
+
+    params = [10_000, 100_000, 1_000_000]
+    param_names = ["n_events"]
+
+    def setup(self, n_events):
+        rng = np.random.default_rng(RANDOM_STATE)
+        table = Table()
+        table["RA"] = POINTING.ra + rng.uniform(-3, 3, n_events) * u.deg
+        table["DEC"] = POINTING.dec + rng.uniform(-3, 3, n_events) * u.deg
+        table["ENERGY"] = 10 ** rng.uniform(-1, 2, n_events) * u.TeV
+        seconds = np.sort(rng.uniform(0, 3600, n_events)) * u.s
+        table["TIME"] = Time(51544, format="mjd", scale="tt") + seconds
+        self.events = EventList(table)
+
+        center = SkyCoord(POINTING.ra, POINTING.dec + 0.5 * u.deg)
+        self.region = CircleSkyRegion(center=center, radius=0.5 * u.deg)
+
+    def time_select_region(self, n_events):
+        self.events.select_region(self.region)
+
+    def peakmem_select_region(self, n_events):
+        self.events.select_region(self.region)
@@ -0,0 +1,44 @@
+# Licensed under a 3-clause BSD style license - see LICENSE.rst
+import astropy.units as u
+from gammapy.datasets import MapDatasetEventSampler
+from .common import RANDOM_STATE, make_map_dataset, make_observation
+
+
+class MapDatasetStatSum:
+    """Likelihood evaluation after a change of the spectral index."""
+
+    params = [50, 100, 200]
+    param_names = ["npix"]
+
+    def setup(self, npix):
+        self.dataset = make_map_dataset(npix=npix)
+        self.index = self.dataset.models["source"].spectral_model.index
+        self.dataset.stat_sum()
+
+    def time_stat_sum(self, npix):
+        self.index.value += 1e-3
+        self.dataset.stat_sum()
+
+    def peakmem_stat_sum(self, npix):
+        self.index.value += 1e-3
+        self.dataset.stat_sum()
+
+
+class MapDatasetEventSamplerRun:
+    """Event sampling from a map dataset."""
+
+    params = [0.5, 2, 8]
+    param_names = ["livetime_hours"]
+    timeout = 300
+
+    def setup(self, livetime_hours):
+        livetime = livetime_hours * u.h
+        self.observation = make_observation(livetime=livetime)
+        self.dataset = make_map_dataset(npix=100, livetime=livetime)
+        self.sampler = MapDatasetEventSampler(random_state=RANDOM_STATE)
+
+    def time_run(self, livetime_hours):
+        self.sampler.run(dataset=self.dataset, observation=self.observation)
+
+    def peakmem_run(self, livetime_hours):
+        self.sampler.run(dataset=self.dataset, observation=self.observation)
@@ -0,0 +1,42 @@
+# Licensed under a 3-clause BSD style license - see LICENSE.rst
+from gammapy.estimators import ExcessMapEstimator, TSMapEstimator
+from .common import make_map_dataset
+
+
+class TSMapEstimatorRun:
+    """Test statistic map of a point source."""
+
+    params = [50, 100, 200]
+    param_names = ["npix"]
+    timeout = 600
+
+    def setup(self, npix):
+        self.dataset = make_map_dataset(npix=npix, extended=False)
+        self.estimator = TSMapEstimator(
+            kernel_width="0.3 deg", selection_optional=[], sum_over_energy_groups=True
+        )
+
+    def time_run(self, npix):
+        self.estimator.run(self.dataset)
+
+    def peakmem_run(self, npix):
+        self.estimator.run(self.dataset)
+
+
+class ExcessMapEstimatorRun:
+    """Excess and significance maps with a correlation radius."""
+
+    params = [50, 100, 200]
+    param_names = ["npix"]
+
+    def setup(self, npix):
+        self.dataset = make_map_dataset(npix=npix)
+        self.estimator = ExcessMapEstimator(
+            correlation_radius="0.1 deg", selection_optional=[]
+        )
+
+    def time_run(self, npix):
+        self.estimator.run(self.dataset)
+
+    def peakmem_run(self, npix):
+        self.estimator.run(self.dataset)
@@ -0,0 +1,21 @@
+# Licensed under a 3-clause BSD style license - see LICENSE.rst
+from gammapy.makers import MapDatasetMaker
+from .common import MAKER_SELECTION, make_empty_dataset, make_observation
+
+
+class MapDatasetMakerRun:
+    """Reduction of a toy observation to a map dataset."""
+
+    params = [50, 100, 200]
+    param_names = ["npix"]
+
+    def setup(self, npix):
+        self.observation = make_observation()
+        self.empty = make_empty_dataset(npix=npix)
+        self.maker = MapDatasetMaker(selection=MAKER_SELECTION)
+
+    def time_run(self, npix):
+        self.maker.run(self.empty, self.observation)
+
+    def peakmem_run(self, npix):
+        self.maker.run(self.empty, self.observation)
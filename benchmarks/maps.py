@@ -0,0 +1,32 @@
+# Licensed under a 3-clause BSD style license - see LICENSE.rst
+import numpy as np
+import astropy.units as u
+from gammapy.maps import Map
+from .common import RANDOM_STATE, make_geom
+
+
+class MapInterpByCoord:
+    """Interpolation of a map cube at random coordinates."""
+
+    params = ([100, 500], [10_000, 1_000_000])
+    param_names = ["npix", "n_coords"]
+
+    def setup(self, npix, n_coords):
+        geom = make_geom(npix=npix, binsz=2.0 / npix)
+        self.map = Map.from_geom(geom)
+        self.map.data = np.random.default_rng(RANDOM_STATE).random(geom.data_shape)
+
+        rng = np.random.default_rng(RANDOM_STATE + 1)
+        lon, lat = geom.center_coord[:2]
+        energy = geom.axes["energy"].edges
+        self.coords = {
+            "lon": lon + rng.uniform(-1, 1, n_coords) * u.deg,
+            "lat": lat + rng.uniform(-1, 1, n_coords) * u.deg,
+            "energy": energy[0] * (energy[-1] / energy[0]) ** rng.random(n_coords),
+        }
+
+    def time_interp_by_coord(self, npix, n_coords):
+        self.map.interp_by_coord(self.coords)
+
+    def peakmem_interp_by_coord(self, npix, n_coords):
+        self.map.interp_by_coord(self.coords)
@@ -0,0 +1,27 @@
+# Licensed under a 3-clause BSD style license - see LICENSE.rst
+from gammapy.modeling import Fit
+from .common import make_map_dataset
+
+
+class FitRun:
+    """Joint spectral and spatial fit of an extended source."""
+
+    params = [50, 100]
+    param_names = ["npix"]
+    timeout = 300
+
+    def setup(self, npix):
+        self.dataset = make_map_dataset(npix=npix)
+        self.models = self.dataset.models.copy()
+        self.fit = Fit()
+
+    def _run(self):
+        # start every repeat from the same initial values
+        self.dataset.models = self.models.copy()
+        self.fit.run(datasets=[self.dataset])
+
+    def time_run(self, npix):
+        self._run()
+
+    def peakmem_run(self, npix):
+        self._run()
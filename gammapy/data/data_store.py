@@ -9,6 +9,7 @@ from astropy import units as u
 from astropy.coordinates import SkyCoord
 from astropy.io import fits
 from astropy import table
+import gammapy.utils.parallel as parallel
 import gammapy.utils.time as tu
 from gammapy.utils.pbar import progress_bar
 from gammapy.utils.scripts import make_path
@@ -28,6 +29,10 @@ REQUIRED_IRFS = {
 }
 
 
+# Observation table columns used to detect modified events files
+FILE_INFO_COLUMNS = {"EVENTS_FILENAME", "EVENTS_MTIME", "EVENTS_SIZE"}
+
+
 class MissingRequiredHDU(IOError):
     pass
 
@@ -188,7 +193,7 @@ class DataStore:
         return cls(hdu_table=hdu_table, obs_table=obs_table)
 
     @classmethod
-    def from_events_files(cls, events_paths, irfs_paths=None):
+    def from_events_files(cls, events_paths, irfs_paths=None, n_threads=None):
         """Create from a list of event filenames.
 
         HDU and observation index tables will be created from the EVENTS header.
@@ -209,6 +214,9 @@ class DataStore:
             as `events_paths`. If None the events files have to contain CALDB and
             IRF header keywords to locate the IRF files, otherwise the IRFs are
             assumed to be contained in the events files.
+        n_threads : int, optional
+            Number of threads used to read the events file headers.
+            Default is None, see `~gammapy.utils.parallel.run_threads`.
 
         Returns
         -------
@@ -246,7 +254,7 @@ class DataStore:
         >>> data_store.hdu_table.write("hdu-index.fits.gz") # doctest: +SKIP
         >>> data_store.obs_table.write("obs-index.fits.gz") # doctest: +SKIP
         """
-        return DataStoreMaker(events_paths, irfs_paths).run()
+        return DataStoreMaker(events_paths, irfs_paths, n_threads=n_threads).run()
 
     def info(self, show=True):
         """Print some info."""
@@ -263,7 +271,13 @@ class DataStore:
         else:
             return s
 
-    def obs(self, obs_id, required_irf="full-enclosure", require_events=True):
+    def obs(
+        self,
+        obs_id,
+        required_irf="full-enclosure",
+        require_events=True,
+        events_columns=None,
+    ):
         """Access a given `~gammapy.data.Observation`.
 
         Parameters
@@ -289,6 +303,11 @@ class DataStore:
             Default is `"full-enclosure"`.
         require_events : bool, optional
             Require events and gti table or not. Default is True.
+        events_columns : list of str, optional
+            Event list columns to read in addition to the required "RA", "DEC",
+            "TIME" and "ENERGY" columns. The other columns are not loaded, which
+            reduces the memory used by large event lists.
+            Default is None, which reads all columns.
 
         Returns
         -------
@@ -336,6 +355,7 @@ class DataStore:
         # TODO: right now, gammapy doesn't support using the pointing table of GADF
         # so we always pass the events location here to be read into a FixedPointingInfo
         if "events" in kwargs:
+            kwargs["events"].columns = events_columns
             pointing_location = copy(kwargs["events"])
             pointing_location.hdu_class = "pointing"
             kwargs["pointing"] = pointing_location
@@ -353,6 +373,7 @@ class DataStore:
         required_irf="full-enclosure",
         require_events=True,
         selection=None,
+        events_columns=None,
     ):
         """Generate a `~gammapy.data.Observations`.
 
@@ -397,6 +418,11 @@ class DataStore:
             and if it is in the list of obs_id.
             If None, default is all observations ordered by OBS_ID are returned.
             Default is None.
+        events_columns : list of str, optional
+            Event list columns to read in addition to the required "RA", "DEC",
+            "TIME" and "ENERGY" columns. The other columns are not loaded, which
+            reduces the memory used by large event lists.
+            Default is None, which reads all columns.
 
         Returns
         -------
@@ -428,7 +454,7 @@ class DataStore:
 
         for _ in progress_bar(obs_id_selection, desc="Obs Id"):
             try:
-                obs = self.obs(_, required_irf, require_events)
+                obs = self.obs(_, required_irf, require_events, events_columns)
             except MissingRequiredHDU as e:
                 log.warning(f"Skipping run with missing HDUs; {e}")
                 continue
@@ -446,6 +472,7 @@ class DataStore:
         required_irf="full-enclosure",
         require_events=True,
         selection=None,
+        events_columns=None,
     ):
         """Generate groups of `~gammapy.data.Observations` with a shared property.
 
@@ -489,6 +516,11 @@ class DataStore:
             and if it is in the list of obs_id.
             If None, default is all observations ordered by OBS_ID are returned.
             Default is None.
+        events_columns : list of str, optional
+            Event list columns to read in addition to the required "RA", "DEC",
+            "TIME" and "ENERGY" columns. The other columns are not loaded, which
+            reduces the memory used by large event lists.
+            Default is None, which reads all columns.
 
         Returns
         -------
@@ -528,6 +560,7 @@ class DataStore:
                 skip_missing=skip_missing,
                 required_irf=required_irf,
                 require_events=require_events,
+                events_columns=events_columns,
             )
         return result
 
@@ -586,6 +619,75 @@ class DataStore:
             filename = outdir / self.DEFAULT_OBS_TABLE
             subobstable.write(str(filename), format="fits", overwrite=overwrite)
 
+    def to_parquet(self, outdir, obs_id=None, row_group_size=None, overwrite=False):
+        """Write a data store with the event lists converted to Parquet.
+
+        The event lists are written to one file per observation, partitioned as
+        ``OBS_ID=<obs_id>/events.parquet`` in ``outdir``, together with new HDU
+        and observation index tables. The other HDUs are not copied, their index
+        entries point to the original files. The new data store can be opened
+        with `DataStore.from_dir`. Requires ``pyarrow``.
+
+        Parameters
+        ----------
+        outdir : str or `~pathlib.Path`
+            Directory for the new store.
+        obs_id : array-like, `~gammapy.data.ObservationTable`, optional
+            List of observations to convert. Default is None, which converts all observations.
+        row_group_size : int, optional
+            Number of events per Parquet row group. If None, defaults to
+            `~gammapy.data.io.PARQUET_ROW_GROUP_SIZE`. Default is None.
+        overwrite : bool, optional
+            Overwrite. Default is False.
+        """
+        from .io import write_table_parquet
+
+        outdir = make_path(outdir)
+
+        if not outdir.is_dir():
+            raise OSError(f"Not a directory: outdir={outdir}")
+
+        if obs_id is None:
+            obs_id = self.obs_ids
+        elif isinstance(obs_id, ObservationTable):
+            obs_id = obs_id["OBS_ID"].data
+
+        hdu_table = self.hdu_table[np.isin(self.hdu_table["OBS_ID"], obs_id)]
+
+        file_dir, file_name = [], []
+
+        for idx in progress_bar(range(len(hdu_table)), desc="HDU"):
+            loc = hdu_table.location_info(idx)
+
+            if loc.hdu_class == "events":
+                path = Path(f"OBS_ID={hdu_table['OBS_ID'][idx]}") / "events.parquet"
+                (outdir / path.parent).mkdir(exist_ok=True)
+                events_table = table.Table.read(loc.path(), hdu=loc.hdu_name)
+                write_table_parquet(
+                    events_table,
+                    outdir / path,
+                    row_group_size=row_group_size,
+                    overwrite=overwrite,
+                )
+            else:
+                path = loc.path().absolute()
+
+            file_dir.append(path.parent.as_posix())
+            file_name.append(path.name)
+
+        hdu_table["FILE_DIR"] = file_dir
+        hdu_table["FILE_NAME"] = file_name
+        hdu_table.meta.pop("BASE_DIR", None)
+        hdu_table.write(
+            outdir / self.DEFAULT_HDU_TABLE, format="fits", overwrite=overwrite
+        )
+
+        if self.obs_table:
+            obs_table = self.obs_table.select_obs_id(obs_id)
+            obs_table.write(
+                outdir / self.DEFAULT_OBS_TABLE, format="fits", overwrite=overwrite
+            )
+
     def check(self, checks="all"):
         """Check index tables and data files.
 
@@ -667,9 +769,23 @@ class DataStoreMaker:
 
     This is a multistep process coded as a class.
     Users will usually call this via `DataStore.from_events_files`.
+
+    Only the EVENTS header of each events file is read. The headers can be
+    read in parallel, and an existing data store can be updated by reading
+    only the new or modified events files, see `DataStoreMaker.run`.
+
+    Parameters
+    ----------
+    events_paths : list of str or `~pathlib.Path`
+        List of paths to the events files.
+    irfs_paths : str or `~pathlib.Path`, or list of str or list of `~pathlib.Path`, optional
+        Path to the IRFs file, see `DataStore.from_events_files`. Default is None.
+    n_threads : int, optional
+        Number of threads used to read the events file headers.
+        Default is None, see `~gammapy.utils.parallel.run_threads`.
     """
 
-    def __init__(self, events_paths, irfs_paths=None):
+    def __init__(self, events_paths, irfs_paths=None, n_threads=None):
         if isinstance(events_paths, (str, Path)):
             raise TypeError("Need list of paths, not a single string or Path object.")
 
@@ -679,15 +795,105 @@ class DataStoreMaker:
         else:
             self.irfs_paths = [make_path(path) for path in irfs_paths]
 
+        self.n_threads = n_threads
+
         # Cache for EVENTS file header information, to avoid multiple reads
         self._events_info = {}
 
-    def run(self):
-        """Run all steps."""
+    def run(self, data_store=None):
+        """Run all steps.
+
+        Parameters
+        ----------
+        data_store : `DataStore`, optional
+            Existing data store to update. Events files which are listed in its
+            observation table with the same size and modification time are not
+            read again. The observations of the new or modified events files
+            replace or are added to the existing index tables. Default is None.
+
+        Returns
+        -------
+        data_store : `DataStore`
+            Data store.
+        """
+        if data_store is not None:
+            return self._update(data_store)
+
+        self.read_all_events_info()
         hdu_table = self.make_hdu_table()
         obs_table = self.make_obs_table()
         return DataStore(hdu_table=hdu_table, obs_table=obs_table)
 
+    def _update(self, data_store):
+        """Update the index tables of an existing data store."""
+        obs_table, hdu_table = data_store.obs_table, data_store.hdu_table
+
+        unchanged = set()
+        if obs_table is not None and FILE_INFO_COLUMNS.issubset(obs_table.colnames):
+            for row in obs_table:
+                unchanged.add(
+                    (row["EVENTS_FILENAME"], row["EVENTS_MTIME"], row["EVENTS_SIZE"])
+                )
+
+        paths = []
+        for events_path, irf_path in zip(self.events_paths, self.irfs_paths):
+            stat = events_path.stat()
+            if (str(events_path), stat.st_mtime, stat.st_size) not in unchanged:
+                paths.append((events_path, irf_path))
+
+        log.info(f"Reading {len(paths)} new or modified events files")
+
+        if not paths:
+            return DataStore(hdu_table=hdu_table, obs_table=obs_table)
+
+        maker = self.__class__(*zip(*paths), n_threads=self.n_threads)
+        maker._events_info = self._events_info
+        new = maker.run()
+
+        if obs_table is None:
+            obs_table = new.obs_table
+        else:
+            if all(name in obs_table.meta for name in tu.TIME_KEYWORDS):
+                time_rows = [obs_table.meta, new.obs_table.meta]
+                if not tu.unique_time_info(
+                    [tu.extract_time_info(_) for _ in time_rows]
+                ):
+                    raise RuntimeError(
+                        "The time information in the EVENT header are not consistent between observations"
+                    )
+            obs_table = self._merge_tables(obs_table, new.obs_table)
+
+        new_hdu_table = new.hdu_table
+        if "BASE_DIR" in hdu_table.meta:
+            new_hdu_table["FILE_DIR"] = [
+                Path(_).absolute().as_posix() for _ in new_hdu_table["FILE_DIR"]
+            ]
+
+        hdu_table = self._merge_tables(hdu_table, new_hdu_table)
+        return DataStore(hdu_table=hdu_table, obs_table=obs_table)
+
+    @staticmethod
+    def _merge_tables(old, new):
+        """Replace the rows of the observations in ``new`` and append the others."""
+        keep = ~np.isin(old["OBS_ID"], new["OBS_ID"])
+        merged = table.vstack([old[keep], new], metadata_conflicts="silent")
+        merged.meta = old.meta
+        return old.__class__(merged)
+
+    def read_all_events_info(self):
+        """Read the header information of all events files not read yet."""
+        paths = [
+            (events_path, irf_path)
+            for events_path, irf_path in zip(self.events_paths, self.irfs_paths)
+            if events_path not in self._events_info
+        ]
+        infos = parallel.run_threads(
+            self.read_events_info, paths, n_threads=self.n_threads
+        )
+
+        for (events_path, _), info in zip(paths, infos):
+            self._events_info[events_path] = info
+
     def get_events_info(self, events_path, irf_path=None):
         """Read events header information."""
         if events_path not in self._events_info:
@@ -758,6 +964,11 @@ class DataStoreMaker:
         info["EVENTS_FILENAME"] = str(events_path)
         info["EVENT_COUNT"] = header["NAXIS2"]
 
+        # Used to find modified files when updating an existing index
+        stat = Path(events_path).stat()
+        info["EVENTS_MTIME"] = stat.st_mtime
+        info["EVENTS_SIZE"] = stat.st_size
+
         # This is the info needed to link from EVENTS to IRFs
         info["CALDB"] = header.get("CALDB", na_str)
         info["IRF"] = header.get("IRF", na_str)
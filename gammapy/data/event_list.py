@@ -138,6 +138,9 @@ class EventList:
             Name of events HDU. Default is "EVENTS".
         checksum : bool
             If True checks both DATASUM and CHECKSUM cards in the file headers. Default is False.
+        **kwargs : dict, optional
+            Keyword arguments passed to `~gammapy.data.io.EventListReader.read`, e.g.
+            ``columns`` to read only a subset of the event list columns.
         """
         from gammapy.data.io import EventListReader
 
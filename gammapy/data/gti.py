@@ -15,6 +15,9 @@ from .metadata import GTIMetaData
 
 __all__ = ["GTI"]
 
+# Maximum number of GTI and time interval pairs compared at once in `GTI.group_table`
+GROUP_TABLE_CHUNK_SIZE = 1_000_000
+
 
 class GTI:
     """Good time intervals (GTI) `~astropy.table.Table`.
@@ -277,6 +280,10 @@ class GTI:
         """GTI start time difference with reference time in seconds, MET as a `~astropy.units.Quantity`."""
         return (self.time_stop - self.time_ref).to("s")
 
+    def _to_met(self, time):
+        """Time difference with reference time in seconds, MET as a `~numpy.ndarray`."""
+        return np.atleast_1d((time - self.time_ref).to_value("s"))
+
     @property
     def time_intervals(self):
         """List of time intervals."""
@@ -327,34 +334,27 @@ class GTI:
             Copy of the GTI table with selection applied.
         """
         interval_start, interval_stop = time_interval
-        interval_start.format = self.time_start.format
-        interval_stop.format = self.time_stop.format
+        start, stop = self._to_met(self.time_start), self._to_met(self.time_stop)
+        met_start, met_stop = self._to_met(Time([interval_start, interval_stop]))
 
         # get GTIs that fall within the time_interval
-        mask = self.time_start <= interval_stop
-        mask &= self.time_stop > interval_start
+        mask = (start <= met_stop) & (stop > met_start)
 
         if inverted:
             gti_selected = self.table[~mask]
-            mask = (gti_selected["START"] >= interval_start) & (
-                gti_selected["STOP"] >= interval_stop
-            )
+            start, stop = start[~mask], stop[~mask]
+            mask = (start >= met_start) & (stop >= met_stop)
             gti_selected["START"][mask] = interval_stop
-            mask = (gti_selected["START"] <= interval_start) & (
-                gti_selected["STOP"] <= interval_stop
-            )
+            start[mask] = met_stop
+            mask = (start <= met_start) & (stop <= met_stop)
             gti_selected["STOP"][mask] = interval_start
             return self.__class__(gti_selected)
 
         gti_within = self.table[mask]
 
         # crop the GTIs
-        gti_within["START"] = np.clip(
-            gti_within["START"], interval_start, interval_stop
-        )
-
-        gti_within["STOP"] = np.clip(gti_within["STOP"], interval_start, interval_stop)
-
+        gti_within["START"][start[mask] < met_start] = interval_start
+        gti_within["STOP"][stop[mask] > met_stop] = interval_stop
         return self.__class__(gti_within)
 
     def delete_interval(self, time_interval):
@@ -434,28 +434,30 @@ class GTI:
             Whether to merge touching time bins e.g. ``(1, 2)`` and ``(2, 3)``
             will result in ``(1, 3)``. Default is True.
         """
-        # Algorithm to merge overlapping intervals is well-known,
-        # see e.g. https://stackoverflow.com/a/43600953/498873
-
-        table = self.table.copy()
-        table.sort("START")
+        table = self.table[np.argsort(self._to_met(self.time_start), kind="stable")]
+        start, stop = self._to_met(table["START"]), self._to_met(table["STOP"])
 
+        # an interval starts a new group if it does not overlap with the running
+        # maximum stop time of all previous intervals
+        stop_max = np.maximum.accumulate(stop)
         compare = lt if merge_equal else le
-
-        # We use Python dict instead of astropy.table.Row objects,
-        # because on some versions modifying Row entries doesn't behave as expected
-        merged = [{"START": table[0]["START"], "STOP": table[0]["STOP"]}]
-        for row in table[1:]:
-            interval = {"START": row["START"], "STOP": row["STOP"]}
-            if compare(merged[-1]["STOP"], interval["START"]):
-                merged.append(interval)
-            else:
-                if not overlap_ok:
-                    raise ValueError("Overlapping time bins")
-
-                merged[-1]["STOP"] = max(interval["STOP"], merged[-1]["STOP"])
-
-        merged = Table(rows=merged, names=["START", "STOP"], meta=self.table.meta)
+        is_first = np.append(True, compare(stop_max[:-1], start[1:]))
+
+        if not overlap_ok and not np.all(is_first):
+            raise ValueError("Overlapping time bins")
+
+        # index of the interval defining the running maximum stop time
+        idx = np.arange(len(stop))
+        idx_max = np.maximum.accumulate(np.where(stop == stop_max, idx, 0))
+        idx_last = np.append(np.nonzero(is_first)[0][1:], len(stop)) - 1
+
+        merged = Table(
+            {
+                "START": table["START"][is_first],
+                "STOP": table["STOP"][idx_max[idx_last]],
+            },
+            meta=self.table.meta,
+        )
         return self.__class__(merged, reference_time=self.time_ref)
 
     def group_table(self, time_intervals, atol="1e-6 s"):
@@ -475,36 +477,32 @@ class GTI:
         group_table : `~astropy.table.Table`
             Contains the grouping info.
         """
-        atol = u.Quantity(atol)
-
-        group_table = Table(
+        atol = u.Quantity(atol).to_value("s")
+
+        edges_min = self._to_met(Time([_[0] for _ in time_intervals])) - atol
+        edges_max = self._to_met(Time([_[1] for _ in time_intervals])) + atol
+        start, stop = self._to_met(self.time_start), self._to_met(self.time_stop)
+
+        group_idx = np.full(len(start), -1, dtype="i8")
+        chunk_size = max(1, GROUP_TABLE_CHUNK_SIZE // len(edges_min))
+
+        for idx in range(0, len(start), chunk_size):
+            chunk = slice(idx, idx + chunk_size)
+            mask = start[chunk, np.newaxis] >= edges_min
+            mask &= stop[chunk, np.newaxis] <= edges_max
+            group_idx[chunk] = np.where(mask.any(axis=1), mask.argmax(axis=1), -1)
+
+        bin_type = np.where(stop <= edges_max.max(), "underflow", "outflow")
+        bin_type = np.where(start >= edges_min.min(), "overflow", bin_type)
+        bin_type[group_idx >= 0] = ""
+
+        return Table(
+            [
+                group_idx,
+                self.time_start.utc.mjd,
+                self.time_stop.utc.mjd,
+                bin_type.astype("S10"),
+            ],
             names=("group_idx", "time_min", "time_max", "bin_type"),
             dtype=("i8", "f8", "f8", "S10"),
         )
-        time_intervals_lowedges = Time(
-            [time_interval[0] for time_interval in time_intervals]
-        )
-        time_intervals_upedges = Time(
-            [time_interval[1] for time_interval in time_intervals]
-        )
-
-        for t_start, t_stop in zip(self.time_start, self.time_stop):
-            mask1 = t_start >= time_intervals_lowedges - atol
-            mask2 = t_stop <= time_intervals_upedges + atol
-            mask = mask1 & mask2
-            if np.any(mask):
-                group_index = np.nonzero(mask)[0]
-                bin_type = ""
-            else:
-                group_index = -1
-                if np.any(mask1):
-                    bin_type = "overflow"
-                elif np.any(mask2):
-                    bin_type = "underflow"
-                else:
-                    bin_type = "outflow"
-            group_table.add_row(
-                [group_index, t_start.utc.mjd, t_stop.utc.mjd, bin_type]
-            )
-
-        return group_table
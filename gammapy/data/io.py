@@ -1,8 +1,10 @@
 # Licensed under a 3-clause BSD style license - see LICENSE.rst
+import json
 import warnings
 import logging
+import numpy as np
 from astropy.io import fits
-from astropy.table import Table
+from astropy.table import Column, MaskedColumn, Table
 import astropy.units as u
 from astropy.units import Quantity
 from gammapy.data import EventListMetaData, EventList, ObservationTable
@@ -12,6 +14,146 @@ from gammapy.utils.time import time_ref_from_dict
 
 log = logging.getLogger(__name__)
 
+REQUIRED_EVENTS_COLUMNS = {"RA", "DEC", "TIME", "ENERGY"}
+PARQUET_ROW_GROUP_SIZE = 100_000
+
+
+def write_table_parquet(table, filename, row_group_size=None, overwrite=False):
+    """Write a table to a Parquet file.
+
+    Column units and the table meta data are stored in the Parquet schema
+    meta data. Requires ``pyarrow``.
+
+    Parameters
+    ----------
+    table : `~astropy.table.Table`
+        Table with one-dimensional columns.
+    filename : `pathlib.Path`, str
+        Filename.
+    row_group_size : int, optional
+        Number of rows per row group. The statistics stored per row group allow
+        filtered reads to skip whole row groups.
+        If None, defaults to ``PARQUET_ROW_GROUP_SIZE``. Default is None.
+    overwrite : bool, optional
+        Overwrite existing file. Default is False.
+    """
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    filename = make_path(filename)
+
+    if filename.exists() and not overwrite:
+        raise OSError(f"File exists: {filename}")
+
+    if row_group_size is None:
+        row_group_size = PARQUET_ROW_GROUP_SIZE
+
+    arrays, units = {}, {}
+
+    for name in table.colnames:
+        column = table[name]
+
+        if column.ndim > 1:
+            raise ValueError(f"Column {name} is not one-dimensional.")
+
+        data = np.asarray(column)
+        data = data.astype(data.dtype.newbyteorder("="), copy=False)
+        mask = np.ma.getmaskarray(column) if isinstance(column, MaskedColumn) else None
+        arrays[name] = pa.array(data, mask=mask)
+
+        if column.unit is not None:
+            units[name] = column.unit.to_string("fits")
+
+    meta = {
+        "gammapy_meta": json.dumps(dict(table.meta), default=str),
+        "gammapy_units": json.dumps(units),
+    }
+    pa_table = pa.table(arrays, metadata=meta)
+    pq.write_table(pa_table, filename, row_group_size=row_group_size)
+
+
+def read_table_parquet(filename, columns=None, filters=None):
+    """Read a table written with `write_table_parquet`.
+
+    Requires ``pyarrow``.
+
+    Parameters
+    ----------
+    filename : `pathlib.Path`, str
+        Filename.
+    columns : list of str, optional
+        Columns to read. Default is None, which reads all columns.
+    filters : list of tuple or list of list of tuple, optional
+        Row filters passed to `pyarrow.parquet.read_table`, e.g.
+        ``[("ENERGY", ">", 1)]``. Row groups are skipped based on their statistics.
+        Default is None.
+
+    Returns
+    -------
+    table : `~astropy.table.Table`
+        Table.
+    """
+    import pyarrow.parquet as pq
+
+    filename = make_path(filename)
+    schema = pq.read_schema(filename)
+    metadata = schema.metadata or {}
+    units = json.loads(metadata.get(b"gammapy_units", b"{}"))
+    meta = json.loads(metadata.get(b"gammapy_meta", b"{}"))
+
+    if columns is not None:
+        missing_columns = set(columns).difference(schema.names)
+        if missing_columns:
+            raise ValueError(
+                f"Table does not contain requested columns {missing_columns}"
+            )
+        columns = [name for name in schema.names if name in columns]
+
+    pa_table = pq.read_table(filename, columns=columns, filters=filters)
+
+    table = Table(meta=meta)
+
+    for name in pa_table.column_names:
+        column = pa_table[name]
+        data = (
+            column.fill_null(0).to_numpy() if column.null_count else column.to_numpy()
+        )
+
+        if data.dtype == object:
+            data = data.astype(type(data[0]) if len(data) else str)
+
+        unit = units.get(name)
+
+        if column.null_count:
+            mask = column.is_null().to_numpy()
+            table[name] = MaskedColumn(data, mask=mask, unit=unit)
+        else:
+            table[name] = Column(data, unit=unit)
+
+    return table
+
+
+def read_header_parquet(filename):
+    """Read the meta data of a Parquet table as a FITS header.
+
+    Parameters
+    ----------
+    filename : `pathlib.Path`, str
+        Filename.
+
+    Returns
+    -------
+    header : `~astropy.io.fits.Header`
+        Header.
+    """
+    import pyarrow.parquet as pq
+
+    metadata = pq.read_schema(make_path(filename)).metadata or {}
+    meta = json.loads(metadata.get(b"gammapy_meta", b"{}"))
+    return fits.Header(
+        [(key, value) for key, value in meta.items() if not isinstance(value, list)]
+    )
+
 
 class EventListReader:
     """Reader class for EventList.
@@ -31,15 +173,72 @@ class EventListReader:
         self.checksum = checksum
 
     @staticmethod
-    def from_gadf_hdu(events_hdu):
-        """Create EventList from gadf HDU."""
+    def from_gadf_hdu(events_hdu, columns=None):
+        """Create EventList from gadf HDU.
+
+        Parameters
+        ----------
+        events_hdu : `~astropy.io.fits.BinTableHDU`
+            Events HDU.
+        columns : list of str, optional
+            Columns to read in addition to the required "RA", "DEC", "TIME" and
+            "ENERGY" columns. Only these columns are copied from the HDU data.
+            Default is None, which reads all columns.
+        """
+        if columns is not None:
+            missing_columns = set(columns).difference(events_hdu.columns.names)
+            if missing_columns:
+                raise ValueError(
+                    f"GADF event table does not contain requested columns {missing_columns}"
+                )
+
+            names = REQUIRED_EVENTS_COLUMNS.union(columns)
+            events_hdu = fits.BinTableHDU.from_columns(
+                [_ for _ in events_hdu.columns if _.name in names],
+                header=events_hdu.header,
+            )
+
         table = Table.read(events_hdu)
+        return EventListReader.from_gadf_table(table)
+
+    @staticmethod
+    def from_parquet(filename, columns=None, filters=None):
+        """Create EventList from a Parquet file with a gadf event table.
+
+        Requires ``pyarrow``. See `EventListWriter.write_parquet`.
+
+        Parameters
+        ----------
+        filename : `pathlib.Path`, str
+            Filename.
+        columns : list of str, optional
+            Columns to read in addition to the required "RA", "DEC", "TIME" and
+            "ENERGY" columns. Default is None, which reads all columns.
+        filters : list of tuple or list of list of tuple, optional
+            Row filters on the stored columns, e.g. ``[("ENERGY", ">=", 1)]``. The
+            "TIME" column is stored in seconds since the reference time. Row groups
+            are skipped based on their statistics. Default is None.
+        """
+        if columns is not None:
+            columns = REQUIRED_EVENTS_COLUMNS.union(columns)
+
+        table = read_table_parquet(filename, columns=columns, filters=filters)
+        return EventListReader.from_gadf_table(table)
+
+    @staticmethod
+    def from_gadf_table(table):
+        """Create EventList from a gadf event table, with the "TIME" column in seconds.
+
+        Parameters
+        ----------
+        table : `~astropy.table.Table`
+            Event table, with the header keywords in the table meta data.
+        """
         meta = EventListMetaData.from_header(table.meta)
 
         # This is not a strict check on input. It just checks that required information is there.
-        required_colnames = set(["RA", "DEC", "TIME", "ENERGY"])
-        if not required_colnames.issubset(set(table.colnames)):
-            missing_columns = required_colnames.difference(set(table.colnames))
+        if not REQUIRED_EVENTS_COLUMNS.issubset(set(table.colnames)):
+            missing_columns = REQUIRED_EVENTS_COLUMNS.difference(set(table.colnames))
             raise ValueError(
                 f"GADF event table does not contain required columns {missing_columns}"
             )
@@ -69,20 +268,34 @@ class EventListReader:
         hduclass = events_hdu.header.get("HDUCLASS", "unknown")
         return hduclass.lower()
 
-    def read(self, filename, format="gadf"):
+    def read(self, filename, format="gadf", columns=None, filters=None):
         """Read EventList from file.
 
         Parameters
         ----------
         filename : `pathlib.Path`, str
             Filename
-        format : {"gadf"}, optional
+        format : {"gadf", "parquet"}, optional
             format of the EventList. Default is 'gadf'.
             If None, will try to guess from header.
+            Files with a ".parquet" suffix are always read as Parquet.
+        columns : list of str, optional
+            Columns to read in addition to the required "RA", "DEC", "TIME" and
+            "ENERGY" columns. The file is memory-mapped, so that the other columns
+            are not loaded. Default is None, which reads all columns.
+        filters : list of tuple or list of list of tuple, optional
+            Row filters, only supported for Parquet files.
+            See `EventListReader.from_parquet`. Default is None.
         """
         filename = make_path(filename)
 
-        with fits.open(filename) as hdulist:
+        if format == "parquet" or filename.suffix == ".parquet":
+            return self.from_parquet(filename, columns=columns, filters=filters)
+
+        if filters is not None:
+            raise ValueError("Row filters are only supported for Parquet event lists.")
+
+        with fits.open(filename, memmap=True) as hdulist:
             events_hdu = hdulist[self.hdu]
 
             if self.checksum:
@@ -96,7 +309,7 @@ class EventListReader:
                 format = self.identify_format_from_hduclass(events_hdu)
 
             if format == "gadf" or format == "ogip":
-                return self.from_gadf_hdu(events_hdu)
+                return self.from_gadf_hdu(events_hdu, columns=columns)
             else:
                 raise ValueError(f"Unknown format :{format}")
 
@@ -146,6 +359,29 @@ class EventListWriter:
 
         return self._to_gadf_table_hdu(event_list)
 
+    def write_parquet(self, event_list, filename, row_group_size=None, overwrite=False):
+        """Write event list to a Parquet file.
+
+        The gadf event table is stored, with the header keywords in the Parquet
+        schema meta data. Requires ``pyarrow``.
+
+        Parameters
+        ----------
+        event_list : `~gammapy.data.EventList`
+            Event list.
+        filename : `pathlib.Path`, str
+            Filename.
+        row_group_size : int, optional
+            Number of events per row group. If None, defaults to
+            ``PARQUET_ROW_GROUP_SIZE``. Default is None.
+        overwrite : bool, optional
+            Overwrite existing file. Default is False.
+        """
+        table = Table.read(self.to_hdu(event_list))
+        write_table_parquet(
+            table, filename, row_group_size=row_group_size, overwrite=overwrite
+        )
+
 
 class ObservationTableReader:
     """Reader class for ObservationTable."""
@@ -1,17 +1,21 @@
 # Licensed under a 3-clause BSD style license - see LICENSE.rst
 from collections import namedtuple
 import numpy as np
+from scipy.spatial import cKDTree
 from astropy.coordinates import Angle, SkyCoord
 from astropy.table import Table
 from astropy.units import Quantity, Unit
 from astropy.utils.introspection import minversion
-from gammapy.utils.regions import SphericalCircleSkyRegion
 from gammapy.utils.scripts import make_path
 from gammapy.utils.testing import Checker
 from gammapy.utils.time import time_ref_from_dict
 
 __all__ = ["ObservationTable"]
 
+# Margin added to the cone radius for the index query, the exact separation
+# is computed for the candidates afterwards
+POINTING_INDEX_MARGIN = Angle(1, "arcsec")
+
 
 class ObservationTable(Table):
     """Observation table.
@@ -207,12 +211,87 @@ class ObservationTable(Table):
         obs_table : `~gammapy.data.ObservationTable`
             Observation table after selection.
         """
-        region = SphericalCircleSkyRegion(center=center, radius=radius)
-        mask = region.contains(self.pointing_radec)
+        mask = np.zeros(len(self), dtype=bool)
+        mask[self.get_sky_circle_indices(center, radius)] = True
         if inverted:
             mask = np.invert(mask)
         return self[mask]
 
+    @property
+    def _pointing_index(self):
+        """KD-tree of the pointing unit vectors and the corresponding row indices.
+
+        The tree is built on first use and rebuilt whenever the pointing
+        data change, e.g. after sorting or modifying the table in place.
+        """
+        key = tuple(
+            (str(self[name].unit), hash(np.ascontiguousarray(self[name]).tobytes()))
+            for name in ["RA_PNT", "DEC_PNT"]
+        )
+        cached = getattr(self, "_pointing_index_cache", None)
+
+        if cached is None or cached[0] != key:
+            xyz = self.pointing_radec.cartesian.xyz.to_value("").T
+            (idx,) = np.nonzero(np.all(np.isfinite(xyz), axis=1))
+            cached = (key, cKDTree(xyz[idx]), idx)
+            self._pointing_index_cache = cached
+
+        return cached[1], cached[2]
+
+    def get_sky_circle_indices(self, center, radius):
+        """Get the row indices of the observations pointing within a cone.
+
+        Candidate rows are looked up in a KD-tree of the pointing directions,
+        which is built on first use. The selection is then done with the exact
+        separation, so the result is the same as comparing the separation of
+        all pointing positions. Many cones can be queried at once.
+
+        Parameters
+        ----------
+        center : `~astropy.coordinates.SkyCoord`
+            Cone center coordinates, either a scalar or an array.
+        radius : `~astropy.coordinates.Angle`
+            Cone opening angle, either a scalar or an array of the same
+            shape as ``center``.
+
+        Returns
+        -------
+        indices : `~numpy.ndarray` or list of `~numpy.ndarray`
+            Sorted row indices of the observations within the cone. A list
+            with one array per cone is returned if ``center`` is an array.
+        """
+        radius = Angle(radius)
+        centers = center.reshape(-1)
+        radii = Angle(np.broadcast_to(radius.value, center.shape), radius.unit)
+        radii = radii.reshape(-1)
+
+        tree, idx = self._pointing_index
+        xyz = centers.icrs.cartesian.xyz.to_value("").T
+        query_radius = np.clip(radii + POINTING_INDEX_MARGIN, 0, Angle(180, "deg"))
+        chords = 2 * np.sin(query_radius.to_value("rad") / 2)
+
+        candidates = [np.sort(idx[_]) for _ in tree.query_ball_point(xyz, r=chords)]
+        sizes = [len(_) for _ in candidates]
+        candidates = np.concatenate(candidates).astype(int)
+        cone_idx = np.repeat(np.arange(len(centers)), sizes)
+
+        pointing = SkyCoord(
+            self["RA_PNT"][candidates],
+            self["DEC_PNT"][candidates],
+            unit="deg",
+            frame="icrs",
+        )
+        separation = centers[cone_idx].separation(pointing)
+        selected = separation < radii[cone_idx]
+
+        counts = np.bincount(cone_idx[selected], minlength=len(centers))
+        indices = np.split(candidates[selected], np.cumsum(counts)[:-1])
+
+        if center.isscalar:
+            return indices[0]
+
+        return indices
+
     def select_observations(self, selections=None):
         """Select subset of observations from a list of selection criteria.
 
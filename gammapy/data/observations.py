@@ -6,6 +6,7 @@ import inspect
 import itertools
 import logging
 import warnings
+from concurrent.futures import ThreadPoolExecutor
 from itertools import zip_longest
 import numpy as np
 import astropy.units as u
@@ -33,6 +34,19 @@ __all__ = ["Observation", "Observations"]
 
 log = logging.getLogger(__name__)
 
+PREFETCH_N_OBSERVATIONS = 2
+PREFETCH_HDUS = [
+    "_meta",
+    "_gti",
+    "_pointing",
+    "_events",
+    "aeff",
+    "edisp",
+    "psf",
+    "_bkg",
+    "_rad_max",
+]
+
 
 class Observation:
     """In-memory observation.
@@ -853,6 +867,111 @@ class Observations(collections.abc.MutableSequence):
             obs_copy = obs.copy(in_memory=True)
             yield obs_copy
 
+    def iter_prefetch(
+        self, n_prefetch=PREFETCH_N_OBSERVATIONS, n_threads=1, max_memory=None
+    ):
+        """Iterate over the observations while loading the next ones in the background.
+
+        Events, GTI, pointing, metadata and IRFs of up to ``n_prefetch``
+        observations ahead of the current one are read in a thread pool, so
+        that I/O overlaps with the processing of the current observation.
+        Data which is not cached by `Observation` is released again once the
+        iteration moves on to the next observation.
+
+        Parameters
+        ----------
+        n_prefetch : int, optional
+            Number of observations loaded ahead of the current one.
+            Default is 2.
+        n_threads : int, optional
+            Number of threads used for loading. Default is 1.
+        max_memory : `~astropy.units.Quantity` or str, optional
+            Approximate upper limit on the memory held by prefetched
+            observations, e.g. "2 GB". At least one observation is always
+            loaded. Default is None, which means no limit.
+
+        Yields
+        ------
+        observation : `~gammapy.data.Observation`
+            Observation with its data loaded.
+        """
+        if max_memory is not None:
+            max_memory = u.Quantity(max_memory).to_value("byte")
+
+        observations = iter(self)
+        pending = collections.deque()
+
+        def memory_limit_reached():
+            # only submit more once the sizes of all pending loads are known
+            if not pending[-1][1].done():
+                return True
+            nbytes = 0
+            for _, future in pending:
+                if future.exception() is None:
+                    nbytes += future.result()[1]
+            return nbytes >= max_memory
+
+        with ThreadPoolExecutor(
+            max_workers=n_threads, thread_name_prefix="gammapy-prefetch"
+        ) as pool:
+            try:
+                while True:
+                    while len(pending) <= n_prefetch:
+                        if max_memory is not None and pending:
+                            if memory_limit_reached():
+                                break
+                        obs = next(observations, None)
+                        if obs is None:
+                            break
+                        pending.append((obs, pool.submit(_prefetch_observation, obs)))
+
+                    if not pending:
+                        return
+
+                    obs, future = pending.popleft()
+                    names, _ = future.result()
+                    try:
+                        yield obs
+                    finally:
+                        _release_observation(obs, names)
+            finally:
+                for obs, future in pending:
+                    if future.cancel() or future.exception() is not None:
+                        continue
+                    _release_observation(obs, future.result()[0])
+
+
+def _data_nbytes(data):
+    """Approximate memory size of loaded observation data in bytes."""
+    if isinstance(data, EventList):
+        return sum(getattr(col, "nbytes", 0) for col in data.table.itercols())
+    return getattr(getattr(data, "data", None), "nbytes", 0)
+
+
+def _prefetch_observation(obs):
+    """Load the lazy HDUs of an observation into its instance dictionary.
+
+    Returns the names of the loaded attributes and their approximate
+    memory size in bytes.
+    """
+    names, nbytes = [], 0
+    for name in PREFETCH_HDUS:
+        if name in obs.__dict__ or f"_{name}_hdu" not in obs.__dict__:
+            continue
+        value = getattr(obs, name)
+        obs.__dict__[name] = value
+        names.append(name)
+        nbytes += _data_nbytes(value)
+    return names, nbytes
+
+
+def _release_observation(obs, names):
+    """Drop prefetched data which the observation would not cache itself."""
+    for name in names:
+        descriptor = getattr(type(obs), name)
+        if not (descriptor.cache and obs.__dict__[f"_{name}_hdu"].cache):
+            obs.__dict__.pop(name, None)
+
 
 class ObservationChecker(Checker):
     """Check an observation.
@@ -16,7 +16,11 @@ from gammapy.irf import (
     EnergyDispersion2D,
 )
 from gammapy.utils.scripts import make_path
-from gammapy.utils.testing import requires_data, assert_quantity_allclose
+from gammapy.utils.testing import (
+    assert_quantity_allclose,
+    requires_data,
+    requires_dependency,
+)
 
 
 @pytest.fixture()
@@ -135,6 +139,24 @@ def test_data_store_copy_obs_subset(tmp_path, data_store):
     assert len(substore.hdu_table) == 2
 
 
+@requires_dependency("pyarrow")
+@requires_data()
+def test_data_store_to_parquet(tmp_path, data_store):
+    data_store.to_parquet(tmp_path, obs_id=[23523, 23592])
+
+    store = DataStore.from_dir(tmp_path)
+    assert len(store.obs_table) == 2
+    assert (tmp_path / "OBS_ID=23523" / "events.parquet").exists()
+
+    desired = data_store.obs(23523)
+    actual = store.obs(23523)
+
+    assert str(actual.events.table) == str(desired.events.table)
+    assert_allclose(actual.pointing.fixed_icrs.ra, desired.pointing.fixed_icrs.ra)
+    assert_allclose(actual.gti.time_sum, desired.gti.time_sum)
+    assert actual.aeff.__class__.__name__ == "EffectiveAreaTable2D"
+
+
 @pytest.mark.xfail
 @requires_data()
 class TestDataStoreChecker:
@@ -198,6 +220,81 @@ def test_read_events_cta_1dc(data_store_dc1):
     assert info["IRF"] == "South_z20_50h"
 
 
+def make_events_file(path, obs_id, tstart=0):
+    header = fits.Header()
+    header["EXTNAME"] = "EVENTS"
+    header["OBS_ID"] = obs_id
+    header["TSTART"] = tstart
+    header["TSTOP"] = tstart + 1800
+    header["ONTIME"] = 1800
+    header["LIVETIME"] = 1700
+    header["DEADC"] = 0.94
+    header["RA_PNT"] = 83.6
+    header["DEC_PNT"] = 22.0
+    header["MJDREFI"] = 51910
+    header["MJDREFF"] = 0.00074287037
+    header["TIMEUNIT"] = "s"
+    header["TIMESYS"] = "TT"
+    header["TIMEREF"] = "LOCAL"
+    columns = [
+        fits.Column(name="TIME", format="D", array=np.arange(3.0), unit="s"),
+        fits.Column(name="RA", format="D", array=np.full(3, 83.6), unit="deg"),
+        fits.Column(name="DEC", format="D", array=np.full(3, 22.0), unit="deg"),
+        fits.Column(name="ENERGY", format="D", array=np.ones(3), unit="TeV"),
+    ]
+    hdu = fits.BinTableHDU.from_columns(columns, header=header)
+    fits.HDUList([fits.PrimaryHDU(), hdu]).writeto(path, overwrite=True)
+    return path
+
+
+def test_data_store_maker_update(tmp_path):
+    paths = [make_events_file(tmp_path / f"events_{idx}.fits", idx) for idx in (1, 2)]
+
+    data_store = DataStoreMaker(paths, n_threads=2).run()
+    assert_allclose(data_store.obs_table["OBS_ID"], [1, 2])
+    assert len(data_store.hdu_table) == 12
+
+    data_store.obs_table.write(tmp_path / "obs-index.fits.gz")
+    data_store.hdu_table.write(tmp_path / "hdu-index.fits.gz")
+    data_store = DataStore.from_dir(tmp_path)
+
+    os.utime(paths[1], (0, 0))
+    paths.append(make_events_file(tmp_path / "events_3.fits", 3, tstart=1800))
+
+    maker = DataStoreMaker(paths)
+    updated = maker.run(data_store=data_store)
+
+    assert set(maker._events_info) == set(paths[1:])
+    assert_allclose(updated.obs_table["OBS_ID"], [1, 2, 3])
+    assert_allclose(updated.obs_table["TSTART"], [0, 0, 1800])
+    assert len(updated.hdu_table) == 18
+    assert updated.hdu_table.meta["BASE_DIR"] == data_store.hdu_table.meta["BASE_DIR"]
+
+    observation = updated.obs(3)
+    assert len(observation.events.table) == 3
+
+
+def test_data_store_maker_update_no_obs_table(tmp_path):
+    paths = [make_events_file(tmp_path / f"events_{idx}.fits", idx) for idx in (1, 2)]
+
+    data_store = DataStoreMaker(paths).run()
+    data_store.hdu_table.write(tmp_path / "hdu-index.fits.gz")
+    data_store = DataStore.from_dir(tmp_path)
+    assert data_store.obs_table is None
+
+    path = make_events_file(tmp_path / "events_3.fits", 3, tstart=1800)
+    updated = DataStoreMaker([path]).run(data_store=data_store)
+
+    assert_allclose(updated.obs_table["OBS_ID"], [3])
+    assert_allclose(updated.obs_ids, [1, 2, 3])
+    assert len(updated.hdu_table) == 18
+
+    observation = updated.obs(1)
+    assert len(observation.events.table) == 3
+    observation = updated.obs(3)
+    assert len(observation.events.table) == 3
+
+
 @requires_data()
 def test_read_events_info_hess():
     path = make_path(
@@ -233,6 +233,36 @@ def test_gti_union():
     assert_allclose(gti.met_stop.value, [4, 8])
 
 
+def test_gti_union_touching():
+    gti = make_gti({"START": [3, 0, 1, 6] * u.s, "STOP": [4, 1, 3, 7] * u.s})
+
+    merged = gti.union()
+    assert_allclose(merged.met_start.value, [0, 6])
+    assert_allclose(merged.met_stop.value, [4, 7])
+
+    merged = gti.union(overlap_ok=False, merge_equal=False)
+    assert_allclose(merged.met_start.value, [0, 1, 3, 6])
+    assert_allclose(merged.met_stop.value, [1, 3, 4, 7])
+
+    with pytest.raises(ValueError):
+        gti.union(overlap_ok=False)
+
+
+def test_gti_group_table():
+    gti = make_gti({"START": [0, 12, 25, 45] * u.s, "STOP": [5, 18, 35, 50] * u.s})
+    time_ref = gti.time_ref
+    time_intervals = [
+        (time_ref + 10 * u.s, time_ref + 20 * u.s),
+        (time_ref + 20 * u.s, time_ref + 40 * u.s),
+    ]
+
+    group_table = gti.group_table(time_intervals)
+
+    assert list(group_table["group_idx"]) == [-1, 0, 1, -1]
+    assert list(group_table["bin_type"]) == ["underflow", "", "", "overflow"]
+    assert_allclose(group_table["time_min"], gti.time_start.utc.mjd)
+
+
 def test_gti_create():
     start = u.Quantity([1, 2], "min")
     stop = u.Quantity([1.5, 2.5], "min")
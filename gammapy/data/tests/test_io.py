@@ -4,10 +4,16 @@ from astropy.table import Table
 from astropy.time import Time
 from astropy import units as u
 import pytest
+from numpy.testing import assert_allclose
 
 from gammapy.utils.scripts import make_path
-from gammapy.utils.testing import requires_data
-from ..io import EventListReader, EventListWriter, ObservationTableReader
+from gammapy.utils.testing import requires_data, requires_dependency
+from ..io import (
+    EventListReader,
+    EventListWriter,
+    ObservationTableReader,
+    read_header_parquet,
+)
 
 
 @requires_data()
@@ -43,6 +49,63 @@ def test_eventlist_writer_unkwnown_format():
         EventListWriter().to_hdu("tmp.fits", format="unknown")
 
 
+def test_eventlist_reader_columns(tmp_path):
+    table = Table()
+    table["RA"] = [0.0, 1.0] * u.deg
+    table["DEC"] = [0.0, 1.0] * u.deg
+    table["ENERGY"] = [1.0, 10.0] * u.TeV
+    table["TIME"] = [0.0, 10.0] * u.s
+    table["EVENT_ID"] = [1, 2]
+    table["MC_ID"] = [3, 4]
+
+    hdu = fits.BinTableHDU(table, name="EVENTS")
+    hdu.header.update({"MJDREFI": 51910, "MJDREFF": 0.0, "TIMESYS": "TT"})
+    hdu.writeto(tmp_path / "events.fits")
+
+    events = EventListReader().read(tmp_path / "events.fits", columns=["EVENT_ID"])
+    assert set(events.table.colnames) == {"TIME", "ENERGY", "RA", "DEC", "EVENT_ID"}
+    assert events.table["ENERGY"].unit == "TeV"
+    assert list(events.table["EVENT_ID"]) == [1, 2]
+    assert_allclose(events.time[1].mjd, 51910 + 10.0 / 86400)
+
+    with pytest.raises(ValueError):
+        EventListReader().read(tmp_path / "events.fits", columns=["MISSING"])
+
+
+@requires_dependency("pyarrow")
+def test_eventlist_parquet(tmp_path):
+    table = Table()
+    table["RA"] = [0.0, 1.0, 2.0] * u.deg
+    table["DEC"] = [0.0, 1.0, 2.0] * u.deg
+    table["ENERGY"] = [1.0, 10.0, 3.0] * u.TeV
+    table["TIME"] = [0.0, 10.0, 20.0] * u.s
+    table["EVENT_ID"] = [1, 2, 3]
+
+    hdu = fits.BinTableHDU(table, name="EVENTS")
+    hdu.header.update({"MJDREFI": 51910, "MJDREFF": 0.0, "TIMESYS": "TT", "OBS_ID": 1})
+    hdu.writeto(tmp_path / "events.fits")
+
+    events = EventListReader().read(tmp_path / "events.fits")
+    EventListWriter().write_parquet(
+        events, tmp_path / "events.parquet", row_group_size=2
+    )
+
+    events_parquet = EventListReader().read(tmp_path / "events.parquet")
+    assert events_parquet.table.colnames == events.table.colnames
+    assert events_parquet.table["ENERGY"].unit == "TeV"
+    assert_allclose(events_parquet.time.mjd, events.time.mjd)
+    assert read_header_parquet(tmp_path / "events.parquet")["OBS_ID"] == 1
+
+    events_parquet = EventListReader().read(
+        tmp_path / "events.parquet", columns=[], filters=[("ENERGY", ">", 2)]
+    )
+    assert set(events_parquet.table.colnames) == {"TIME", "ENERGY", "RA", "DEC"}
+    assert_allclose(events_parquet.energy.to_value("TeV"), [10.0, 3.0])
+
+    with pytest.raises(ValueError):
+        EventListReader().read(tmp_path / "events.fits", filters=[("ENERGY", ">", 2)])
+
+
 @requires_data()
 def test_eventlist_reader_empty_gadf_table():
     swgo_events = "$GAMMAPY_DATA/tests/format/swgo/map_irfs/DummyEvents.fits.gz"
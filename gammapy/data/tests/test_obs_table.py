@@ -1,6 +1,7 @@
 # Licensed under a 3-clause BSD style license - see LICENSE.rst
 import pytest
 import numpy as np
+from numpy.testing import assert_equal
 from astropy.coordinates import AltAz, Angle, SkyCoord
 from astropy.time import Time, TimeDelta
 from astropy.units import Quantity
@@ -313,6 +314,44 @@ def test_select_sky_regions():
     assert len(obs_table) == 30
 
 
+def test_get_sky_circle_indices():
+    random_state = np.random.RandomState(seed=0)
+    obs_table = make_test_observation_table(n_obs=100, random_state=random_state)
+
+    centers = SkyCoord([0, 120, 240], [0, 30, -60], unit="deg", frame="galactic")
+    radius = Angle([50, 30, 90], "deg")
+    indices = obs_table.get_sky_circle_indices(centers, radius)
+
+    assert len(indices) == 3
+    for center, r, idx in zip(centers, radius, indices):
+        separation = center.separation(obs_table.pointing_radec)
+        assert_equal(idx, np.nonzero(separation < r)[0])
+
+    idx = obs_table.get_sky_circle_indices(centers[0], radius[0])
+    assert_equal(idx, indices[0])
+    assert len(idx) == 30
+
+
+def test_get_sky_circle_indices_modified_table():
+    random_state = np.random.RandomState(seed=0)
+    obs_table = make_test_observation_table(n_obs=50, random_state=random_state)
+    center = SkyCoord(0, 0, unit="deg", frame="galactic")
+    radius = Angle(50, "deg")
+
+    def separation_indices():
+        separation = center.separation(obs_table.pointing_radec)
+        return np.nonzero(separation < radius)[0]
+
+    obs_table.get_sky_circle_indices(center, radius)
+    obs_table.sort("RA_PNT")
+    assert_equal(obs_table.get_sky_circle_indices(center, radius), separation_indices())
+    assert len(obs_table.select_sky_circle(center, radius)) == 10
+
+    obs_table["RA_PNT"][:] = 266.4
+    obs_table["DEC_PNT"][:] = -28.9
+    assert_equal(obs_table.get_sky_circle_indices(center, radius), np.arange(50))
+
+
 @requires_data()
 def test_observation_table_checker():
     path = "$GAMMAPY_DATA/cta-1dc/index/gps/obs-index.fits.gz"
@@ -684,3 +684,25 @@ def test_observations_getitem(data_store):
     obs_2 = obs_1[np.array([])]
     assert len(obs_2) == 0
     assert isinstance(obs_2, Observations)
+
+
+@requires_data()
+def test_observations_iter_prefetch(data_store):
+    observations = data_store.get_observations([20136, 20137, 20151])
+
+    for idx, obs in enumerate(observations.iter_prefetch(n_prefetch=1)):
+        assert obs is observations[idx]
+        assert "_events" in obs.__dict__
+        assert isinstance(obs.events, EventList)
+        assert isinstance(obs.psf, PSF3D)
+
+    for obs in observations:
+        assert "_events" not in obs.__dict__
+        assert "psf" not in obs.__dict__
+        assert "_gti" in obs.__dict__
+
+    prefetch = observations.iter_prefetch(n_prefetch=2, max_memory="1 byte")
+    obs = next(prefetch)
+    assert "_events" not in observations[1].__dict__
+    prefetch.close()
+    assert "_events" not in obs.__dict__
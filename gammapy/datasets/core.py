@@ -4,11 +4,15 @@ import collections.abc
 import copy
 import html
 import logging
+from operator import methodcaller
 import numpy as np
 from astropy import units as u
 from astropy.table import Table, vstack
 from gammapy.data import GTI
 from gammapy.modeling.models import DatasetModels, Models
+from gammapy.modeling.utils import _central_difference
+import gammapy.utils.parallel as parallel
+from gammapy.utils.timing import timed
 from gammapy.utils.scripts import make_name, make_path, read_yaml, to_yaml, write_yaml
 from gammapy.stats import FIT_STATISTICS_REGISTRY
 
@@ -91,6 +95,40 @@ class Dataset(abc.ABC):
         """Statistic array, one value per data point."""
         return self._fit_statistic.stat_array_dataset(self)
 
+    def stat_sum_gradient(self, parameters, epsilon=1e-3):
+        """Derivatives of the total statistic with respect to the given parameters.
+
+        The derivatives are computed numerically using central differences
+        of `stat_sum`. Parameters not used by the dataset models have a
+        zero derivative.
+
+        Parameters
+        ----------
+        parameters : list of `~gammapy.modeling.Parameter`
+            Parameters to compute the derivatives for.
+        epsilon : float, optional
+            Relative step size used for the numerical derivatives. Default is 1e-3.
+
+        Returns
+        -------
+        gradient : `~numpy.ndarray`
+            Derivatives of the total statistic, one per parameter.
+        """
+        gradient = np.zeros(len(parameters))
+
+        if self.models is None:
+            return gradient
+
+        model_parameters = self.models.parameters
+
+        for idx, parameter in enumerate(parameters):
+            if parameter in model_parameters:
+                gradient[idx] = _central_difference(
+                    self.stat_sum, parameter=parameter, epsilon=epsilon
+                )
+
+        return gradient
+
     def copy(self, name=None):
         """Deep copy.
 
@@ -260,19 +298,57 @@ class Datasets(collections.abc.MutableSequence):
         return np.array(contributions)
 
     def stat_sum(self):
-        """Compute joint statistic function value."""
+        """Compute joint statistic function value.
+
+        The datasets are evaluated in a thread pool if the number of threads
+        is set with `~gammapy.utils.parallel.multiprocessing_manager`.
+        """
+        with timed("Datasets.stat_sum"):
+            stats = parallel.run_threads(methodcaller("stat_sum"), zip(self))
+            return sum(stats, 0.0) + self._stat_sum_prior()
+
+    def _stat_sum_prior(self):
+        """Total statistic of the priors and penalties."""
         prior_stat_sum = 0.0
         if self.models is not None:
             prior_stat_sum = self.models.parameters.prior_stat_sum()
             if self.models._penalties is not None:
                 for penalty in self.models._penalties:
                     prior_stat_sum += penalty.stat_sum()
+        return prior_stat_sum
+
+    def stat_sum_gradient(self, epsilon=1e-3):
+        """Compute derivatives of the joint statistic with respect to the free parameters.
+
+        Each dataset contributes through `Dataset.stat_sum_gradient`. The derivatives
+        of the priors and penalties are computed numerically.
+
+        Parameters
+        ----------
+        epsilon : float, optional
+            Relative step size used for the numerical derivatives. Default is 1e-3.
 
-        stat_sum = 0.0
+        Returns
+        -------
+        gradient : `~numpy.ndarray`
+            Derivatives with respect to the values of ``datasets.parameters.free_parameters``.
+        """
+        parameters = self.parameters.free_parameters
+
+        gradient = np.zeros(len(parameters))
         for dataset in self:
-            stat_sum += dataset.stat_sum()
+            gradient += dataset.stat_sum_gradient(parameters, epsilon=epsilon)
+
+        models = self.models
+        has_priors = any(par.prior is not None for par in parameters)
+
+        if has_priors or models._penalties is not None:
+            for idx, parameter in enumerate(parameters):
+                gradient[idx] += _central_difference(
+                    self._stat_sum_prior, parameter=parameter, epsilon=epsilon
+                )
 
-        return stat_sum + prior_stat_sum
+        return gradient
 
     def _stat_sum_likelihood(self):
         """Total statistic given the current model parameters without the priors."""
@@ -8,8 +8,14 @@ from astropy.utils import lazyproperty
 from regions import CircleSkyRegion
 import matplotlib.pyplot as plt
 from gammapy.irf import EDispKernel, PSFKernel
-from gammapy.maps import HpxNDMap, Map, RegionNDMap, WcsNDMap
-from gammapy.modeling.models import PointSpatialModel, TemplateNPredModel
+from gammapy.maps import HpxNDMap, Map, MapAxis, RegionNDMap, WcsNDMap
+from gammapy.modeling.models import (
+    PointSpatialModel,
+    TemplateNPredModel,
+    integrate_spectrum,
+)
+from gammapy.modeling.utils import _central_difference
+from gammapy.utils.timing import record_cache, timed
 from .utils import apply_edisp
 
 PSF_MAX_RADIUS = None
@@ -48,6 +54,11 @@ class MapEvaluator:
         This mode is recommended for global optimization algorithms.
     use_cache : bool
         Use npred caching.
+    dtype : str or `~numpy.dtype`, optional
+        Data type of the predicted counts, of the cached intermediate
+        results and of the energy dispersion matrix. Using "float32" halves
+        the memory traffic of the model evaluation at the cost of precision.
+        Default is "float64".
     """
 
     def __init__(
@@ -60,6 +71,7 @@ class MapEvaluator:
         mask=None,
         evaluation_mode="local",
         use_cache=True,
+        dtype="float64",
     ):
         self.model = model
         self.exposure = exposure
@@ -68,6 +80,7 @@ class MapEvaluator:
         self.mask = mask
         self.gti = gti
         self.use_cache = use_cache
+        self.dtype = np.dtype(dtype)
         self.contributes = True
         self.psf_containment = None
 
@@ -90,6 +103,7 @@ class MapEvaluator:
         self._cached_parameter_values = None
         self._cached_parameter_values_previous = None
         self._cached_parameter_values_spatial = None
+        self._cached_parameter_values_morphology = None
         self._cached_position = (0, 0)
         self._computation_cache = None
 
@@ -103,6 +117,7 @@ class MapEvaluator:
         """Reset cached properties."""
         del self._compute_npred
         del self._compute_flux_spatial
+        del self._compute_flux_morphology_exposure
         self._computation_cache = None
         self._cached_parameter_previous = None
 
@@ -202,6 +217,7 @@ class MapEvaluator:
             self.edisp = edisp.get_edisp_kernel(
                 position=self.position, energy_axis=energy_axis
             )
+            self.edisp.data = self.edisp.data.astype(self.dtype, copy=False)
             del self._edisp_diagonal
 
         # lookup psf
@@ -244,10 +260,12 @@ class MapEvaluator:
 
     @lazyproperty
     def _edisp_diagonal(self):
-        return EDispKernel.from_diagonal_response(
+        edisp = EDispKernel.from_diagonal_response(
             energy_axis_true=self.geom.axes["energy_true"],
             energy_axis=self._geom_reco.axes["energy"],
         )
+        edisp.data = edisp.data.astype(self.dtype, copy=False)
+        return edisp
 
     def compute_dnde(self):
         """Compute model differential flux at map pixel centers.
@@ -266,24 +284,75 @@ class MapEvaluator:
 
     def compute_flux_psf_convolved(self, *arg):
         """Compute PSF convolved and temporal model corrected flux."""
-        value = self.compute_flux_spectral()
+        value = self.compute_flux_spectral() * self._compute_flux_morphology()
+        return Map.from_geom(geom=self.geom, data=value.value, unit=value.unit)
+
+    def _compute_flux_morphology(self):
+        """Compute PSF convolved spatial flux times the temporal norm."""
+        value = 1
 
         if self.model.spatial_model:
             if self.psf_containment is not None:
-                value = value * self.psf_containment
+                value = self.psf_containment
             else:
-                value = value * self.compute_flux_spatial()
+                value = self.compute_flux_spatial()
 
         if self.model.temporal_model:
-            value *= self.compute_temporal_norm()
+            value = value * self.compute_temporal_norm()
 
-        return Map.from_geom(geom=self.geom, data=value.value, unit=value.unit)
+        return value
+
+    def compute_flux_morphology_exposure(self):
+        """Compute PSF convolved spatial flux times temporal norm and exposure using caching."""
+        changed = self.parameters_morphology_changed or not self.use_cache
+        if changed:
+            del self._compute_flux_morphology_exposure
+
+        with timed(
+            "MapEvaluator.compute_flux_morphology_exposure", cache_hit=not changed
+        ):
+            return self._compute_flux_morphology_exposure
+
+    @lazyproperty
+    def _compute_flux_morphology_exposure(self):
+        value = self._compute_flux_morphology()
+
+        if isinstance(value, Map):
+            value = value.quantity
+
+        value = u.Quantity(value * self.exposure.quantity)
+        return value.astype(self.dtype, copy=False)
+
+    def _compute_npred_true(self, flux_spectral):
+        """Compute predicted counts in true energy bins from the spectral flux.
+
+        Parameters
+        ----------
+        flux_spectral : `~astropy.units.Quantity`
+            Integrated spectral flux in true energy bins, reshaped to broadcast
+            against the map data.
+
+        Returns
+        -------
+        npred : `~gammapy.maps.Map`
+            Predicted counts in true energy bins.
+        """
+        morphology = self.compute_flux_morphology_exposure()
+
+        with timed("MapEvaluator.apply_exposure"):
+            scale = self.dtype.type((flux_spectral.unit * morphology.unit).to(""))
+            flux_spectral = flux_spectral.value.astype(self.dtype, copy=False)
+            npred = flux_spectral * morphology.value * scale
+            return Map.from_geom(self.geom, data=npred, unit="")
 
     def compute_flux_spatial(self):
         """Compute spatial flux using caching."""
-        if self.parameters_spatial_changed() or not self.use_cache:
+        changed = self.parameters_spatial_changed() or not self.use_cache
+        if changed:
             del self._compute_flux_spatial
-        return self._compute_flux_spatial
+
+        with timed("MapEvaluator.compute_flux_spatial", cache_hit=not changed):
+            return self._compute_flux_spatial
 
     @lazyproperty
     def _compute_flux_spatial(self):
@@ -331,6 +400,9 @@ class MapEvaluator:
             energy[:-1],
             energy[1:],
         )
+        return self._reshape_flux_spectral(value)
+
+    def _reshape_flux_spectral(self, value):
         if self.geom.is_hpx:
             return value.reshape((-1, 1))
         else:
@@ -349,7 +421,9 @@ class MapEvaluator:
         For now just divide flux cube by exposure.
         """
         npred = (flux.quantity * self.exposure.quantity).to_value("")
-        return Map.from_geom(self.geom, data=npred, unit="")
+        return Map.from_geom(
+            self.geom, data=npred.astype(self.dtype, copy=False), unit=""
+        )
 
     def apply_psf(self, npred):
         """Convolve npred cube with PSF."""
@@ -388,12 +462,25 @@ class MapEvaluator:
             ):
                 npred = Map.from_geom(self._geom_reco, data=0)
             elif not self.parameter_norm_only_changed or not self.use_cache:
-                for method in self.methods_sequence:
-                    values = method(self._computation_cache)
-                    self._computation_cache = values
+                if self._is_spectral_separable:
+                    # only the spectral flux is re-computed if the spatial
+                    # and temporal parameters did not change
+                    with timed("MapEvaluator.compute_flux_spectral"):
+                        flux_spectral = self.compute_flux_spectral()
+
+                    npred = self._compute_npred_true(flux_spectral)
+
+                    with timed("MapEvaluator.apply_edisp"):
+                        self._computation_cache = self.apply_edisp(npred)
+                else:
+                    for method in self.methods_sequence:
+                        with timed(f"MapEvaluator.{method.__name__}"):
+                            values = method(self._computation_cache)
+                        self._computation_cache = values
                 npred = self._computation_cache
             else:
-                npred = self._computation_cache * self.renorm()
+                with timed("MapEvaluator.renorm"):
+                    npred = self._computation_cache * self.dtype.type(self.renorm())
         return npred
 
     @property
@@ -410,11 +497,257 @@ class MapEvaluator:
         npred : `~gammapy.maps.Map`
             Predicted counts on the map (in reconstructed energy bins).
         """
-        if self.parameters_changed or not self.use_cache:
+        changed = self.parameters_changed or not self.use_cache
+        if changed:
             del self._compute_npred
 
+        record_cache("MapEvaluator.compute_npred", cache_hit=not changed)
         return self._compute_npred
 
+    def compute_npred_gradient(self, parameters=None, epsilon=1e-3):
+        """Compute the derivatives of the predicted counts with respect to the parameters.
+
+        The derivative with respect to the norm parameter is obtained by rescaling
+        the cached predicted counts. If the model is evaluated as a product of the
+        spectral flux and the PSF convolved spatial flux, the derivatives with respect
+        to the spectral and spatial parameters are obtained from
+        `~gammapy.modeling.models.SpectralModel.integral_gradient` and
+        `~gammapy.modeling.models.SpatialModel.integrate_geom_gradient`, and propagated
+        through the exposure and energy dispersion. All other derivatives are computed
+        numerically using central differences of the predicted counts.
+
+        Parameters
+        ----------
+        parameters : list of `~gammapy.modeling.Parameter`, optional
+            Parameters to compute the derivatives for. Default is None,
+            which uses the free parameters of the model.
+        epsilon : float, optional
+            Relative step size used for the numerical derivatives. Default is 1e-3.
+
+        Returns
+        -------
+        gradient : list of `~gammapy.maps.Map`
+            Derivatives of the predicted counts (in reconstructed energy bins)
+            per unit of the parameter value, one per parameter.
+        """
+        if parameters is None:
+            parameters = self.model.parameters.free_parameters
+
+        npred = self.compute_npred()
+
+        is_separable = (
+            not isinstance(self.model, TemplateNPredModel)
+            and self.methods_sequence[0] == self.compute_flux_psf_convolved
+        )
+
+        gradient = []
+        for parameter in parameters:
+            if self._is_norm_parameter(parameter) and parameter.value != 0:
+                value = npred / parameter.value
+            elif is_separable and parameter in self.model.spectral_model.parameters:
+                value = self._compute_npred_gradient_spectral(parameter, epsilon)
+            elif (
+                is_separable
+                and self.model.spatial_model is not None
+                and self.psf_containment is None
+                and not self.geom.is_region
+                and parameter in self.model.spatial_model.parameters
+            ):
+                value = self._compute_npred_gradient_spatial(parameter, epsilon)
+            else:
+                value = _central_difference(
+                    self._evaluate_npred, parameter=parameter, epsilon=epsilon
+                )
+            gradient.append(value)
+
+        return gradient
+
+    def _is_norm_parameter(self, parameter):
+        idx = self._norm_idx
+        return idx is not None and self.model.parameters[idx] is parameter
+
+    def _apply_irfs(self, flux):
+        """Apply the methods following the flux computation to a flux map."""
+        values = flux
+        for method in self.methods_sequence[1:]:
+            values = method(values)
+        return values
+
+    def _evaluate_npred(self):
+        """Evaluate predicted counts without using the npred cache."""
+        if isinstance(self.model, TemplateNPredModel):
+            return self.model.evaluate()
+
+        values = None
+        for method in self.methods_sequence:
+            values = method(values)
+        return values
+
+    def _compute_npred_gradient_spectral(self, parameter, epsilon):
+        energy = self.geom.axes["energy_true"].edges
+        (value,) = self.model.spectral_model.integral_gradient(
+            energy[:-1], energy[1:], parameters=[parameter], epsilon=epsilon
+        )
+        value = self._reshape_flux_spectral(value * parameter.unit)
+
+        if self._is_spectral_separable:
+            return self.apply_edisp(self._compute_npred_true(value))
+
+        value = value * self._compute_flux_morphology()
+        flux = Map.from_geom(geom=self.geom, data=value.value, unit=value.unit)
+        return self._apply_irfs(flux)
+
+    def _compute_npred_gradient_spatial(self, parameter, epsilon):
+        geom = self.geom
+        if not self.model.spatial_model.is_energy_dependent:
+            geom = geom.to_image()
+
+        (value,) = self.model.spatial_model.integrate_geom_gradient(
+            geom, parameters=[parameter], epsilon=epsilon
+        )
+
+        if self.psf and self.model.apply_irf["psf"]:
+            value = self.apply_psf(value)
+
+        value = self.compute_flux_spectral() * value
+
+        if self.model.temporal_model:
+            value *= self.compute_temporal_norm()
+
+        flux = Map.from_geom(geom=self.geom, data=value.value, unit=value.unit)
+        return self._apply_irfs(flux)
+
+    def compute_npred_samples(self, values):
+        """Evaluate model predicted counts for many parameter values at once.
+
+        If the model is evaluated as a product of the spectral flux and the PSF
+        convolved spatial flux, the spectral integrals are computed for all samples
+        in a single vectorized call, the spatial flux is computed and convolved once
+        per distinct set of spatial and temporal parameter values, and the exposure
+        and energy dispersion are applied to the whole stack of samples. All other
+        models are evaluated sample by sample.
+
+        The IRFs are not updated for the sampled positions, i.e. the kernels
+        extracted at the current model position are used for all samples.
+
+        This method is not used by `~gammapy.modeling.Fit`, the fit statistic
+        scans still evaluate the datasets once per parameter value.
+
+        Parameters
+        ----------
+        values : `~numpy.ndarray`
+            Parameter values with shape ``(n_samples, n_parameters)``, where the
+            parameters are ordered as in ``self.model.parameters``.
+
+        Returns
+        -------
+        npred : `~gammapy.maps.Map`
+            Predicted counts (in reconstructed energy bins) with an additional
+            "samples" axis.
+        """
+        values = np.atleast_2d(values)
+        parameters = self.model.parameters
+
+        if values.ndim != 2 or values.shape[1] != len(parameters):
+            raise ValueError(
+                f"Values must have shape (n_samples, {len(parameters)}),"
+                f" got {values.shape}"
+            )
+
+        axis = MapAxis.from_nodes(np.arange(len(values)), name="samples", interp="lin")
+
+        if (
+            isinstance(self.model, TemplateNPredModel)
+            or self.methods_sequence[0] != self.compute_flux_psf_convolved
+        ):
+            data = []
+            with parameters.restore_status():
+                for row in values:
+                    parameters.value = row
+                    npred = self._evaluate_npred()
+                    data.append(npred.data)
+            geom, unit = npred.geom, npred.unit
+        else:
+            data, unit = self._compute_npred_samples(values)
+            geom = self._geom_reco
+
+        return Map.from_geom(geom.to_cube([axis]), data=np.stack(data), unit=unit)
+
+    def _compute_npred_samples(self, values):
+        parameters = self.model.parameters
+        idx_spectral = [
+            parameters.index(par) for par in self.model.spectral_model.parameters
+        ]
+        is_spectral = np.zeros(len(parameters), dtype=bool)
+        is_spectral[idx_spectral] = True
+
+        flux_spectral = self._compute_flux_spectral_samples(values[:, idx_spectral])
+        ndim_image = 1 if self.geom.is_hpx else 2
+        flux_spectral = flux_spectral.reshape(flux_spectral.shape + (1,) * ndim_image)
+
+        exposure = 1
+        if self.apply_exposure in self.methods_sequence:
+            exposure = self.exposure.quantity
+
+        if self.model.apply_irf["edisp"] and self.edisp:
+            pdf_matrix = self.edisp.pdf_matrix
+        else:
+            pdf_matrix = self._edisp_diagonal.pdf_matrix
+
+        unique, inverse = np.unique(
+            values[:, ~is_spectral], axis=0, return_inverse=True
+        )
+        inverse = inverse.ravel()
+
+        data = np.empty((len(values), pdf_matrix.shape[1]) + self.geom.data_shape[1:])
+
+        with parameters.restore_status():
+            for idx, row in enumerate(unique):
+                current = parameters.value
+                current[~is_spectral] = row
+                parameters.value = current
+
+                selection = inverse == idx
+                npred = flux_spectral[selection] * self._compute_flux_morphology()
+                npred = npred * exposure
+
+                if isinstance(exposure, u.Quantity):
+                    npred = npred.to("")
+
+                npred_reco = np.matmul(np.moveaxis(npred.value, 1, -1), pdf_matrix)
+                data[selection] = np.moveaxis(npred_reco, -1, 1)
+
+        return data, npred.unit
+
+    def _compute_flux_spectral_samples(self, values):
+        """Compute spectral flux in true energy bins of shape (n_samples, n_energy).
+
+        The columns of ``values`` are ordered as ``self.model.spectral_model.parameters``.
+        """
+        spectral_model = self.model.spectral_model
+        energy = self.geom.axes["energy_true"].edges
+
+        samples = [
+            column * par.unit
+            for column, par in zip(values.T, spectral_model.parameters)
+        ]
+
+        if hasattr(spectral_model, "evaluate_integral"):
+            kwargs = {
+                par.name: column
+                for column, par in zip(samples, spectral_model.parameters)
+            }
+            kwargs = spectral_model._convert_evaluate_unit(kwargs, energy)
+            flux = spectral_model.evaluate_integral(
+                energy[:-1, np.newaxis], energy[1:, np.newaxis], **kwargs
+            )
+        else:
+            flux = integrate_spectrum(
+                spectral_model, energy[:-1], energy[1:], parameter_samples=samples
+            )
+
+        return flux.T
+
     @property
     def parameters_changed(self):
         """Parameters changed."""
@@ -461,6 +794,30 @@ class MapEvaluator:
 
         return changed
 
+    @property
+    def parameters_morphology_changed(self):
+        """Spatial or temporal parameters changed."""
+        values = [
+            model.parameters.value
+            for model in [self.model.spatial_model, self.model.temporal_model]
+            if model is not None
+        ]
+        values = np.concatenate(values) if values else np.array([])
+        changed = ~np.all(self._cached_parameter_values_morphology == values)
+
+        if changed:
+            self._cached_parameter_values_morphology = values
+
+        return changed
+
+    @property
+    def _is_spectral_separable(self):
+        """Whether npred is computed as spectral flux times cached morphology and exposure."""
+        return self.use_cache and self.methods_sequence[:2] == [
+            self.compute_flux_psf_convolved,
+            self.apply_exposure,
+        ]
+
     @property
     def irf_position_changed(self):
         """Position for IRF changed."""
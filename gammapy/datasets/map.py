@@ -5,14 +5,23 @@ from scipy.stats import median_abs_deviation as mad
 import astropy.units as u
 from astropy.io import fits
 from astropy.table import Table
-from regions import CircleSkyRegion, RectangleSkyRegion
+from regions import CircleSkyRegion, PointSkyRegion, RectangleSkyRegion
 import matplotlib.pyplot as plt
 from matplotlib.colors import LogNorm
 import gammapy.datasets.evaluator as meval
 from gammapy.data import GTI, PointingMode
 from gammapy.irf import EDispKernelMap, EDispMap, PSFKernel, PSFMap, RecoPSFMap
-from gammapy.maps import LabelMapAxis, Map, MapAxes, MapAxis, WcsGeom
+from gammapy.maps import (
+    LabelMapAxis,
+    Map,
+    MapAxes,
+    MapAxis,
+    RegionGeom,
+    RegionNDMap,
+    WcsGeom,
+)
 from gammapy.modeling.models import DatasetModels, FoVBackgroundModel, Models
+from gammapy.modeling.utils import _central_difference
 from gammapy.stats import (
     CashCountsStatistic,
     WStatCountsStatistic,
@@ -22,6 +31,7 @@ from gammapy.utils.fits import HDULocation, LazyFitsData
 from gammapy.utils.random import get_random_state
 from gammapy.utils.scripts import make_name, make_path
 from gammapy.utils.table import hstack_columns
+from gammapy.utils.timing import timed
 from .core import Dataset
 from .evaluator import MapEvaluator
 from .metadata import MapDatasetMetaData
@@ -50,6 +60,7 @@ BINSZ_IRF_DEFAULT = 0.2 * u.deg
 
 EVALUATION_MODE = "local"
 USE_NPRED_CACHE = True
+NPRED_DTYPE = "float64"
 
 
 def create_map_dataset_geoms(
@@ -407,6 +418,122 @@ def create_map_dataset_from_observation(
     return dataset
 
 
+def _reduce_regions(regions):
+    """Reduction of maps in each region with `~gammapy.maps.Map.to_region_nd_map`."""
+
+    def reduce(m, func, weights=None):
+        return [m.to_region_nd_map(_, func=func, weights=weights) for _ in regions]
+
+    return reduce
+
+
+class _RegionsReducer:
+    """Reduction of WCS maps in several regions at once.
+
+    The result is the same as `~gammapy.maps.WcsNDMap.to_region_nd_map` applied
+    to each region, but the image pixels of the regions are computed only once.
+
+    Parameters
+    ----------
+    geom : `~gammapy.maps.WcsGeom`
+        Map geometry.
+    regions : list of `~regions.SkyRegion`
+        Regions, which have to be fully contained in the geometry.
+    """
+
+    FUNCS = {np.sum: "sum", np.mean: "mean", np.any: "any"}
+
+    def __init__(self, geom, regions):
+        geom_image = geom.to_image()
+        # padding by one pixel to detect regions not contained in the geom
+        geom_padded = geom_image.pad(1, axis_name=None)
+        ny, nx = geom_padded.data_shape
+        idx_pix = np.arange(ny * nx).reshape((ny, nx))
+
+        self.geoms, pixels, labels = [], [], []
+
+        for idx, region in enumerate(regions):
+            geom_region = RegionGeom.from_regions(regions=region, wcs=geom.wcs)
+            cutout = geom_padded.cutout(
+                position=geom_region.center_skydir, width=geom_region.width
+            )
+            slices = cutout.cutout_slices(geom_padded)["parent-slices"]
+            mask = cutout.region_mask([region]).data
+            iy, ix = np.divmod(idx_pix[slices][mask], nx)
+
+            if np.any((iy == 0) | (iy == ny - 1) | (ix == 0) | (ix == nx - 1)):
+                raise Exception(
+                    """`to_region_map_dataset` can only be applied if the region
+                    is fully contained inside the counts geom.
+                    """
+                )
+
+            self.geoms.append(geom_region)
+            pixels.append((iy - 1) * (nx - 2) + ix - 1)
+            labels.append(np.full(len(iy), idx))
+
+        self.pixels, self.labels = np.concatenate(pixels), np.concatenate(labels)
+        self.n_pixels = np.bincount(self.labels, minlength=len(regions))
+
+    def __call__(self, m, func, weights=None):
+        """Reduce a map in each region.
+
+        Parameters
+        ----------
+        m : `~gammapy.maps.WcsNDMap`
+            Map to reduce.
+        func : {`numpy.sum`, `numpy.mean`, `numpy.any`}
+            Reduction function.
+        weights : `~gammapy.maps.WcsNDMap`, optional
+            Weights, a mask selects the pixels. Default is None.
+
+        Returns
+        -------
+        maps : list of `~gammapy.maps.RegionNDMap`
+            Reduced maps, one per region.
+        """
+        n_regions, shape = len(self.geoms), m.data.shape[:-2]
+
+        data = m.data.reshape(shape + (-1,))[..., self.pixels]
+        data = data.reshape((-1, len(self.pixels)))
+        selection = np.ones(data.shape, dtype=bool)
+
+        if weights is not None:
+            values = weights.data.reshape(shape + (-1,))[..., self.pixels]
+            values = values.reshape(data.shape)
+            if weights.is_mask:
+                selection = values
+            else:
+                data = data * values
+
+        result = np.empty((len(data), n_regions))
+
+        for idx, (values, selected) in enumerate(zip(data, selection)):
+            values = np.where(selected, values, 0)
+            result[idx] = np.bincount(self.labels, weights=values, minlength=n_regions)
+
+            if self.FUNCS[func] == "mean":
+                with np.errstate(invalid="ignore"):
+                    result[idx] /= np.bincount(
+                        self.labels, weights=selected, minlength=n_regions
+                    )
+
+        if self.FUNCS[func] == "any":
+            result = result > 0
+
+        result = np.moveaxis(result.astype(m.data.dtype), -1, 0)
+
+        return [
+            RegionNDMap.from_geom(
+                geom=geom.to_cube(m.geom.axes),
+                data=data.reshape(shape),
+                unit=m.unit,
+                meta=m.meta.copy(),
+            )
+            for geom, data in zip(self.geoms, result)
+        ]
+
+
 class MapDataset(Dataset):
     """Main map dataset for likelihood fitting.
 
@@ -688,6 +815,7 @@ class MapDataset(Dataset):
                         evaluation_mode=EVALUATION_MODE,
                         gti=self.gti,
                         use_cache=USE_NPRED_CACHE,
+                        dtype=NPRED_DTYPE,
                     )
                     self._evaluators[model.name] = evaluator
 
@@ -800,13 +928,20 @@ class MapDataset(Dataset):
         """
         background = self.background
         if self.background_model and background:
-            if self._background_parameters_changed:
-                values = self.background_model.evaluate_geom(geom=self.background.geom)
-                if self._background_cached is None:
-                    self._background_cached = background * values
-                else:
-                    self._background_cached.quantity = (
-                        background.quantity * values.value
+            changed = self._background_parameters_changed
+            with timed("MapDataset.npred_background", cache_hit=not changed):
+                if changed:
+                    values = self.background_model.evaluate_geom(
+                        geom=self.background.geom
+                    )
+                    if self._background_cached is None:
+                        self._background_cached = background * values
+                    else:
+                        self._background_cached.quantity = (
+                            background.quantity * values.value
+                        )
+                    self._background_cached.data = self._background_cached.data.astype(
+                        NPRED_DTYPE, copy=False
                     )
             return self._background_cached
         else:
@@ -841,7 +976,7 @@ class MapDataset(Dataset):
         npred_sig : `gammapy.maps.Map`
             Map of the predicted signal counts.
         """
-        npred_total = Map.from_geom(self._geom, dtype=float)
+        npred_total = Map.from_geom(self._geom, dtype=NPRED_DTYPE)
 
         evaluators = self.evaluators
         if model_names is not None:
@@ -866,7 +1001,7 @@ class MapDataset(Dataset):
                 if stack:
                     npred_total.stack(npred)
                 else:
-                    npred_geom = Map.from_geom(self._geom, dtype=float)
+                    npred_geom = Map.from_geom(self._geom, dtype=NPRED_DTYPE)
                     npred_geom.stack(npred)
                     labels.append(evaluator_name)
                     npred_list.append(npred_geom)
@@ -879,6 +1014,84 @@ class MapDataset(Dataset):
 
         return npred_total
 
+    def stat_sum_gradient(self, parameters, epsilon=1e-3):
+        """Derivatives of the total statistic with respect to the given parameters.
+
+        The derivative of the statistic with respect to the predicted counts is
+        combined with the predicted counts derivatives returned by
+        `~gammapy.datasets.evaluator.MapEvaluator.compute_npred_gradient` and
+        with the derivatives of the predicted background counts. If the fit
+        statistic does not support derivatives, central differences of
+        `stat_sum` are used instead.
+
+        Parameters
+        ----------
+        parameters : list of `~gammapy.modeling.Parameter`
+            Parameters to compute the derivatives for.
+        epsilon : float, optional
+            Relative step size used for the numerical derivatives. Default is 1e-3.
+
+        Returns
+        -------
+        gradient : `~numpy.ndarray`
+            Derivatives of the total statistic, one per parameter.
+        """
+        if not self._fit_statistic.has_derivative:
+            return super().stat_sum_gradient(parameters, epsilon=epsilon)
+
+        stat_derivative = self._fit_statistic.stat_derivative_array_dataset(self)
+
+        gradient = np.zeros(len(parameters))
+        npred_derivative = Map.from_geom(self._geom, dtype=float)
+
+        for evaluator in self.evaluators.values():
+            if not evaluator.contributes:
+                continue
+
+            model_parameters = evaluator.model.parameters
+            indices = [
+                idx for idx, par in enumerate(parameters) if par in model_parameters
+            ]
+
+            if not indices:
+                continue
+
+            values = evaluator.compute_npred_gradient(
+                parameters=[parameters[idx] for idx in indices], epsilon=epsilon
+            )
+
+            for idx, value in zip(indices, values):
+                npred_derivative.data[...] = 0
+                npred_derivative.stack(value)
+                gradient[idx] += np.sum(stat_derivative * npred_derivative.data)
+
+        for idx, value in self._npred_background_gradient(parameters, epsilon).items():
+            gradient[idx] += np.sum(stat_derivative * value)
+
+        return gradient
+
+    def _npred_background_gradient(self, parameters, epsilon):
+        """Derivatives of the predicted background counts, by parameter index."""
+        gradient = {}
+
+        if not (self.background_model and self.background):
+            return gradient
+
+        background_parameters = self.background_model.parameters
+
+        def npred_background():
+            geom = self.background.geom
+            values = self.background_model.evaluate_geom(geom=geom)
+            return self.background.data * values.value
+
+        for idx, parameter in enumerate(parameters):
+            if parameter in background_parameters:
+                gradient[idx] = _central_difference(
+                    npred_background, parameter=parameter, epsilon=epsilon
+                )
+
+        return gradient
+
     @classmethod
     def from_geoms(
         cls,
@@ -1905,44 +2118,85 @@ class MapDataset(Dataset):
         dataset : `~gammapy.datasets.SpectrumDataset`
             The resulting reduced dataset.
         """
+        return self.to_spectrum_datasets(
+            regions=[on_region],
+            containment_correction=containment_correction,
+            name=name,
+        )[0]
+
+    def to_spectrum_datasets(self, regions, containment_correction=False, name=None):
+        """Return a ~gammapy.datasets.SpectrumDataset for each region.
+
+        The result is the same as `to_spectrum_dataset` applied to each region,
+        but for map datasets all regions are reduced at once.
+
+        Parameters
+        ----------
+        regions : list of `~regions.SkyRegion`
+            The input ON regions on which to extract the spectra.
+        containment_correction : bool
+            Apply containment correction for point sources and circular on regions. Default is False.
+        name : str, optional
+            Name of the new datasets. Default is None.
+
+        Returns
+        -------
+        datasets : list of `~gammapy.datasets.SpectrumDataset`
+            The resulting reduced datasets, one per region.
+        """
+        reduce = self._get_regions_reducer(regions)
+        return self._to_spectrum_datasets(
+            regions=regions,
+            reduce=reduce,
+            containment_correction=containment_correction,
+            name=name,
+        )
+
+    def _to_spectrum_datasets(self, regions, reduce, containment_correction, name):
+        """Spectrum datasets for the regions, reduced with the given function."""
         from .spectrum import SpectrumDataset
 
-        dataset = self.to_region_map_dataset(region=on_region, name=name)
+        datasets = self._to_region_map_datasets(regions, reduce=reduce, name=name)
 
-        if containment_correction:
-            if not isinstance(on_region, CircleSkyRegion):
-                raise TypeError(
-                    "Containment correction is only supported for `CircleSkyRegion`."
-                )
-            elif self.psf is None or isinstance(self.psf, PSFKernel):
-                raise ValueError("No PSFMap set. Containment correction impossible")
-            else:
-                geom = dataset.exposure.geom
-                energy_true = geom.axes["energy_true"].center
-                containment = self.psf.containment(
-                    position=on_region.center,
-                    energy_true=energy_true,
-                    rad=on_region.radius,
-                )
-                dataset.exposure.quantity *= containment.reshape(geom.data_shape)
+        spectrum_datasets = []
 
-        kwargs = {"name": name}
+        for on_region, dataset in zip(regions, datasets):
+            if containment_correction:
+                if not isinstance(on_region, CircleSkyRegion):
+                    raise TypeError(
+                        "Containment correction is only supported for `CircleSkyRegion`."
+                    )
+                elif self.psf is None or isinstance(self.psf, PSFKernel):
+                    raise ValueError("No PSFMap set. Containment correction impossible")
+                else:
+                    geom = dataset.exposure.geom
+                    energy_true = geom.axes["energy_true"].center
+                    containment = self.psf.containment(
+                        position=on_region.center,
+                        energy_true=energy_true,
+                        rad=on_region.radius,
+                    )
+                    dataset.exposure.quantity *= containment.reshape(geom.data_shape)
 
-        for key in [
-            "counts",
-            "edisp",
-            "mask_safe",
-            "mask_fit",
-            "exposure",
-            "gti",
-            "meta_table",
-        ]:
-            kwargs[key] = getattr(dataset, key)
+            kwargs = {"name": name}
 
-        if self.stat_type == "cash":
-            kwargs["background"] = dataset.background
+            for key in [
+                "counts",
+                "edisp",
+                "mask_safe",
+                "mask_fit",
+                "exposure",
+                "gti",
+                "meta_table",
+            ]:
+                kwargs[key] = getattr(dataset, key)
+
+            if self.stat_type == "cash":
+                kwargs["background"] = dataset.background
 
-        return SpectrumDataset(**kwargs)
+            spectrum_datasets.append(SpectrumDataset(**kwargs))
+
+        return spectrum_datasets
 
     def to_region_map_dataset(self, region, name=None):
         """Integrate the map dataset in a given region.
@@ -1964,9 +2218,61 @@ class MapDataset(Dataset):
         dataset : `~gammapy.datasets.MapDataset`
             The resulting reduced dataset.
         """
-        name = make_name(name)
-        kwargs = {"gti": self.gti, "name": name, "meta_table": self.meta_table}
+        return self.to_region_map_datasets(regions=[region], name=name)[0]
+
+    def to_region_map_datasets(self, regions, name=None):
+        """Integrate the map dataset in each of the given regions.
+
+        The result is the same as `to_region_map_dataset` applied to each region,
+        but for map datasets all regions are reduced at once.
+
+        Parameters
+        ----------
+        regions : list of `~regions.SkyRegion`
+            Regions from which to extract the spectra.
+        name : str, optional
+            Name of the new datasets. Default is None.
 
+        Returns
+        -------
+        datasets : list of `~gammapy.datasets.MapDataset`
+            The resulting reduced datasets, one per region.
+        """
+        reduce = self._get_regions_reducer(regions)
+        return self._to_region_map_datasets(regions, reduce=reduce, name=name)
+
+    def _get_regions_reducer(self, regions):
+        """Check the regions and get the function reducing the maps in each region.
+
+        The function takes a map, a reduction function and optional weights, and
+        returns the list of reduced maps, one per region.
+        """
+        regions = list(regions)
+
+        if (
+            len(regions) == 1
+            or self.counts.geom.is_region
+            or any(isinstance(_, PointSkyRegion) for _ in regions)
+        ):
+            for region in regions:
+                self._check_region(region)
+            return _reduce_regions(regions)
+
+        reduce = _RegionsReducer(self.counts.geom, regions)
+
+        if self.mask and not self.mask.geom.is_region:
+            mask = Map.from_geom(self.mask.geom, data=self.mask.data.astype(int))
+            for n_pixels, m in zip(reduce.n_pixels, reduce(mask, np.sum)):
+                if not np.all((m.data == 0) | (m.data == n_pixels)):
+                    raise Exception(
+                        """`to_region_map_dataset` can only be applied if the mask
+                        is spatially uniform within the region for each energy bin"""
+                    )
+
+        return reduce
+
+    def _check_region(self, region):
+        """Check that a region can be used to integrate the dataset."""
         if not self.counts.geom.is_region:
             region_mask = (
                 self.counts.geom.to_image().pad(1, axis_name=None).region_mask(region)
@@ -1995,36 +2301,47 @@ class MapDataset(Dataset):
                     is spatially uniform within the region for each energy bin"""
                 )
 
+    def _to_region_map_datasets(self, regions, reduce, name):
+        """Region map datasets for the regions, reduced with the given function."""
+
+        def reduce_to(key, m, func, weights=None):
+            for kwargs, m_region in zip(kwargs_list, reduce(m, func, weights)):
+                kwargs[key] = m_region
+
+        kwargs_list = [
+            {"gti": self.gti, "name": make_name(name), "meta_table": self.meta_table}
+            for _ in regions
+        ]
+
         if self.mask_safe:
-            kwargs["mask_safe"] = self.mask_safe.to_region_nd_map(region, func=np.any)
+            reduce_to("mask_safe", self.mask_safe, func=np.any)
 
         if self.mask_fit:
-            kwargs["mask_fit"] = self.mask_fit.to_region_nd_map(region, func=np.any)
+            reduce_to("mask_fit", self.mask_fit, func=np.any)
 
         if self.counts:
-            kwargs["counts"] = self.counts.to_region_nd_map(
-                region, np.sum, weights=self.mask_safe
-            )
+            reduce_to("counts", self.counts, np.sum, weights=self.mask_safe)
 
         if self.stat_type == "cash" and self.background:
-            kwargs["background"] = self.npred_background().to_region_nd_map(
-                region, func=np.sum, weights=self.mask_safe
+            reduce_to(
+                "background", self.npred_background(), np.sum, weights=self.mask_safe
             )
 
         if self.exposure:
-            kwargs["exposure"] = self.exposure.to_region_nd_map(region, func=np.mean)
+            reduce_to("exposure", self.exposure, func=np.mean)
 
-        region = region.center if region else None
+        for kwargs, region in zip(kwargs_list, regions):
+            region = region.center if region else None
 
-        # TODO: Compute average psf in region
-        if self.psf:
-            kwargs["psf"] = self.psf.to_region_nd_map(region)
+            # TODO: Compute average psf in region
+            if self.psf:
+                kwargs["psf"] = self.psf.to_region_nd_map(region)
 
-        # TODO: Compute average edisp in region
-        if self.edisp is not None:
-            kwargs["edisp"] = self.edisp.to_region_nd_map(region)
+            # TODO: Compute average edisp in region
+            if self.edisp is not None:
+                kwargs["edisp"] = self.edisp.to_region_nd_map(region)
 
-        return self.__class__(**kwargs)
+        return [self.__class__(**kwargs) for kwargs in kwargs_list]
 
     def cutout(self, position, width, mode="trim", name=None):
         """Cutout map dataset.
@@ -2700,6 +3017,10 @@ class MapDatasetOnOff(MapDataset):
         mu_bkg = np.nan_to_num(mu_bkg)
         return Map.from_geom(geom=self._geom, data=mu_bkg)
 
+    def _npred_background_gradient(self, parameters, epsilon):
+        """The background is profiled and does not depend on the model parameters."""
+        return {}
+
     def npred_off(self):
         """Predicted counts in the off region; mu_bkg/alpha.
 
@@ -3217,34 +3538,47 @@ class MapDatasetOnOff(MapDataset):
         dataset : `~gammapy.datasets.SpectrumDatasetOnOff`
             The resulting reduced dataset.
         """
+        return super().to_spectrum_dataset(
+            on_region=on_region,
+            containment_correction=containment_correction,
+            name=name,
+        )
+
+    def _to_spectrum_datasets(self, regions, reduce, containment_correction, name):
         from .spectrum import SpectrumDatasetOnOff
 
-        dataset = super().to_spectrum_dataset(
-            on_region=on_region,
+        datasets = super()._to_spectrum_datasets(
+            regions=regions,
+            reduce=reduce,
             containment_correction=containment_correction,
             name=name,
         )
 
-        kwargs = {"name": name, "counts_off": None, "acceptance_off": None}
+        kwargs_list = [
+            {"name": name, "counts_off": None, "acceptance_off": None} for _ in regions
+        ]
 
         if self.counts_off is not None:
-            kwargs["counts_off"] = self.counts_off.get_spectrum(
-                on_region, np.sum, weights=self.mask_safe
-            )
+            counts_off = reduce(self.counts_off, np.sum, weights=self.mask_safe)
+            for kwargs, m in zip(kwargs_list, counts_off):
+                kwargs["counts_off"] = m
 
         if self.acceptance is not None:
-            kwargs["acceptance"] = self.acceptance.get_spectrum(
-                on_region, np.mean, weights=self.mask_safe
-            )
-            if self.counts_off is not None:
-                norm = self.background.get_spectrum(
-                    on_region, np.sum, weights=self.mask_safe
-                )
-                acceptance_off = kwargs["acceptance"] * kwargs["counts_off"] / norm
-                np.nan_to_num(acceptance_off.data, copy=False)
-                kwargs["acceptance_off"] = acceptance_off
+            acceptance = reduce(self.acceptance, np.mean, weights=self.mask_safe)
+            for kwargs, m in zip(kwargs_list, acceptance):
+                kwargs["acceptance"] = m
 
-        return SpectrumDatasetOnOff.from_spectrum_dataset(dataset=dataset, **kwargs)
+            if self.counts_off is not None:
+                norm = reduce(self.background, np.sum, weights=self.mask_safe)
+                for kwargs, m in zip(kwargs_list, norm):
+                    acceptance_off = kwargs["acceptance"] * kwargs["counts_off"] / m
+                    np.nan_to_num(acceptance_off.data, copy=False)
+                    kwargs["acceptance_off"] = acceptance_off
+
+        return [
+            SpectrumDatasetOnOff.from_spectrum_dataset(dataset=dataset, **kwargs)
+            for dataset, kwargs in zip(datasets, kwargs_list)
+        ]
 
     def cutout(self, position, width, mode="trim", name=None):
         """Cutout map dataset.
@@ -4,6 +4,7 @@ import pytest
 import numpy as np
 import astropy.units as u
 from numpy.testing import assert_allclose, assert_equal
+import gammapy.utils.parallel as parallel
 from gammapy.datasets import Datasets, SpectrumDatasetOnOff
 from gammapy.datasets.tests.test_map import get_map_dataset
 from gammapy.maps import MapAxis, WcsGeom
@@ -108,6 +109,13 @@ def test_datasets_likelihood(datasets):
     assert_allclose(likelihood, 14472200.0002)
 
 
+def test_datasets_likelihood_threads(datasets):
+    with parallel.multiprocessing_manager(n_threads=2):
+        likelihood = datasets.stat_sum()
+
+    assert_allclose(likelihood, 14472200.0002)
+
+
 @requires_data()
 def test_datasets_likelihood_with_penalty(map_datasets):
     assert_allclose(map_datasets.stat_sum(), 4132.493313)
@@ -277,3 +277,95 @@ def test_norm_only_changed():
     spectral_model.amplitude.value *= 2
     spectral_model.index.value *= 2
     assert not evaluator.parameter_norm_only_changed
+
+
+@pytest.mark.parametrize(
+    "spectral_model",
+    [
+        PowerLawSpectralModel(index=2, amplitude="1e-11 TeV-1 s-1 m-2"),
+        ConstantSpectralModel(const="1e-11 TeV-1 s-1 m-2"),
+    ],
+)
+def test_compute_npred_samples(spectral_model):
+    center = SkyCoord("0 deg", "0 deg", frame="galactic")
+    energy_axis_true = MapAxis.from_energy_bounds(
+        ".1 TeV", "10 TeV", nbin=3, name="energy_true"
+    )
+    geom = WcsGeom.create(
+        skydir=center,
+        width=1 * u.deg,
+        axes=[energy_axis_true],
+        frame="galactic",
+        binsz=0.1 * u.deg,
+    )
+
+    spatial_model = GaussianSpatialModel(
+        lon_0=0 * u.deg, lat_0=0 * u.deg, sigma=0.2 * u.deg, frame="galactic"
+    )
+    model = SkyModel(spectral_model=spectral_model, spatial_model=spatial_model)
+
+    exposure = Map.from_geom(geom, unit="m2 s")
+    exposure.data += 1.0
+
+    psf = PSFKernel.from_gauss(geom, sigma="0.1 deg")
+    evaluator = MapEvaluator(model=model, exposure=exposure, psf=psf)
+
+    values = np.tile(model.parameters.value, (4, 1))
+    values[1, 0] *= 1.5
+    values[2, model.parameters.index(spatial_model.sigma)] = 0.3
+    values[3, model.parameters.index(spatial_model.lon_0)] = 0.1
+
+    npred = evaluator.compute_npred_samples(values)
+
+    assert npred.data.shape == (4, 3, 10, 10)
+    assert npred.geom.axes.names == ["energy", "samples"]
+    assert_allclose(model.parameters.value, values[0])
+
+    for row, data in zip(values, npred.data):
+        model.parameters.value = row
+        assert_allclose(data, evaluator.compute_npred().data, rtol=1e-5)
+
+    with pytest.raises(ValueError):
+        evaluator.compute_npred_samples(values[:, :2])
+
+
+def test_spectral_only_changed():
+    center = SkyCoord("0 deg", "0 deg", frame="galactic")
+    energy_axis_true = MapAxis.from_energy_bounds(
+        ".1 TeV", "10 TeV", nbin=3, name="energy_true"
+    )
+    geom = WcsGeom.create(
+        skydir=center,
+        width=1 * u.deg,
+        axes=[energy_axis_true],
+        frame="galactic",
+        binsz=0.1 * u.deg,
+    )
+
+    spectral_model = PowerLawSpectralModel(index=2, amplitude="1e-11 TeV-1 s-1 m-2")
+    spatial_model = GaussianSpatialModel(
+        lon_0=0 * u.deg, lat_0=0 * u.deg, sigma=0.2 * u.deg, frame="galactic"
+    )
+    model = SkyModel(spectral_model=spectral_model, spatial_model=spatial_model)
+
+    exposure = Map.from_geom(geom, unit="m2 s")
+    exposure.data += 1.0
+    psf = PSFKernel.from_gauss(geom, sigma="0.1 deg")
+
+    evaluator = MapEvaluator(model=model, exposure=exposure, psf=psf)
+    evaluator_no_cache = MapEvaluator(
+        model=model, exposure=exposure, psf=psf, use_cache=False
+    )
+
+    evaluator.compute_npred()
+    morphology = evaluator.compute_flux_morphology_exposure()
+
+    spectral_model.index.value = 2.5
+    npred = evaluator.compute_npred()
+    assert evaluator.compute_flux_morphology_exposure() is morphology
+    assert_allclose(npred.data, evaluator_no_cache.compute_npred().data, rtol=1e-6)
+
+    spatial_model.sigma.value = 0.3
+    npred = evaluator.compute_npred()
+    assert evaluator.compute_flux_morphology_exposure() is not morphology
+    assert_allclose(npred.data, evaluator_no_cache.compute_npred().data, rtol=1e-6)
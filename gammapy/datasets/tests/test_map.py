@@ -10,7 +10,7 @@ from astropy.io import fits
 from astropy.table import Table
 from astropy.time import Time
 from astropy.utils.exceptions import AstropyUserWarning
-from regions import CircleSkyRegion
+from regions import CircleSkyRegion, RectangleSkyRegion
 import gammapy.irf.psf.map as psf_map_module
 from gammapy.catalog import SourceCatalog3FHL
 from gammapy.data import GTI, DataStore, Observation, FixedPointingInfo
@@ -47,6 +47,7 @@ from gammapy.maps import (
     WcsNDMap,
 )
 from gammapy.modeling import Fit
+from gammapy.modeling.utils import _central_difference
 from gammapy.modeling.models import (
     create_fermi_isotropic_diffuse_model,
     DiskSpatialModel,
@@ -458,6 +459,75 @@ def test_to_spectrum_dataset(sky_model, geom, geom_etrue, edisp_mode):
     assert_allclose(spectrum_dataset_corrected.exposure.data[1], 2.05201e09, rtol=1e-5)
 
 
+@pytest.mark.parametrize("on_off", [False, True])
+def test_to_spectrum_datasets(on_off):
+    energy_axis = MapAxis.from_energy_bounds("1 TeV", "10 TeV", nbin=3)
+    energy_axis_true = MapAxis.from_energy_bounds(
+        "0.5 TeV", "20 TeV", nbin=5, name="energy_true"
+    )
+    geom = WcsGeom.create(npix=(40, 30), binsz=0.05, axes=[energy_axis])
+    dataset = MapDataset.create(geom, energy_axis_true=energy_axis_true, name="test")
+
+    random_state = np.random.RandomState(0)
+    dataset.counts.data = random_state.poisson(5, dataset.counts.data.shape)
+    dataset.background.data = random_state.uniform(1, 2, dataset.counts.data.shape)
+    dataset.exposure.data = random_state.uniform(1e9, 2e9, dataset.exposure.data.shape)
+    edisp_map = dataset.edisp.edisp_map
+    edisp_map.data = random_state.uniform(0, 1, edisp_map.data.shape)
+
+    dataset.mask_safe.data = True
+    dataset.mask_safe.data[0] = False
+    dataset.mask_fit = Map.from_geom(geom, data=True)
+    dataset.mask_fit.data[:, :, 34:] = False
+
+    if on_off:
+        dataset = MapDatasetOnOff.from_map_dataset(
+            dataset, acceptance=1, acceptance_off=5, name="test"
+        )
+        dataset.acceptance.data = random_state.uniform(
+            0.5, 1, dataset.counts.data.shape
+        )
+
+    regions = [
+        CircleSkyRegion(SkyCoord(lon, 0, unit="deg"), radius=0.2 * u.deg)
+        for lon in [-0.4, -0.2, 0, 0.2]
+    ]
+    regions.append(
+        RectangleSkyRegion(
+            SkyCoord(0.1, 0.3, unit="deg"), width=0.7 * u.deg, height=0.2 * u.deg
+        )
+    )
+
+    datasets = dataset.to_spectrum_datasets(regions, name="test")
+    assert len(datasets) == 5
+
+    for region, spectrum_dataset in zip(regions, datasets):
+        expected = dataset.to_spectrum_dataset(region, name="test")
+        assert spectrum_dataset.__class__ is expected.__class__
+
+        names = ["counts", "exposure", "mask_safe", "mask_fit", "background"]
+        if on_off:
+            names += ["counts_off", "acceptance", "acceptance_off"]
+
+        for name in names:
+            actual, desired = getattr(spectrum_dataset, name), getattr(expected, name)
+            assert actual.geom == desired.geom
+            assert_allclose(actual.data, desired.data, rtol=1e-6)
+
+        assert_allclose(
+            spectrum_dataset.edisp.edisp_map.data, expected.edisp.edisp_map.data
+        )
+
+    with pytest.raises(Exception):
+        dataset.to_spectrum_datasets(
+            regions + [CircleSkyRegion(SkyCoord(0.9, 0, unit="deg"), 0.2 * u.deg)]
+        )
+
+    dataset.mask_fit.data[:, :, 15:] = False
+    with pytest.raises(Exception):
+        dataset.to_spectrum_datasets(regions)
+
+
 @requires_data()
 def test_energy_range(sky_model, geom1, geom_etrue):
     sky_coord1 = SkyCoord(266.5, -29.3, unit="deg")
@@ -866,6 +936,76 @@ def test_map_fit(sky_model, geom, geom_etrue):
     assert not dataset_1.evaluators["test-model"].contributes
 
 
+@pytest.mark.parametrize("stat_type", ["cash", "cash_weighted"])
+def test_map_dataset_stat_sum_gradient(sky_model, geom, geom_etrue, stat_type):
+    dataset = MapDataset.create(
+        geom, energy_axis_true=geom_etrue.axes["energy_true"], name="test"
+    )
+    dataset.exposure.data += 1e12
+    dataset.background.data += 0.2
+    dataset.psf = PSFMap.from_gauss(geom_etrue.axes["energy_true"], sigma="0.05 deg")
+    dataset.mask_safe.data[...] = True
+    dataset.stat_type = stat_type
+
+    sky_model.spatial_model.frame = "icrs"
+    sky_model.spatial_model.position = geom.center_skydir
+    bkg_model = FoVBackgroundModel(dataset_name="test")
+    dataset.models = [sky_model, bkg_model]
+    dataset.fake(random_state=0)
+
+    sky_model.spectral_model.index.value = 2.8
+    sky_model.spatial_model.sigma.value = 0.15
+    bkg_model.spectral_model.norm.value = 1.1
+
+    datasets = Datasets([dataset])
+    gradient = datasets.stat_sum_gradient()
+
+    for value, par in zip(gradient, datasets.parameters.free_parameters):
+        expected = _central_difference(datasets.stat_sum, parameter=par, epsilon=1e-2)
+        assert_allclose(value, expected, rtol=1e-2)
+
+
+@pytest.mark.parametrize("stat_type", ["cash", "cash_weighted"])
+def test_map_dataset_npred_dtype(monkeypatch, sky_model, geom, geom_etrue, stat_type):
+    import gammapy.datasets.map as dmap
+
+    sky_model.spatial_model.frame = "icrs"
+    sky_model.spatial_model.position = geom.center_skydir
+
+    def make_dataset(name):
+        dataset = MapDataset.create(
+            geom, energy_axis_true=geom_etrue.axes["energy_true"], name=name
+        )
+        dataset.exposure.data += 1e12
+        dataset.background.data += 0.2
+        dataset.psf = PSFMap.from_gauss(
+            geom_etrue.axes["energy_true"], sigma="0.05 deg"
+        )
+        dataset.mask_safe.data[...] = True
+        dataset.stat_type = stat_type
+        dataset.models = [sky_model, FoVBackgroundModel(dataset_name=name)]
+        dataset.fake(random_state=0)
+        return dataset
+
+    dataset_64 = make_dataset("test-64")
+
+    monkeypatch.setattr(dmap, "NPRED_DTYPE", "float32")
+    dataset_32 = make_dataset("test-32")
+    dataset_32.counts = dataset_64.counts
+
+    assert dataset_64.npred().data.dtype == np.float64
+    assert dataset_32.npred().data.dtype == np.float32
+    assert dataset_32.npred_background().data.dtype == np.float32
+
+    # spatial, spectral only and norm only updates
+    for name, value in [("sigma", 0.15), ("index", 2.8), ("amplitude", 2e-11)]:
+        sky_model.parameters[name].value = value
+        npred_32, npred_64 = dataset_32.npred(), dataset_64.npred()
+        assert npred_32.data.dtype == np.float32
+        assert_allclose(npred_32.data, npred_64.data, rtol=1e-5, atol=1e-8)
+        assert_allclose(dataset_32.stat_sum(), dataset_64.stat_sum(), rtol=1e-6)
+
+
 @requires_data()
 def test_prior_stat_sum(sky_model, geom, geom_etrue):
     dataset = get_map_dataset(geom, geom_etrue, name="test")
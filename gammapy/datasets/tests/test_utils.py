@@ -54,6 +54,31 @@ def test_apply_edisp(region_map_true):
     assert_allclose(e_reco[[0, -1]].value, [1, 10])
 
 
+@pytest.mark.parametrize("sigma", [0.05, 0.3, None])
+def test_apply_edisp_banded(sigma):
+    e_true = MapAxis.from_energy_bounds(
+        "0.1 TeV", "100 TeV", nbin=60, name="energy_true"
+    )
+    e_reco = MapAxis.from_energy_bounds("0.1 TeV", "100 TeV", nbin=40)
+    edisp = EDispKernel.from_gauss(
+        energy_axis_true=e_true, energy_axis=e_reco, sigma=sigma or 0.1, bias=0
+    )
+
+    rng = np.random.default_rng(0)
+    if sigma is None:
+        # dense matrix fallback
+        edisp.data = rng.random(edisp.data.shape)
+
+    m = Map.create(npix=(5, 4), binsz=0.1, axes=[e_true])
+    m.data = rng.random(m.data.shape)
+
+    result = apply_edisp(m, edisp)
+    expected = np.einsum("ijk,il->ljk", m.data, edisp.pdf_matrix)
+
+    assert result.geom.data_shape == (40, 4, 5)
+    assert_allclose(result.data, expected, rtol=1e-12)
+
+
 @requires_data()
 def test_dataset_split():
     template_diffuse = TemplateSpatialModel.read(
@@ -18,6 +18,9 @@ __all__ = [
 
 log = logging.getLogger(__name__)
 
+EDISP_BAND_BLOCK_SIZE = 8
+EDISP_BAND_MAX_FILL = 0.5
+
 
 def apply_edisp(input_map, edisp):
     """Apply energy dispersion to map. Requires "energy_true" axis.
@@ -65,12 +68,12 @@ def apply_edisp(input_map, edisp):
         dtype : float64
     <BLANKLINE>
     """
-    # TODO: either use sparse matrix multiplication or something like edisp.is_diagonal
     if edisp is not None:
         loc = input_map.geom.axes.index("energy_true")
-        data = np.rollaxis(input_map.data, loc, len(input_map.data.shape))
-        data = np.matmul(data, edisp.pdf_matrix)
-        data = np.rollaxis(data, -1, loc)
+        data = np.moveaxis(input_map.data, loc, 0)
+        shape = data.shape
+        data = _apply_edisp_matrix(data.reshape((shape[0], -1)), edisp.pdf_matrix)
+        data = np.moveaxis(data.reshape((-1,) + shape[1:]), 0, loc)
         energy_axis = edisp.axes["energy"].copy(name="energy")
     else:
         data = input_map.data
@@ -80,6 +83,64 @@ def apply_edisp(input_map, edisp):
     return Map.from_geom(geom=geom, data=data, unit=input_map.unit)
 
 
+def _edisp_band_blocks(pdf_matrix, block_size=EDISP_BAND_BLOCK_SIZE):
+    """Split the non-zero band of an energy dispersion matrix into dense blocks.
+
+    Parameters
+    ----------
+    pdf_matrix : `~numpy.ndarray`
+        Energy dispersion matrix of shape (n_true, n_reco).
+    block_size : int, optional
+        Number of reconstructed energy bins per block. Default is 8.
+
+    Returns
+    -------
+    blocks : list of tuple of slice
+        True and reconstructed energy slices of the blocks. The matrix
+        entries outside the blocks are zero.
+    """
+    non_zero = pdf_matrix != 0
+    n_true, n_reco = pdf_matrix.shape
+
+    idx_min = np.argmax(non_zero, axis=0)
+    idx_max = n_true - np.argmax(non_zero[::-1], axis=0)
+
+    blocks = []
+    for start in range(0, n_reco, block_size):
+        stop = min(start + block_size, n_reco)
+        is_empty = ~non_zero[:, start:stop].any(axis=0)
+        lo = np.min(np.where(is_empty, n_true, idx_min[start:stop]))
+        hi = np.max(np.where(is_empty, 0, idx_max[start:stop]))
+        blocks.append((slice(lo, max(lo, hi)), slice(start, stop)))
+
+    return blocks
+
+
+def _apply_edisp_matrix(data, pdf_matrix):
+    """Multiply data of shape (n_true, n_pix) with the energy dispersion matrix.
+
+    Realistic energy dispersion matrices are strongly banded. If the band covers
+    less than `EDISP_BAND_MAX_FILL` of the matrix, only the dense blocks along
+    the band are multiplied. Otherwise the full matrix product is used.
+    """
+    blocks = _edisp_band_blocks(pdf_matrix)
+    size = sum((t.stop - t.start) * (r.stop - r.start) for t, r in blocks)
+
+    if size > EDISP_BAND_MAX_FILL * pdf_matrix.size:
+        return np.matmul(pdf_matrix.T, data)
+
+    dtype = np.result_type(data, pdf_matrix)
+    result = np.zeros((pdf_matrix.shape[1], data.shape[1]), dtype=dtype)
+
+    for idx_true, idx_reco in blocks:
+        if idx_true.stop > idx_true.start:
+            np.matmul(
+                pdf_matrix[idx_true, idx_reco].T, data[idx_true], out=result[idx_reco]
+            )
+
+    return result
+
+
 def get_figure(fig, width, height):
     import matplotlib.pyplot as plt
 
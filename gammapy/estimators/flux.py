@@ -63,6 +63,13 @@ class FluxEstimator(ParameterEstimator):
         unless the source model does not have one and only one norm parameter.
         If a dict is given the entries should be a subset of
         `~gammapy.modeling.Parameter` arguments.
+    scan_accuracy : float, optional
+        If given, the fit statistic profile of the norm is computed with an adaptive
+        scan, refined until the interpolated profile is accurate to ``scan_accuracy``
+        in the region of interest. See `~gammapy.estimators.ParameterEstimator`.
+        The adaptive scan does not apply to `~gammapy.estimators.TSMapEstimator`,
+        which always evaluates the profile on its fixed set of norm values.
+        Default is None, which evaluates the fit statistic at all norm scan values.
     """
 
     tag = "FluxEstimator"
@@ -77,6 +84,7 @@ class FluxEstimator(ParameterEstimator):
         fit=None,
         reoptimize=False,
         norm=None,
+        scan_accuracy=None,
     ):
         self.source = source
 
@@ -91,6 +99,7 @@ class FluxEstimator(ParameterEstimator):
             selection_optional=selection_optional,
             fit=fit,
             reoptimize=reoptimize,
+            scan_accuracy=scan_accuracy,
         )
 
     def get_scale_model(self, models):
@@ -1,6 +1,7 @@
 # Licensed under a 3-clause BSD style license - see LICENSE.rst
 """Implementation of adaptive smoothing algorithms."""
 
+import hashlib
 import numpy as np
 from astropy.convolution import Gaussian2DKernel, Tophat2DKernel
 from astropy.coordinates import Angle
@@ -8,7 +9,7 @@ from gammapy.datasets import MapDatasetOnOff
 from gammapy.maps import Map, Maps, WcsNDMap
 from gammapy.modeling.models import PowerLawSpectralModel
 from gammapy.stats import CashCountsStatistic
-from gammapy.utils.array import scale_cube
+from gammapy.utils.array import _scale_cubes_fft, scale_cube
 from gammapy.utils.pbar import progress_bar
 from ..core import Estimator
 from ..utils import estimate_exposure_reco_energy
@@ -48,6 +49,20 @@ class ASmoothMapEstimator(Estimator):
         but rather the closest values to the energy axis edges of the parent dataset.
         Default is None: apply the estimator in each energy bin of the parent dataset.
         For further explanation see :ref:`estimators`.
+    convolution : {'direct', 'fft'}
+        Method used to compute the scale cubes. With 'direct', each map is convolved
+        separately with each kernel. With 'fft', the Fourier transform of each map is
+        computed once and reused for all scales. Both methods treat the image
+        boundaries in the same way, reflected for `~astropy.convolution.Gaussian2DKernel`
+        and zero padded for other kernels. Default is 'direct'.
+    n_threads : int, optional
+        Number of threads used to process the scales with ``convolution='fft'``.
+        Default is None, see `~gammapy.utils.parallel.run_threads`.
+
+    Notes
+    -----
+    The scale cubes of the last run are kept in memory, so that running again on
+    the same dataset with a different ``threshold`` does not recompute them.
 
     Examples
     --------
@@ -76,7 +91,14 @@ class ASmoothMapEstimator(Estimator):
         method="lima",
         threshold=5,
         energy_edges=None,
+        convolution="direct",
+        n_threads=None,
     ):
+        if convolution not in ["direct", "fft"]:
+            raise ValueError(
+                f"Invalid convolution: {convolution!r}, choose 'direct' or 'fft'."
+            )
+
         if spectral_model is None:
             spectral_model = PowerLawSpectralModel(index=2)
 
@@ -90,6 +112,16 @@ class ASmoothMapEstimator(Estimator):
         self.threshold = threshold
         self.method = method
         self.energy_edges = energy_edges
+        self.convolution = convolution
+        self.n_threads = n_threads
+        self._cubes_cache = {}
+
+    @property
+    def config_parameters(self):
+        """Configuration parameters."""
+        pars = super().config_parameters
+        pars.pop("cubes_cache")
+        return pars
 
     def selection_all(self):
         """Which quantities are computed."""
@@ -181,7 +213,7 @@ class ASmoothMapEstimator(Estimator):
         """
         energy_axis = self._get_energy_axis(dataset)
 
-        results = []
+        results, cubes_cache = [], {}
 
         for energy_min, energy_max in progress_bar(
             energy_axis.iter_by_edges, desc="Energy bins"
@@ -195,9 +227,10 @@ class ASmoothMapEstimator(Estimator):
                     energy_max=energy_max,
                 )
                 dataset_sliced.models = models_sliced
-            result = self.estimate_maps(dataset_sliced)
+            result = self._estimate_maps(dataset_sliced, cubes_cache=cubes_cache)
             results.append(result)
 
+        self._cubes_cache = cubes_cache
         maps = Maps()
 
         for name in results[0].keys():
@@ -225,6 +258,10 @@ class ASmoothMapEstimator(Estimator):
                 * 'scales'
                 * 'sqrt_ts'.
         """
+        return self._estimate_maps(dataset, cubes_cache={})
+
+    def _estimate_maps(self, dataset, cubes_cache):
+        """Run adaptive smoothing, storing the scale cubes used in ``cubes_cache``."""
         dataset_image = dataset.to_image(name=dataset.name)
         dataset_image.models = dataset.models
 
@@ -243,15 +280,19 @@ class ASmoothMapEstimator(Estimator):
         pixel_scale = dataset_image.counts.geom.pixel_scales.mean()
         kernels = self.get_kernels(pixel_scale)
 
-        cubes = {}
-        cubes["counts"] = scale_cube(counts, kernels)
-        cubes["background"] = scale_cube(background, kernels)
-
         if exposure is not None:
             flux = (dataset_image.counts - background) / exposure
-            cubes["flux"] = scale_cube(flux.data[0], kernels)
+            arrays = {"counts": counts, "background": background, "flux": flux.data[0]}
+        else:
+            arrays = {"counts": counts, "background": background}
 
-        cubes["sqrt_ts"] = self._sqrt_ts_cube(cubes, method=self.method)
+        key = self._get_cubes_cache_key(arrays, pixel_scale)
+        cubes = self._cubes_cache.get(key)
+
+        if cubes is None:
+            cubes = self._estimate_cubes(arrays, kernels)
+
+        cubes_cache[key] = cubes
 
         smoothed = self._reduce_cubes(cubes, kernels)
 
@@ -277,6 +318,30 @@ class ASmoothMapEstimator(Estimator):
 
         return result
 
+    def _get_cubes_cache_key(self, arrays, pixel_scale):
+        """Scale cubes cache key, from the content of the input arrays."""
+        digests = []
+        for name, data in arrays.items():
+            data = np.ascontiguousarray(data)
+            digest = hashlib.sha1(data.view(np.uint8)).hexdigest()
+            digests.append((name, data.dtype.str, data.shape, digest))
+
+        scales = tuple(self.scales.to_value("deg") / Angle(pixel_scale).deg)
+        return tuple(digests), scales, self.kernel, self.method, self.convolution
+
+    def _estimate_cubes(self, arrays, kernels):
+        """Compute the scale cubes of the input arrays and the sqrt_ts cube."""
+        if self.convolution == "fft":
+            data = _scale_cubes_fft(
+                list(arrays.values()), kernels, n_threads=self.n_threads
+            )
+            cubes = dict(zip(arrays, data))
+        else:
+            cubes = {name: scale_cube(data, kernels) for name, data in arrays.items()}
+
+        cubes["sqrt_ts"] = self._sqrt_ts_cube(cubes, method=self.method)
+        return cubes
+
     def _reduce_cubes(self, cubes, kernels):
         """
         Combine scale cube to image.
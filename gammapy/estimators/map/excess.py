@@ -2,6 +2,7 @@
 import copy
 import logging
 import numpy as np
+import scipy.fft
 from astropy.convolution import Tophat2DKernel
 from astropy.coordinates import Angle
 from gammapy.datasets import MapDataset, MapDatasetOnOff
@@ -17,7 +18,66 @@ __all__ = ["ExcessMapEstimator"]
 log = logging.getLogger(__name__)
 
 
-def _get_convolved_maps(dataset, kernel, mask, correlate_off):
+class _FFTConvolver:
+    """Convolve maps with several kernels, reusing the Fourier transforms of the maps.
+
+    The transforms are cached by name, so a given name must always refer to
+    the same map.
+
+    Parameters
+    ----------
+    kernel_shape : tuple of int
+        Shape of the largest kernel.
+    """
+
+    def __init__(self, kernel_shape):
+        self.kernel_shape = kernel_shape
+        self._transforms = {}
+        self._kernel = None
+        self._kernel_transform = None
+
+    def __call__(self, m, kernel, name):
+        """Convolve map with the kernel, same as `~gammapy.maps.WcsNDMap.convolve`.
+
+        Parameters
+        ----------
+        m : `~gammapy.maps.WcsNDMap`
+            Map to convolve.
+        kernel : `~numpy.ndarray`
+            2D kernel.
+        name : str
+            Name of the map in the cache.
+
+        Returns
+        -------
+        map : `~gammapy.maps.WcsNDMap`
+            Convolved map.
+        """
+        shape_image = m.data.shape[-2:]
+        shape = [
+            scipy.fft.next_fast_len(n + k - 1, real=True)
+            for n, k in zip(shape_image, self.kernel_shape)
+        ]
+
+        if name not in self._transforms:
+            self._transforms[name] = scipy.fft.rfft2(
+                m.data.astype(float), s=shape, axes=(-2, -1)
+            )
+
+        if kernel is not self._kernel:
+            self._kernel = kernel
+            self._kernel_transform = scipy.fft.rfft2(kernel, s=shape)
+
+        data = scipy.fft.irfft2(
+            self._transforms[name] * self._kernel_transform, s=shape, axes=(-2, -1)
+        )
+
+        y_lo, x_lo = [(k - 1) // 2 for k in kernel.shape]
+        data = data[..., y_lo : y_lo + shape_image[0], x_lo : x_lo + shape_image[1]]
+        return m._init_copy(data=data.astype(np.float32))
+
+
+def _get_convolved_maps(dataset, kernel, mask, correlate_off, convolver=None):
     """Return convolved maps.
 
     Parameters
@@ -30,6 +90,8 @@ def _get_convolved_maps(dataset, kernel, mask, correlate_off):
         Mask map.
     correlate_off : bool
         Correlate OFF events.
+    convolver : `_FFTConvolver`, optional
+        Convolver reusing the Fourier transforms of the maps. Default is None.
 
     Returns
     -------
@@ -40,10 +102,15 @@ def _get_convolved_maps(dataset, kernel, mask, correlate_off):
     kernel = copy.deepcopy(kernel)
     kernel_data = kernel.data / kernel.data.max()
 
+    def convolve(m, name):
+        if convolver is None:
+            return m.convolve(kernel_data)
+        return convolver(m, kernel_data, name=name)
+
     # fft convolution adds numerical noise, to ensure integer results we call
     # np.rint
     n_on = dataset.counts * mask
-    n_on_conv = np.rint(n_on.convolve(kernel_data).data)
+    n_on_conv = np.rint(convolve(n_on, "n_on").data)
 
     convolved_maps = {"n_on_conv": n_on_conv}
 
@@ -52,18 +119,18 @@ def _get_convolved_maps(dataset, kernel, mask, correlate_off):
         npred_sig = dataset.npred_signal() * mask
         acceptance_on = dataset.acceptance * mask
         acceptance_off = dataset.acceptance_off * mask
-        npred_sig_convolve = npred_sig.convolve(kernel_data)
+        npred_sig_convolve = convolve(npred_sig, "npred_sig")
         if correlate_off:
             background = dataset.background * mask
             background.data[dataset.acceptance_off == 0] = 0.0
-            background_conv = background.convolve(kernel_data)
-            n_off = n_off.convolve(kernel_data)
+            background_conv = convolve(background, "background")
+            n_off = convolve(n_off, "n_off")
 
             with np.errstate(invalid="ignore", divide="ignore"):
                 alpha = background_conv / n_off
 
         else:
-            acceptance_on_convolve = acceptance_on.convolve(kernel_data)
+            acceptance_on_convolve = convolve(acceptance_on, "acceptance_on")
 
             with np.errstate(invalid="ignore", divide="ignore"):
                 alpha = acceptance_on_convolve / acceptance_off
@@ -78,7 +145,7 @@ def _get_convolved_maps(dataset, kernel, mask, correlate_off):
         )
     else:
         npred = dataset.npred() * mask
-        background_conv = npred.convolve(kernel_data)
+        background_conv = convolve(npred, "npred")
         convolved_maps.update(
             {
                 "background_conv": background_conv,
@@ -294,6 +361,49 @@ class ExcessMapEstimator(Estimator):
                 * flux_ul : upper limit map.
                 * flux_sensitivity : flux sensitivity for this dataset
         """
+        resampled_dataset, reco_exposure = self._resample_dataset(dataset)
+        return self.estimate_excess_map(resampled_dataset, reco_exposure)
+
+    def run_correlation_radii(self, dataset, correlation_radii):
+        """Compute excess maps for several correlation radii.
+
+        The Fourier transforms of the counts, background, exposure and mask maps
+        are computed once and reused for every radius.
+
+        Parameters
+        ----------
+        dataset : `~gammapy.datasets.MapDataset` or `~gammapy.datasets.MapDatasetOnOff`
+            Map dataset.
+        correlation_radii : list of `~astropy.coordinates.Angle`
+            Correlation radii.
+
+        Returns
+        -------
+        maps : list of `~gammapy.estimators.FluxMaps`
+            Flux maps for each correlation radius, see `ExcessMapEstimator.run`.
+        """
+        correlation_radii = [Angle(_) for _ in correlation_radii]
+        resampled_dataset, reco_exposure = self._resample_dataset(dataset)
+
+        estimators = []
+        for correlation_radius in correlation_radii:
+            estimator = self.copy()
+            estimator.correlation_radius = correlation_radius
+            estimators.append(estimator)
+
+        kernel_shape = np.max(
+            [_.estimate_kernel(resampled_dataset).data.shape for _ in estimators],
+            axis=0,
+        )
+        convolver = _FFTConvolver(kernel_shape=kernel_shape)
+
+        return [
+            _.estimate_excess_map(resampled_dataset, reco_exposure, convolver)
+            for _ in estimators
+        ]
+
+    def _resample_dataset(self, dataset):
+        """Resample dataset and reconstructed exposure to the estimator energy axis."""
         if not isinstance(dataset, MapDataset):
             raise ValueError(
                 "Unsupported dataset type. Excess map is not applicable to 1D datasets."
@@ -323,8 +433,7 @@ class ExcessMapEstimator(Estimator):
             )
             resampled_dataset.models = None
 
-        result = self.estimate_excess_map(resampled_dataset, reco_exposure)
-        return result
+        return resampled_dataset, reco_exposure
 
     def estimate_kernel(self, dataset):
         """Get the convolution kernel for the input dataset.
@@ -369,7 +478,9 @@ class ExcessMapEstimator(Estimator):
             mask = Map.from_geom(dataset.counts.geom, data=True, dtype=bool)
         return mask
 
-    def estimate_exposure_reco_energy(self, dataset, kernel, mask, reco_exposure):
+    def estimate_exposure_reco_energy(
+        self, dataset, kernel, mask, reco_exposure, convolver=None
+    ):
         """Estimate exposure map in reconstructed energy for a single dataset assuming the given spectral_model shape.
 
         Parameters
@@ -380,6 +491,8 @@ class ExcessMapEstimator(Estimator):
             Kernel.
         mask : `~gammapy.maps.Map`
             Mask map.
+        convolver : `_FFTConvolver`, optional
+            Convolver reusing the Fourier transforms of the maps. Default is None.
 
         Returns
         -------
@@ -387,16 +500,23 @@ class ExcessMapEstimator(Estimator):
             Reconstructed exposure map.
         """
         if dataset.exposure:
-            with np.errstate(invalid="ignore", divide="ignore"):
-                reco_exposure = reco_exposure.convolve(kernel.data) / mask.convolve(
-                    kernel.data
+            if convolver is None:
+                reco_exposure_conv = reco_exposure.convolve(kernel.data)
+                mask_conv = mask.convolve(kernel.data)
+            else:
+                reco_exposure_conv = convolver(
+                    reco_exposure, kernel.data, name="reco_exposure"
                 )
+                mask_conv = convolver(mask, kernel.data, name="mask")
+
+            with np.errstate(invalid="ignore", divide="ignore"):
+                reco_exposure = reco_exposure_conv / mask_conv
         else:
             reco_exposure = 1
 
         return reco_exposure
 
-    def estimate_excess_map(self, dataset, reco_exposure):
+    def estimate_excess_map(self, dataset, reco_exposure, convolver=None):
         """Estimate excess and test statistic maps for a single dataset.
 
         If exposure is defined, a flux map is also computed.
@@ -405,12 +525,16 @@ class ExcessMapEstimator(Estimator):
         ----------
         dataset : `~gammapy.datasets.MapDataset`
             Map dataset.
+        convolver : `_FFTConvolver`, optional
+            Convolver reusing the Fourier transforms of the maps. Default is None.
         """
         kernel = self.estimate_kernel(dataset)
         geom = dataset.counts.geom
         mask = self.estimate_mask_default(dataset)
 
-        convolved_maps = _get_convolved_maps(dataset, kernel, mask, self.correlate_off)
+        convolved_maps = _get_convolved_maps(
+            dataset, kernel, mask, self.correlate_off, convolver=convolver
+        )
         counts_stat = convolved_map_dataset_counts_statistics(
             convolved_maps=convolved_maps, stat_type=dataset.stat_type
         )
@@ -424,7 +548,7 @@ class ExcessMapEstimator(Estimator):
         maps["sqrt_ts"] = Map.from_geom(geom, data=counts_stat.sqrt_ts)
 
         reco_exposure = self.estimate_exposure_reco_energy(
-            dataset, kernel, mask, reco_exposure
+            dataset, kernel, mask, reco_exposure, convolver=convolver
         )
 
         with np.errstate(invalid="ignore", divide="ignore"):
@@ -1,11 +1,12 @@
 # Licensed under a 3-clause BSD style license - see LICENSE.rst
 import pytest
+import numpy as np
 from numpy.testing import assert_allclose
 import astropy.units as u
-from astropy.convolution import Tophat2DKernel
+from astropy.convolution import Gaussian2DKernel, Tophat2DKernel
 from gammapy.datasets import Datasets, MapDataset, MapDatasetOnOff
 from gammapy.estimators import ASmoothMapEstimator
-from gammapy.maps import Map, MapAxis, WcsNDMap
+from gammapy.maps import Map, MapAxis, WcsGeom, WcsNDMap
 from gammapy.utils.testing import requires_data
 
 
@@ -118,3 +119,39 @@ def test_asmooth_map_dataset_on_off():
     assert_allclose(smoothed["counts"].data[0, 25, 25], 2)
     assert_allclose(smoothed["background"].data[0, 25, 25], 1)
     assert_allclose(smoothed["sqrt_ts"].data[0, 25, 25], 4.39, rtol=1e-2)
+
+
+@pytest.mark.parametrize("kernel", [Tophat2DKernel, Gaussian2DKernel])
+def test_asmooth_fft_convolution(kernel):
+    scales = ASmoothMapEstimator.get_scales(3, factor=2, kernel=kernel) * 0.1 * u.deg
+
+    axis = MapAxis.from_energy_bounds("1 TeV", "10 TeV", nbin=1)
+    geom = WcsGeom.create(npix=(50, 40), binsz=0.02, axes=[axis])
+    dataset = MapDataset.create(geom)
+    dataset.background.data += 2
+    dataset.exposure.data += 1e10
+    dataset.counts.data = np.random.default_rng(0).poisson(3, size=geom.data_shape)
+
+    asmooth = ASmoothMapEstimator(kernel=kernel, scales=scales, threshold=2)
+    smoothed = asmooth.run(dataset)
+
+    asmooth_fft = ASmoothMapEstimator(
+        kernel=kernel, scales=scales, threshold=2, convolution="fft", n_threads=2
+    )
+    smoothed_fft = asmooth_fft.run(dataset)
+
+    for name in ["counts", "background", "scale", "sqrt_ts", "flux"]:
+        assert_allclose(smoothed_fft[name].data, smoothed[name].data, rtol=1e-5)
+
+    cubes = list(asmooth_fft._cubes_cache.values())
+    asmooth_fft.threshold = 3
+    smoothed_fft = asmooth_fft.run(dataset)
+    assert list(asmooth_fft._cubes_cache.values())[0] is cubes[0]
+    assert "cubes_cache" not in str(asmooth_fft)
+
+    asmooth.threshold = 3
+    smoothed = asmooth.run(dataset)
+    assert_allclose(smoothed_fft["sqrt_ts"].data, smoothed["sqrt_ts"].data, rtol=1e-5)
+
+    with pytest.raises(ValueError):
+        ASmoothMapEstimator(convolution="fast")
@@ -406,6 +406,33 @@ def test_excess_map_estimator_map_dataset_on_off_reco_exposure(
     assert_allclose(reco_exposure.data.sum(), 8e12, rtol=0.001)
 
 
+@pytest.mark.parametrize("correlate_off", [True, False])
+def test_excess_map_estimator_correlation_radii(
+    simple_dataset_mask_safe, simple_dataset_on_off, correlate_off
+):
+    radii = [0.05, 0.11, 0.08] * u.deg
+
+    for dataset in [simple_dataset_mask_safe, simple_dataset_on_off]:
+        estimator = ExcessMapEstimator(
+            selection_optional="all", correlate_off=correlate_off
+        )
+        results = estimator.run_correlation_radii(dataset, radii)
+
+        assert len(results) == 3
+        assert_allclose(estimator.correlation_radius, 0.1 * u.deg)
+
+        for radius, result in zip(radii, results):
+            estimator.correlation_radius = radius
+            expected = estimator.run(dataset)
+
+            assert result.available_quantities == expected.available_quantities
+
+            for name in expected.available_quantities:
+                assert_allclose(
+                    result._data[name].data, expected._data[name].data, rtol=1e-5
+                )
+
+
 def test_incorrect_selection():
     with pytest.raises(ValueError):
         ExcessMapEstimator(0.11 * u.deg, selection_optional=["bad"])
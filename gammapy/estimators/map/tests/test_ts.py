@@ -591,6 +591,116 @@ def test_ts_map_with_model(fake_dataset):
     assert_allclose(maps["flux"].data[:, 25, 25], -2.015715e-13, atol=1e-12)
 
 
+@pytest.mark.parametrize(
+    "sum_over_energy_groups, sqrt_ts", [(True, 18.369942), (False, 20.377155)]
+)
+def test_ts_map_vectorized(fake_dataset, sum_over_energy_groups, sqrt_ts):
+    kernel_model = fake_dataset.models["source"]
+    fake_dataset = fake_dataset.copy()
+    fake_dataset.models = []
+
+    kwargs = dict(
+        kernel_model=kernel_model,
+        kernel_width="0.3 deg",
+        selection_optional=["ul", "errn-errp", "sensitivity"],
+        energy_edges=[200, 3500] * u.GeV,
+        sum_over_energy_groups=sum_over_energy_groups,
+        rtol=1e-8,
+    )
+    maps = TSMapEstimator(**kwargs).run(fake_dataset)
+    maps_vectorized = TSMapEstimator(solver="vectorized", **kwargs).run(fake_dataset)
+
+    assert maps_vectorized["success"].data.all()
+    assert_allclose(maps_vectorized["sqrt_ts"].data[:, 25, 25], sqrt_ts, atol=0.1)
+
+    for name in ["ts", "norm", "norm_err", "norm_ul", "norm_errn", "norm_errp"]:
+        assert_allclose(
+            maps_vectorized[name].data, maps[name].data, rtol=1e-3, atol=1e-6
+        )
+
+    for name in ["npred", "npred_excess", "stat", "stat_null"]:
+        assert_allclose(maps_vectorized[name].data, maps[name].data, rtol=1e-6)
+
+    assert_allclose(
+        maps_vectorized["norm_sensitivity"].data,
+        maps["norm_sensitivity"].data,
+        rtol=1e-3,
+    )
+
+
+def test_ts_map_vectorized_threshold(fake_dataset):
+    kernel_model = fake_dataset.models["source"]
+
+    kwargs = dict(
+        kernel_model=kernel_model,
+        threshold=1,
+        selection_optional=[],
+        sum_over_energy_groups=True,
+    )
+    maps = TSMapEstimator(**kwargs).run(fake_dataset)
+    maps_vectorized = TSMapEstimator(solver="vectorized", **kwargs).run(fake_dataset)
+
+    assert_allclose(maps_vectorized["ts"].data, maps["ts"].data, rtol=1e-3, atol=1e-3)
+    assert np.all((maps_vectorized["niter"].data == 0) == (maps["niter"].data == 0))
+
+    with pytest.raises(ValueError):
+        TSMapEstimator(solver="newton")
+
+
+def test_ts_map_tiled(fake_dataset):
+    kernel_model = fake_dataset.models["source"]
+    fake_dataset = fake_dataset.copy()
+    fake_dataset.models = []
+
+    kwargs = dict(
+        kernel_model=kernel_model,
+        kernel_width="0.3 deg",
+        selection_optional=["ul"],
+        energy_edges=[200, 3500] * u.GeV,
+    )
+    maps = TSMapEstimator(**kwargs).run(fake_dataset)
+    maps_tiled = TSMapEstimator(tile_npix=(20, 15), **kwargs).run(fake_dataset)
+
+    assert maps_tiled["ts"].geom == maps["ts"].geom
+    assert maps_tiled.available_quantities == maps.available_quantities
+
+    for name in ["ts", "norm", "norm_err", "norm_ul", "npred", "niter"]:
+        assert_allclose(maps_tiled[name].data, maps[name].data, rtol=1e-10)
+
+    assert_allclose(maps_tiled["success"].data, maps["success"].data)
+
+    with pytest.raises(ValueError):
+        TSMapEstimator(kernel_model=kernel_model, tile_npix=20)
+
+
+def test_ts_map_tiled_downsampling(fake_dataset):
+    kernel_model = fake_dataset.models["source"]
+    fake_dataset = fake_dataset.copy()
+    fake_dataset.models = []
+
+    kwargs = dict(
+        kernel_model=kernel_model,
+        kernel_width="0.3 deg",
+        selection_optional=[],
+        energy_edges=[200, 3500] * u.GeV,
+        downsampling_factor=2,
+    )
+    maps = TSMapEstimator(**kwargs).run(fake_dataset)
+
+    estimator = TSMapEstimator(tile_npix=(15, 13), **kwargs)
+    assert estimator.tile_npix == (16, 14)
+
+    maps_tiled = estimator.run(fake_dataset)
+    assert maps_tiled["ts"].geom == maps["ts"].geom
+
+    # the tiles are aligned with the downsampled grid of the full map, the
+    # remaining differences are within the tolerance of the norm fit
+    for name in ["ts", "norm_err"]:
+        assert_allclose(maps_tiled[name].data, maps[name].data, rtol=1e-4)
+
+    assert_allclose(maps_tiled["norm"].data, maps["norm"].data, atol=1e-6)
+
+
 @requires_data()
 def test_compute_ts_map_with_mask_fit(fake_dataset):
     """Test of compute_ts_image with mask_fit"""
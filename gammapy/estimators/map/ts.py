@@ -7,7 +7,7 @@ from itertools import repeat
 import numpy as np
 import scipy.optimize
 from scipy.interpolate import InterpolatedUnivariateSpline
-from astropy.coordinates import Angle
+from astropy.coordinates import Angle, SkyCoord
 from astropy.utils import lazyproperty
 import gammapy.utils.parallel as parallel
 from gammapy.datasets import Datasets
@@ -34,6 +34,45 @@ from .core import FluxMaps
 
 __all__ = ["TSMapEstimator"]
 
+# Maximum number of array elements per pixel batch of the vectorized solver
+TS_MAP_BATCH_SIZE = 2**22
+
+
+def _get_tile_slices(shape, tile_shape, halo, pad_width=(0, 0), factor=1):
+    """Split an image shape into tiles.
+
+    Parameters
+    ----------
+    shape : tuple of int
+        Image shape.
+    tile_shape : tuple of int
+        Tile shape.
+    halo : tuple of int
+        Margin added around the tiles, clipped at the edges of the padded image.
+    pad_width : tuple of int, optional
+        Number of pixels padded to the edges of the image. Default is (0, 0).
+    factor : int, optional
+        The tiles including the margin start and stop at multiples of ``factor``
+        in the padded image. Default is 1.
+
+    Returns
+    -------
+    tiles : list of tuple
+        Slices of the tiles and of the tiles including the margin, in pixels of
+        the image. The latter can extend beyond the image if it is padded.
+    """
+    tiles = []
+    for idx in np.ndindex(*[-(-n // t) for n, t in zip(shape, tile_shape)]):
+        slices, slices_halo = [], []
+        for i, n, t, h, p in zip(idx, shape, tile_shape, halo, pad_width):
+            start, stop = i * t, min((i + 1) * t, n)
+            slices.append(slice(start, stop))
+            start_halo = max((start + p - h) // factor * factor, 0)
+            stop_halo = min(-(-(stop + p + h) // factor) * factor, n + 2 * p)
+            slices_halo.append(slice(start_halo - p, stop_halo - p))
+        tiles.append((tuple(slices), tuple(slices_halo)))
+    return tiles
+
 
 def _extract_array(array, shape, position):
     """Helper function to extract parts of a larger array.
@@ -142,9 +181,29 @@ class TSMapEstimator(Estimator, parallel.ParallelMixin):
         Default is None and a new parameter is created automatically,
         with value=1, name="norm", scan_min=-100, scan_max=100,
         and values sampled such as we can probe a 0.1% relative error on the norm.
+        The likelihood profile is evaluated in closed form on these fixed values,
+        there is no adaptive scan as with ``scan_accuracy`` in
+        `~gammapy.estimators.FluxPointsEstimator`.
     max_niter : int, optional
         Maximal number of iterations used by the root finding algorithm.
         Default is 100.
+    solver : {"brentq", "vectorized"}, optional
+        Solver used for the norm fit. "brentq" fits each pixel separately
+        using `~scipy.optimize.brentq`. "vectorized" solves batches of pixels
+        at once with a safeguarded Newton method, including upper limits,
+        asymmetric errors and sensitivity. This is much faster for large maps.
+        The likelihood profile ("stat_scan") is still computed per pixel.
+        Default is "brentq".
+    tile_npix : int or tuple of int, optional
+        Number of pixels (lon, lat) of the tiles used to split the map. Each
+        tile is estimated independently, including a margin of half the kernel
+        width, and the results are stitched together. The input datasets are
+        kept in memory, tiling only limits the memory used by the intermediate
+        maps of the estimation (padded, downsampled and flux maps, fit
+        statistic scans). Requires ``kernel_width`` to be set. The
+        kernel is computed at the center of each tile. The tile size is rounded
+        up to a multiple of ``downsampling_factor``. Default is None, which
+        estimates the full map at once.
 
     Notes
     -----
@@ -212,6 +271,8 @@ class TSMapEstimator(Estimator, parallel.ParallelMixin):
         parallel_backend=None,
         norm=None,
         max_niter=100,
+        solver="brentq",
+        tile_npix=None,
     ):
         if kernel_width is not None:
             kernel_width = Angle(kernel_width)
@@ -241,9 +302,33 @@ class TSMapEstimator(Estimator, parallel.ParallelMixin):
         self.sum_over_energy_groups = sum_over_energy_groups
         self.max_niter = max_niter
 
+        if solver not in ["brentq", "vectorized"]:
+            raise ValueError(
+                f"Invalid solver: '{solver}', choose from 'brentq' or 'vectorized'"
+            )
+
+        self.solver = solver
+
+        if tile_npix is not None:
+            if kernel_width is None:
+                raise ValueError("Tiled TS map estimation requires a kernel_width.")
+            tile_npix = np.broadcast_to(tile_npix, (2,)).astype(int)
+            if downsampling_factor:
+                # tiles have to be a multiple of the downsampling factor
+                tile_npix = -(-tile_npix // downsampling_factor) * downsampling_factor
+            tile_npix = tuple(tile_npix)
+
+        self.tile_npix = tile_npix
+
         self.selection_optional = selection_optional
         self.energy_edges = energy_edges
-        self._flux_estimator = BrentqFluxEstimator(
+
+        flux_estimator_cls = {
+            "brentq": BrentqFluxEstimator,
+            "vectorized": VectorizedFluxEstimator,
+        }[solver]
+
+        self._flux_estimator = flux_estimator_cls(
             rtol=self.rtol,
             n_sigma=self.n_sigma,
             n_sigma_ul=self.n_sigma_ul,
@@ -520,31 +605,14 @@ class TSMapEstimator(Estimator, parallel.ParallelMixin):
             )
 
         x, y = np.nonzero(np.squeeze(mask_2d))
-        positions = list(zip(x, y))
 
-        inputs = zip(
-            positions,
-            repeat([_["counts"].data.astype(float) for _ in maps]),
-            repeat([_["exposure"].data.astype(float) for _ in maps]),
-            repeat([_["background"].data.astype(float) for _ in maps]),
-            repeat([_["kernel"].data for _ in maps]),
-            repeat([_["norm"].data for _ in maps]),
-            repeat([_["weights"] for _ in maps]),
-            repeat(self._flux_estimator),
-        )
-
-        results = parallel.run_multiprocessing(
-            _ts_value,
-            inputs,
-            backend=self.parallel_backend,
-            pool_kwargs=dict(processes=self.n_jobs),
-            task_name="TS map",
-        )
+        if self.solver == "vectorized":
+            results = self._estimate_flux_values_vectorized(maps, x, y)
+        else:
+            results = self._estimate_flux_values(maps, x, y)
 
         result = {}
 
-        j, i = zip(*positions)
-
         geom = maps[0]["counts"].geom.squash(axis_name="energy")
         energy_axis = geom.axes["energy"]
         dnde_ref = self.kernel_model.spectral_model(energy_axis.center)
@@ -552,7 +620,7 @@ class TSMapEstimator(Estimator, parallel.ParallelMixin):
         for name in self.selection_all:
             if name in ["dnde_scan_values", "stat_scan"]:
                 norm_bin_axis = MapAxis(
-                    range(len(results[0]["dnde_scan_values"])),
+                    range(results["dnde_scan_values"].shape[1]),
                     interp="lin",
                     node_type="center",
                     name="dnde_bin",
@@ -569,15 +637,84 @@ class TSMapEstimator(Estimator, parallel.ParallelMixin):
                     factor = 1
 
                 m = Map.from_geom(geom_scan, data=np.nan, unit=unit)
-                m.data[:, 0, j, i] = np.array([_[name] for _ in results]).T * factor
+                m.data[:, 0, x, y] = results[name].T * factor
 
             else:
                 m = Map.from_geom(geom=geom, data=np.nan, unit="")
-                m.data[0, j, i] = [_[name] for _ in results]
+                m.data[0, x, y] = results[name]
             result[name] = m
 
         return result
 
+    def _estimate_flux_values(self, maps, x, y):
+        """Fit the norm pixel by pixel."""
+        inputs = zip(
+            zip(x, y),
+            repeat([_["counts"].data.astype(float) for _ in maps]),
+            repeat([_["exposure"].data.astype(float) for _ in maps]),
+            repeat([_["background"].data.astype(float) for _ in maps]),
+            repeat([_["kernel"].data for _ in maps]),
+            repeat([_["norm"].data for _ in maps]),
+            repeat([_["weights"] for _ in maps]),
+            repeat(self._flux_estimator),
+        )
+
+        results = parallel.run_multiprocessing(
+            _ts_value,
+            inputs,
+            backend=self.parallel_backend,
+            pool_kwargs=dict(processes=self.n_jobs),
+            task_name="TS map",
+        )
+        return {name: np.array([_[name] for _ in results]) for name in results[0]}
+
+    def _estimate_flux_values_vectorized(self, maps, x, y):
+        """Fit the norm for batches of pixels at once."""
+        kernels = [_["kernel"].data for _ in maps]
+
+        # pad by the kernel half width, so that the cutouts never leave the map
+        def pad(data, kernel):
+            pad_width = [(0, 0)] + [(n // 2, n // 2) for n in kernel.shape[1:]]
+            return np.pad(data.astype(float), pad_width)
+
+        counts, exposure, background, weights = [], [], [], []
+
+        for m, kernel in zip(maps, kernels):
+            counts.append(pad(m["counts"].data, kernel))
+            exposure.append(pad(m["exposure"].data, kernel))
+            background.append(pad(m["background"].data, kernel))
+            if m["weights"] is not None:
+                weights.append(pad(m["weights"].data, kernel))
+            else:
+                weights.append(None)
+
+        n_bins = sum(kernel.size for kernel in kernels)
+        batch_size = max(1, TS_MAP_BATCH_SIZE // n_bins)
+        batches = [
+            (x[idx : idx + batch_size], y[idx : idx + batch_size])
+            for idx in range(0, len(x), batch_size)
+        ]
+
+        inputs = zip(
+            batches,
+            repeat(counts),
+            repeat(exposure),
+            repeat(background),
+            repeat(kernels),
+            repeat([_["norm"].data for _ in maps]),
+            repeat(weights),
+            repeat(self._flux_estimator),
+        )
+
+        results = parallel.run_multiprocessing(
+            _ts_values,
+            inputs,
+            backend=self.parallel_backend,
+            pool_kwargs=dict(processes=self.n_jobs),
+            task_name="TS map",
+        )
+        return {name: np.concatenate([_[name] for _ in results]) for name in results[0]}
+
     def run(self, datasets):
         """Run test statistic map estimation.
 
@@ -620,16 +757,30 @@ class TSMapEstimator(Estimator, parallel.ParallelMixin):
             if dataset.counts.geom.to_image() != geom_ref.to_image():
                 raise TypeError("Datasets geometries must match")
 
+        if self.tile_npix is not None:
+            return self._run_tiled(datasets)
+
+        return self._run(datasets)
+
+    def _run(self, datasets, pad_width=None):
+        """Run test statistic map estimation on the full map.
+
+        The datasets are padded by ``pad_width``, which is estimated from the
+        kernel size by default.
+        """
         datasets_models = datasets.models
 
-        pad_width = (0, 0)
+        pad_width_max = (0, 0)
         kernel_width = 0 * u.deg
         for dataset in datasets:
             pad_width_dataset = self.estimate_pad_width(dataset=dataset)
             kernel_width_dataset = np.max(self.estimate_kernel(dataset).geom.width)
-            pad_width = tuple(np.maximum(pad_width, pad_width_dataset))
+            pad_width_max = tuple(np.maximum(pad_width_max, pad_width_dataset))
             kernel_width = np.maximum(kernel_width, kernel_width_dataset)
 
+        if pad_width is None:
+            pad_width = pad_width_max
+
         if self.kernel_width is None:
             self.kernel_width = kernel_width
 
@@ -683,6 +834,85 @@ class TSMapEstimator(Estimator, parallel.ParallelMixin):
             meta=meta,
         )
 
+    def _run_tiled(self, datasets):
+        """Run test statistic map estimation tile by tile.
+
+        With downsampling, the tiles are aligned with the downsampled pixels of
+        the padded full map, so that the result is the same as for the full map
+        within the tolerance of the norm fit.
+        """
+        factor = self.downsampling_factor or 1
+        geom_image = datasets[0].counts.geom.to_image()
+        binsz = geom_image.pixel_scales
+
+        halo = np.zeros(2, dtype=int)
+        pad_width = (0, 0)
+        for dataset in datasets:
+            kernel = self.estimate_kernel(dataset)
+            halo = np.maximum(halo, np.array(kernel.geom.to_image().data_shape) // 2)
+            pad_width = tuple(np.maximum(pad_width, self.estimate_pad_width(dataset)))
+
+        pad, mode, pad_width_tile = (0, 0), "trim", None
+
+        if factor > 1:
+            # downsampled kernel and one more pixel for the upsampling
+            halo = (-(-halo // factor) + 1) * factor
+            geom_padded = geom_image.pad(pad_width, axis_name=None)
+            pad = (np.array(geom_padded.data_shape) - geom_image.data_shape) // 2
+            # the padding of the full map is included in the tiles, which are
+            # only padded by a multiple of the factor to keep the alignment
+            mode, pad_width_tile = "partial", tuple(halo[::-1])
+
+        maps, meta = Maps(), None
+
+        tiles = _get_tile_slices(
+            geom_image.data_shape,
+            self.tile_npix[::-1],
+            halo,
+            pad_width=pad,
+            factor=factor,
+        )
+
+        for slices, slices_halo in progress_bar(tiles, desc="Tiles"):
+            npix = np.array([_.stop - _.start for _ in slices_halo])
+            pix = [(_.start + _.stop - 1) / 2 for _ in slices_halo]
+            position = geom_image.pix_to_coord(pix[::-1])
+            position = SkyCoord(*position, frame=geom_image.frame)
+
+            datasets_tile = Datasets()
+            for dataset in datasets:
+                dataset_tile = dataset.cutout(
+                    position=position,
+                    width=npix[::-1] * binsz,
+                    mode=mode,
+                    name=dataset.name,
+                )
+                dataset_tile.models = dataset.models
+                datasets_tile.append(dataset_tile)
+
+            result = self._run(datasets_tile, pad_width=pad_width_tile)
+            meta = result.meta
+
+            slices_tile = tuple(
+                slice(_.start - h.start, _.stop - h.start)
+                for _, h in zip(slices, slices_halo)
+            )
+
+            for name, m in result._data.items():
+                if name not in maps:
+                    geom = geom_image.to_cube(m.geom.axes)
+                    maps[name] = Map.from_geom(geom, unit=m.unit, dtype=m.data.dtype)
+                maps[name].data[(Ellipsis,) + slices] = m.data[
+                    (Ellipsis,) + slices_tile
+                ]
+
+        return FluxMaps(
+            data=maps,
+            reference_model=self.kernel_model,
+            gti=datasets[0].gti,
+            meta=meta,
+        )
+
 
 # TODO: merge with MapDataset?
 class SimpleMapDataset:
@@ -1131,3 +1361,518 @@ def _ts_value(
         norm_guess=norm_guess,
     )
     return flux_estimator.run(dataset)
+
+
+class VectorizedMapDataset:
+    """Batch of simple map datasets, one per pixel.
+
+    All arrays have shape (n_pixels, n_bins). Bins without counts, background
+    and model are excluded by the mask.
+
+    Parameters
+    ----------
+    model : `~numpy.ndarray`
+        Kernel array.
+    counts : `~numpy.ndarray`
+        Counts array.
+    background : `~numpy.ndarray`
+        Background array.
+    norm_guess : `~numpy.ndarray`
+        Initial norm values.
+    mask : `~numpy.ndarray`
+        Mask of valid bins.
+    """
+
+    def __init__(self, model, counts, background, norm_guess, mask):
+        self.model = model
+        self.counts = counts
+        self.background = background
+        self.norm_guess = norm_guess
+        self.mask = mask
+
+        self._truncation_value = get_fit_statistics_compiled()["TRUNCATION_VALUE"]
+
+    def __len__(self):
+        return len(self.norm_guess)
+
+    def __getitem__(self, idx):
+        return self.__class__(
+            model=self.model[idx],
+            counts=self.counts[idx],
+            background=self.background[idx],
+            norm_guess=self.norm_guess[idx],
+            mask=self.mask[idx],
+        )
+
+    def to_simple_dataset(self, idx):
+        """Simple map dataset of a single pixel."""
+        mask = self.mask[idx]
+        return SimpleMapDataset(
+            model=self.model[idx][mask],
+            counts=self.counts[idx][mask],
+            background=self.background[idx][mask],
+            norm_guess=self.norm_guess[idx],
+        )
+
+    @lazyproperty
+    def norm_bounds(self):
+        """Bounds for x, see `~gammapy.stats.fit_statistics_jit.norm_bounds_jit`."""
+        has_counts, has_model = self.counts > 0, self.model > 0
+
+        with np.errstate(invalid="ignore", divide="ignore"):
+            sn = self.background / self.model
+
+        sn_valid = np.where(has_counts & has_model, sn, np.inf)
+        idx_min = np.argmin(sn_valid, axis=1)[:, None]
+        sn_min = np.take_along_axis(sn_valid, idx_min, axis=1)[:, 0]
+        c_min = np.take_along_axis(self.counts, idx_min, axis=1)[:, 0]
+
+        is_found = sn_min < 1e14
+        sn_min = np.where(is_found, sn_min, 1e14)
+        c_min = np.where(is_found, c_min, 1.0)
+
+        sn_min_total = np.min(np.where(has_model, sn, 1e14), axis=1, initial=1e14)
+
+        s_counts = np.sum(self.counts, axis=1, where=has_counts)
+        s_model = np.sum(self.model, axis=1, where=has_model)
+
+        with np.errstate(invalid="ignore", divide="ignore"):
+            norm_min = np.where(s_model > 0, c_min / s_model - sn_min, np.nan)
+            norm_max = np.where(s_model > 0, s_counts / s_model - sn_min, np.nan)
+
+        return norm_min, norm_max, -sn_min_total
+
+    def _cash_sum(self, counts, npred):
+        npred = np.maximum(npred, self._truncation_value)
+        stat = npred - np.where(counts > 0, counts * np.log(npred), 0)
+        return 2 * np.sum(stat, axis=1, where=self.mask)
+
+    def npred(self, norm):
+        """Predicted number of counts."""
+        return self.background + np.reshape(norm, (-1, 1)) * self.model
+
+    def stat_sum(self, norm):
+        """Statistics sum."""
+        return self._cash_sum(self.counts, self.npred(norm))
+
+    def stat_sum_asimov(self, norm):
+        """Statistics sum."""
+        return self._cash_sum(self.npred(norm), self.npred(norm))
+
+    def stat_sum_asimov_null(self, norm):
+        """Statistics sum."""
+        return self._cash_sum(self.npred(norm), self.background)
+
+    def stat_derivative(self, norm):
+        """Statistics derivative, see `~gammapy.stats.fit_statistics_jit.f_cash_root_jit`."""
+        denom = self.npred(norm)
+
+        with np.errstate(invalid="ignore", divide="ignore"):
+            value = np.where(denom != 0, self.model * (1 - self.counts / denom), 0)
+
+        value = np.where(self.counts > 0, value, self.model)
+        return 2 * np.sum(value, axis=1, where=self.model > 0)
+
+    def stat_2nd_derivative(self, norm):
+        """Statistics 2nd derivative."""
+        term_top = self.model**2 * self.counts
+        term_bottom = self.npred(norm) ** 2
+
+        with np.errstate(invalid="ignore", divide="ignore"):
+            value = term_top / term_bottom
+
+        return np.sum(value, axis=1, where=self.mask & (term_bottom != 0))
+
+    @classmethod
+    def from_arrays(
+        cls, counts, background, exposure, norm, positions, kernel, weights
+    ):
+        """Create from padded arrays and pixel positions.
+
+        The counts, background, exposure and weights arrays must be padded
+        by half the kernel width.
+        """
+        x, y = positions
+        shape = kernel.shape
+
+        def cutouts(data):
+            windows = np.lib.stride_tricks.sliding_window_view(
+                data, shape[1:], axis=(1, 2)
+            )
+            return np.moveaxis(windows[:, x, y], 1, 0)
+
+        if weights is not None:
+            # compute mask weighted kernel for the sum_over_axes case
+            weights = cutouts(weights)
+            kernel = (kernel * weights).sum(axis=1, keepdims=True)
+            with np.errstate(invalid="ignore", divide="ignore"):
+                kernel /= weights.sum(axis=1, keepdims=True)
+                kernel[~np.isfinite(kernel)] = 0
+
+        counts = cutouts(counts).reshape((len(x), -1))
+        background = cutouts(background).reshape((len(x), -1))
+        model = (kernel * cutouts(exposure)).reshape((len(x), -1))
+        mask = ~((counts == 0) & (background == 0) & (model == 0))
+        return cls(
+            counts=counts,
+            background=background,
+            model=model,
+            norm_guess=norm[0, x, y],
+            mask=mask,
+        )
+
+
+def _find_roots_vectorized(
+    f, lower_bound, upper_bound, fprime=None, x0=None, rtol=1e-2, maxiter=100
+):
+    """Find the roots of a vectorized function within the given brackets.
+
+    Uses Newton steps if the derivative is given and the Illinois variant of
+    the false position method otherwise. Steps leaving the bracket are
+    replaced by bisection steps.
+
+    Parameters
+    ----------
+    f : callable
+        Function returning an array of values for an array of positions.
+    lower_bound, upper_bound : `~numpy.ndarray`
+        Brackets of the roots.
+    fprime : callable, optional
+        Derivative of the function. Default is None.
+    x0 : `~numpy.ndarray`, optional
+        Starting values, used if within the brackets. Default is None.
+    rtol : float, optional
+        Relative tolerance. Default is 1e-2.
+    maxiter : int, optional
+        Maximum number of iterations. Default is 100.
+
+    Returns
+    -------
+    roots : `~numpy.ndarray`
+        Roots, NaN if the function does not change sign within the bracket
+        or the solver did not converge.
+    niter : `~numpy.ndarray`
+        Number of iterations.
+    success : `~numpy.ndarray`
+        Whether the solver converged.
+    """
+    xtol = 2e-12
+    a = np.array(lower_bound, dtype=float)
+    b = np.array(upper_bound, dtype=float)
+
+    with np.errstate(all="ignore"):
+        fa, fb = f(np.nan_to_num(a)), f(np.nan_to_num(b))
+        valid = np.isfinite(a) & np.isfinite(b) & (fa * fb <= 0)
+
+    roots = np.full(a.shape, np.nan)
+    roots[valid & (fb == 0)] = b[valid & (fb == 0)]
+    roots[valid & (fa == 0)] = a[valid & (fa == 0)]
+
+    niter = np.zeros(a.shape, dtype=int)
+    success = valid & ((fa == 0) | (fb == 0))
+    active = valid & ~success
+
+    retained = np.zeros(a.shape, dtype=int)
+
+    with np.errstate(all="ignore"):
+        x = np.where(active, (a + b) / 2, 0)
+        if x0 is not None:
+            inside = (x0 - a) * (x0 - b) < 0
+            x = np.where(active & inside, x0, x)
+
+        for _ in range(maxiter):
+            if not np.any(active):
+                break
+
+            niter[active] += 1
+            fx = f(x)
+
+            # update brackets
+            left = active & (np.sign(fx) == np.sign(fa))
+            right = active & ~left
+            a, fa = np.where(left, x, a), np.where(left, fx, fa)
+            b, fb = np.where(right, x, b), np.where(right, fx, fb)
+
+            if fprime is not None:
+                x_new = x - fx / fprime(x)
+            else:
+                # Illinois: halve the function value of a twice retained end
+                fb = np.where(left & (retained == 1), fb / 2, fb)
+                fa = np.where(right & (retained == -1), fa / 2, fa)
+                retained = np.where(left, 1, np.where(right, -1, 0))
+                x_new = (a * fb - b * fa) / (fb - fa)
+
+            inside = (x_new - a) * (x_new - b) < 0
+            x_new = np.where(inside, x_new, (a + b) / 2)
+
+            tol = xtol + rtol * np.abs(x_new)
+            converged = (fx == 0) | (np.abs(b - a) < 2 * tol)
+
+            if fprime is not None:
+                # the false position step size is not a convergence criterion
+                converged |= np.abs(x_new - x) < tol
+
+            converged &= active
+            roots[converged] = np.where(fx == 0, x, x_new)[converged]
+            success |= converged
+            active &= ~converged
+            x = np.where(active, x_new, x)
+
+    return roots, niter, success
+
+
+class VectorizedFluxEstimator(BrentqFluxEstimator):
+    """Single parameter flux estimator for batches of pixels.
+
+    Same as `BrentqFluxEstimator`, but operates on a `VectorizedMapDataset`
+    and returns arrays of results.
+    """
+
+    tag = "VectorizedFluxEstimator"
+
+    def estimate_best_fit(self, dataset):
+        """Estimate best fit norm parameter.
+
+        Parameters
+        ----------
+        dataset : `VectorizedMapDataset`
+            Vectorized map dataset.
+
+        Returns
+        -------
+        result : dict
+            Result dictionary including 'norm' and 'norm_err'.
+        """
+        norm_min, norm_max, norm_min_total = dataset.norm_bounds
+
+        is_empty = (dataset.counts.sum(axis=1) <= 0) | (dataset.model.sum(axis=1) <= 0)
+        norm_max = np.where(is_empty, np.nan, norm_max)
+
+        norm, niter, success = _find_roots_vectorized(
+            f=dataset.stat_derivative,
+            lower_bound=norm_min,
+            upper_bound=norm_max,
+            fprime=lambda x: 2 * dataset.stat_2nd_derivative(x),
+            x0=dataset.norm_guess,
+            rtol=self.rtol,
+            maxiter=self.max_niter,
+        )
+
+        norm = np.where(success, np.maximum(norm, norm_min_total), norm_min_total)
+        niter = np.where(success, niter, self.max_niter)
+        niter[is_empty], success[is_empty] = 0, True
+
+        with np.errstate(invalid="ignore", divide="ignore"):
+            norm_err = np.sqrt(1 / dataset.stat_2nd_derivative(norm)) * self.n_sigma
+
+        stat = dataset.stat_sum(norm=norm)
+        stat_null = dataset.stat_sum(norm=0)
+
+        return {
+            "norm": norm,
+            "norm_err": norm_err,
+            "niter": niter,
+            "ts": stat_null - stat,
+            "stat": stat,
+            "stat_null": stat_null,
+            "success": success,
+        }
+
+    def _confidence(self, dataset, n_sigma, result, positive):
+        stat_best = result["stat"]
+        norm = result["norm"]
+        norm_err = result["norm_err"]
+
+        def ts_diff(x):
+            return (stat_best + n_sigma**2) - dataset.stat_sum(x)
+
+        if positive:
+            min_norm = norm
+            max_norm = norm + 1e2 * norm_err
+            factor = 1
+        else:
+            min_norm = norm - 1e2 * norm_err
+            max_norm = norm
+            factor = -1
+
+        roots, _, success = _find_roots_vectorized(
+            ts_diff, min_norm, max_norm, rtol=self.rtol, maxiter=self.max_niter
+        )
+        # Where the root finding fails NaN is set as norm
+        roots[~success] = np.nan
+        return (roots - norm) * factor
+
+    def estimate_sensitivity(self, dataset, result):
+        norm = result["norm"]
+
+        def sigma_diff(x):
+            ts_asimov = dataset.stat_sum_asimov_null(x) - dataset.stat_sum_asimov(x)
+            return (
+                ts_to_sigma(ts_asimov, ts_asimov=ts_asimov) - self.n_sigma_sensitivity
+            )
+
+        roots, _, success = _find_roots_vectorized(
+            sigma_diff,
+            norm / 1000.0,
+            norm * 1000.0,
+            rtol=self.rtol,
+            maxiter=self.max_niter,
+        )
+        # Where the root finding fails NaN is set as norm
+        roots[~success] = np.nan
+        return {"norm_sensitivity": roots}
+
+    def estimate_scan(self, dataset, result):
+        """Compute likelihood profile pixel by pixel.
+
+        Parameters
+        ----------
+        dataset : `VectorizedMapDataset`
+            Vectorized map dataset.
+
+        Returns
+        -------
+        result : dict
+            Result dictionary including 'stat_scan'.
+        """
+        results = []
+        for idx in range(len(dataset)):
+            result_pixel = {key: value[idx] for key, value in result.items()}
+            results.append(
+                super().estimate_scan(dataset.to_simple_dataset(idx), result_pixel)
+            )
+        return {key: np.array([_[key] for _ in results]) for key in results[0]}
+
+    def estimate_default(self, dataset):
+        """Estimate default norm.
+
+        Parameters
+        ----------
+        dataset : `VectorizedMapDataset`
+            Vectorized map dataset.
+
+        Returns
+        -------
+        result : dict
+            Result dictionary including 'norm', 'norm_err' and "niter".
+        """
+        norm = dataset.norm_guess.copy()
+
+        with np.errstate(invalid="ignore", divide="ignore"):
+            norm_err = np.sqrt(1 / dataset.stat_2nd_derivative(norm)) * self.n_sigma
+
+        stat = dataset.stat_sum(norm=norm)
+        stat_null = dataset.stat_sum(norm=0)
+
+        return {
+            "norm": norm,
+            "norm_err": norm_err,
+            "niter": np.zeros(len(dataset), dtype=int),
+            "ts": stat_null - stat,
+            "stat": stat,
+            "stat_null": stat_null,
+            "success": np.ones(len(dataset), dtype=bool),
+        }
+
+    def run(self, dataset):
+        """Run flux estimator.
+
+        Parameters
+        ----------
+        dataset : `VectorizedMapDataset`
+            Vectorized map dataset.
+
+        Returns
+        -------
+        result : dict
+            Result dictionary of arrays.
+        """
+        if self.ts_threshold is not None:
+            result = self.estimate_default(dataset)
+            is_fit = result["ts"] > self.ts_threshold
+            if np.any(is_fit):
+                result_fit = self.estimate_best_fit(dataset[is_fit])
+                for key, value in result_fit.items():
+                    result[key][is_fit] = value
+        else:
+            result = self.estimate_best_fit(dataset)
+
+        if "ul" in self.selection_optional:
+            result.update(self.estimate_ul(dataset, result))
+
+        if "errn-errp" in self.selection_optional:
+            result.update(self.estimate_errn_errp(dataset, result))
+
+        if "stat_scan" in self.selection_optional:
+            result.update(self.estimate_scan(dataset, result))
+
+        if "sensitivity" in self.selection_optional:
+            result.update(self.estimate_sensitivity(dataset, result))
+
+        norm = result["norm"]
+        result["npred"] = dataset.npred(norm=norm).sum(axis=1)
+        result["npred_excess"] = result["npred"] - dataset.background.sum(axis=1)
+        result["stat"] = dataset.stat_sum(norm=norm)
+
+        return result
+
+
+def _ts_values(
+    positions, counts, exposure, background, kernel, norm, weights, flux_estimator
+):
+    """Compute test statistic values for a batch of pixel positions.
+
+    Vectorized version of `_ts_value`. The counts, exposure, background and
+    weights images must be padded by half the kernel width.
+
+    Parameters
+    ----------
+    positions : tuple of `~numpy.ndarray`
+        Pixel positions.
+    counts : list of `~numpy.ndarray`
+        Counts images.
+    exposure : list of `~numpy.ndarray`
+        Exposure images.
+    background : list of `~numpy.ndarray`
+        Background images.
+    kernel : list of `~numpy.ndarray`
+        Source model kernels.
+    norm : list of `~numpy.ndarray`
+        Norm images, used as starting values for the minimization.
+    weights : list of `~numpy.ndarray`
+        Weight cubes for the sum over energy groups, or None.
+    flux_estimator : `VectorizedFluxEstimator`
+        Flux estimator.
+
+    Returns
+    -------
+    result : dict
+        Result dictionary of arrays.
+    """
+    datasets = [
+        VectorizedMapDataset.from_arrays(
+            counts=counts[idx],
+            background=background[idx],
+            exposure=exposure[idx],
+            norm=norm[idx],
+            positions=positions,
+            kernel=kernel[idx],
+            weights=weights[idx],
+        )
+        for idx in range(len(counts))
+    ]
+
+    norm_guess = np.array([d.norm_guess for d in datasets])
+    mask_valid = np.isfinite(norm_guess)
+    n_valid = mask_valid.sum(axis=0)
+    norm_guess = np.where(mask_valid, norm_guess, 0).sum(axis=0)
+    norm_guess = np.where(n_valid > 0, norm_guess / np.maximum(n_valid, 1), 1.0)
+
+    dataset = VectorizedMapDataset(
+        counts=np.concatenate([d.counts for d in datasets], axis=1),
+        background=np.concatenate([d.background for d in datasets], axis=1),
+        model=np.concatenate([d.model for d in datasets], axis=1),
+        norm_guess=norm_guess,
+        mask=np.concatenate([d.mask for d in datasets], axis=1),
+    )
+    return flux_estimator.run(dataset)
@@ -9,11 +9,14 @@ from gammapy.modeling import Fit
 from gammapy.modeling.selection import NestedModelSelection
 from gammapy.modeling.parameter import restore_parameters_status
 from gammapy.stats.utils import ts_to_sigma
+from gammapy.utils.interpolation import interpolate_profile, interpolation_scale
 from gammapy.utils.roots import find_roots
 from .core import Estimator
 
 log = logging.getLogger(__name__)
 
+ADAPTIVE_SCAN_N_INIT = 5
+
 __all__ = ["ParameterEstimator", "ParameterSensitivityEstimator"]
 
 
@@ -51,6 +54,14 @@ class ParameterEstimator(Estimator):
         internally. Default is None.
     reoptimize : bool, optional
         Re-optimize other free model parameters. Default is True.
+    scan_accuracy : float, optional
+        If given, the fit statistic profile is computed with an adaptive scan.
+        The profile is first evaluated on a few coarse values and the best fit value.
+        Intervals within the delta fit statistic region of interest are then bisected
+        until the profile interpolated with `~gammapy.utils.interpolation.interpolate_profile`
+        predicts the fit statistic to within ``scan_accuracy``. The profile is returned
+        on the parameter scan values and is evaluated at most ``scan_n_values`` times.
+        Default is None, which evaluates the fit statistic at all scan values.
 
     Examples
     --------
@@ -85,6 +96,7 @@ class ParameterEstimator(Estimator):
         selection_optional=None,
         fit=None,
         reoptimize=True,
+        scan_accuracy=None,
     ):
         self.n_sigma = n_sigma
         self.n_sigma_ul = n_sigma_ul
@@ -97,6 +109,7 @@ class ParameterEstimator(Estimator):
 
         self.fit = fit
         self.reoptimize = reoptimize
+        self.scan_accuracy = scan_accuracy
 
     def estimate_best_fit(self, datasets, parameter):
         """Estimate parameter asymmetric errors.
@@ -239,15 +252,78 @@ class ParameterEstimator(Estimator):
 
         self.fit.optimize(datasets=datasets)
 
-        profile = self.fit.stat_profile(
-            datasets=datasets, parameter=parameter, reoptimize=self.reoptimize
-        )
+        if self.scan_accuracy is None:
+            profile = self.fit.stat_profile(
+                datasets=datasets, parameter=parameter, reoptimize=self.reoptimize
+            )
+            stat_scan = profile["stat_scan"]
+        else:
+            stat_scan = self._estimate_adaptive_scan(datasets, parameter)
 
         return {
             f"{parameter.name}_scan": scan_values,
-            "stat_scan": profile["stat_scan"],
+            "stat_scan": stat_scan,
         }
 
+    def _stat_profile(self, datasets, parameter, values):
+        """Compute the fit statistic profile for the given parameter values."""
+        scan_values = parameter._scan_values
+        parameter.scan_values = values
+
+        try:
+            profile = self.fit.stat_profile(
+                datasets=datasets, parameter=parameter, reoptimize=self.reoptimize
+            )
+        finally:
+            parameter.scan_values = scan_values
+
+        return profile["stat_scan"]
+
+    def _estimate_adaptive_scan(self, datasets, parameter):
+        """Estimate the fit statistic profile with an adaptive scan.
+
+        The fit statistic is evaluated on the scan range end points, a coarse grid
+        and the best fit value. Intervals touching the region of interest are
+        bisected in the parameter interpolation scale, until the fit statistic at
+        the interval centre is predicted to within ``scan_accuracy`` or the
+        number of evaluations reaches ``scan_n_values``.
+        """
+        values = parameter.scan_values
+        scale = interpolation_scale(parameter.interp)
+        stat_roi = (max(self.n_sigma, self.n_sigma_ul) + 1) ** 2
+
+        x = scale.inverse(np.linspace(*scale(values[[0, -1]]), ADAPTIVE_SCAN_N_INIT))
+        x[[0, -1]] = values[[0, -1]]
+
+        if values[0] < parameter.value < values[-1]:
+            x = np.append(x, parameter.value)
+
+        x = np.unique(x)
+        stat = self._stat_profile(datasets, parameter, x)
+        converged = np.zeros(len(x) - 1, dtype=bool)
+        n_max = max(len(values), len(x))
+
+        while len(x) < n_max:
+            interp = interpolate_profile(x, stat)
+            delta_stat = stat - np.nanmin(stat)
+            in_roi = np.fmin(delta_stat[:-1], delta_stat[1:]) <= stat_roi
+
+            idx = np.where(in_roi & ~converged)[0][: n_max - len(x)]
+
+            if len(idx) == 0:
+                break
+
+            x_mid = scale.inverse(0.5 * (scale(x[idx]) + scale(x[idx + 1])))
+            stat_mid = self._stat_profile(datasets, parameter, x_mid)
+            is_accurate = np.abs(interp(x_mid) - stat_mid) <= self.scan_accuracy
+
+            x = np.insert(x, idx + 1, x_mid)
+            stat = np.insert(stat, idx + 1, stat_mid)
+            converged = np.insert(converged, idx + 1, is_accurate)
+            converged[idx + np.arange(len(idx))] = is_accurate
+
+        return interpolate_profile(x, stat)(values)
+
     def estimate_ul(self, datasets, parameter):
         """Estimate parameter ul.
 
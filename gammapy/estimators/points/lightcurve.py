@@ -35,6 +35,10 @@ class LightCurveEstimator(FluxPointsEstimator):
     Time intervals without any dataset GTI fully overlapping will be dropped. They will not
     be stored in the final lightcurve `FluxPoints` object.
 
+    The norm fit in each time interval is started from the best-fit norms of the previous
+    interval. When running in parallel, the time intervals are distributed over the jobs
+    in contiguous chunks.
+
     Parameters
     ----------
     time_intervals : list of `~astropy.time.Time` objects
@@ -93,6 +97,9 @@ class LightCurveEstimator(FluxPointsEstimator):
         unless the source model does not have one and only one norm parameter.
         If a dict is given the entries should be a subset of
         `~gammapy.modeling.Parameter` arguments.
+    scan_accuracy : float, optional
+        If given, the norm fit statistic profiles are computed with an adaptive scan.
+        See `~gammapy.estimators.FluxPointsEstimator`. Default is None.
 
     Examples
     --------
@@ -104,6 +111,7 @@ class LightCurveEstimator(FluxPointsEstimator):
     """
 
     tag = "LightCurveEstimator"
+    _norm_init = None
 
     def __init__(
         self,
@@ -151,6 +159,7 @@ class LightCurveEstimator(FluxPointsEstimator):
         valid_intervals = []
         parallel_datasets = []
         dataset_names = datasets.names
+        norm_init = None
         for idx, (t_min, t_max) in enumerate(
             progress_bar(gti.time_intervals, desc="Time intervals selection")
         ):
@@ -183,23 +192,31 @@ class LightCurveEstimator(FluxPointsEstimator):
                 dataset_names = datasets_to_fit.names
 
             if self.n_jobs == 1:
-                fp = self.estimate_time_bin_flux(datasets_to_fit, dataset_names)
+                fp = self.estimate_time_bin_flux(
+                    datasets_to_fit, dataset_names, norm_init=norm_init
+                )
+                norm_init = self._get_norm_init(fp)
                 rows.append(fp)
             else:
                 parallel_datasets.append(datasets_to_fit)
 
         if self.n_jobs > 1:
             self._update_child_jobs()
-            rows = parallel.run_multiprocessing(
-                self.estimate_time_bin_flux,
+            # contiguous chunks of time bins, so that the warm start chain
+            # is only broken at the chunk boundaries
+            n_chunks = min(self.n_jobs, len(parallel_datasets))
+            chunks = np.array_split(np.arange(len(parallel_datasets)), n_chunks)
+            results = parallel.run_multiprocessing(
+                self.estimate_time_bins_flux,
                 zip(
-                    parallel_datasets,
+                    [[parallel_datasets[idx] for idx in chunk] for chunk in chunks],
                     repeat(dataset_names),
                 ),
                 backend=self.parallel_backend,
                 pool_kwargs=dict(processes=self.n_jobs),
                 task_name="Time intervals",
             )
+            rows = [fp for result in results for fp in result]
 
         if len(rows) == 0:
             raise ValueError("LightCurveEstimator: No datasets in time intervals")
@@ -234,7 +251,43 @@ class LightCurveEstimator(FluxPointsEstimator):
         result.set_by_coord(coords, vals=m.data)
         return result
 
-    def estimate_time_bin_flux(self, datasets, dataset_names=None):
+    def estimate_time_bins_flux(self, datasets_list, dataset_names=None):
+        """Estimate flux points for consecutive time bins.
+
+        The norm fit in each time bin is started from the best-fit norms
+        of the previous time bin.
+
+        Parameters
+        ----------
+        datasets_list : list of `~gammapy.datasets.Datasets`
+            List of datasets, one per time bin.
+        dataset_names : list of str
+            Dataset names.
+
+        Returns
+        -------
+        result : list of `FluxPoints`
+            Resulting flux points, one per time bin.
+        """
+        rows, norm_init = [], None
+
+        for datasets in datasets_list:
+            fp = self.estimate_time_bin_flux(
+                datasets, dataset_names, norm_init=norm_init
+            )
+            norm_init = self._get_norm_init(fp)
+            rows.append(fp)
+
+        return rows
+
+    @staticmethod
+    def _get_norm_init(fp):
+        """Best-fit norms of successful fits, NaN otherwise."""
+        norm = fp.norm.data.reshape(-1).astype(float)
+        norm[~fp.success.data.reshape(-1).astype(bool)] = np.nan
+        return norm
+
+    def estimate_time_bin_flux(self, datasets, dataset_names=None, norm_init=None):
         """Estimate flux point for a single energy group.
 
         Parameters
@@ -243,6 +296,10 @@ class LightCurveEstimator(FluxPointsEstimator):
             List of dataset objects.
         dataset_names : list of str
             Dataset names.
+        norm_init : `~numpy.ndarray`, optional
+            Initial norm values, one per energy bin. Non finite values are
+            replaced by the value of the ``norm`` parameter.
+            Default is None.
 
         Returns
         -------
@@ -251,6 +308,7 @@ class LightCurveEstimator(FluxPointsEstimator):
         """
         estimator = self.copy()
         estimator.n_jobs = self._n_child_jobs
+        estimator._norm_init = norm_init
         fp = estimator._run_flux_points(datasets)
 
         if dataset_names:
@@ -260,5 +318,33 @@ class LightCurveEstimator(FluxPointsEstimator):
                 )
         return fp
 
+    def _estimate_flux_points(self, datasets):
+        if self._norm_init is None:
+            return super()._estimate_flux_points(datasets)
+
+        return parallel.run_multiprocessing(
+            self._estimate_flux_point_init,
+            zip(
+                repeat(datasets),
+                self.energy_edges[:-1],
+                self.energy_edges[1:],
+                self._norm_init,
+            ),
+            backend=self.parallel_backend,
+            pool_kwargs=dict(processes=self.n_jobs),
+            task_name="Energy bins",
+        )
+
+    def _estimate_flux_point_init(self, datasets, energy_min, energy_max, norm_init):
+        """Estimate a flux point, starting the norm fit from ``norm_init``."""
+        estimator = self
+        if np.isfinite(norm_init):
+            estimator = self.copy()
+            estimator.norm.value = norm_init
+
+        return estimator.estimate_flux_point(
+            datasets=datasets, energy_min=energy_min, energy_max=energy_max
+        )
+
     def _run_flux_points(self, datasets):
         return super().run(datasets)
@@ -2,7 +2,6 @@
 """Tools to create profiles (i.e. 1D "slices" from 2D images)."""
 
 import logging
-from itertools import repeat
 import numpy as np
 from astropy import units as u
 from regions import CircleAnnulusSkyRegion
@@ -160,10 +159,11 @@ class FluxProfileEstimator(FluxPointsEstimator):
             Profile flux points.
         """
         datasets = Datasets(datasets=datasets)
+        datasets_to_fit = self._to_spectrum_datasets(datasets)
 
         maps = parallel.run_multiprocessing(
             self._run_region,
-            zip(repeat(datasets), self.regions),
+            zip(datasets_to_fit),
             backend=self.parallel_backend,
             pool_kwargs=dict(processes=self.n_jobs),
             task_name="Flux profile estimation",
@@ -174,21 +174,37 @@ class FluxProfileEstimator(FluxPointsEstimator):
             axis=self.projected_distance_axis,
         )
 
-    def _run_region(self, datasets, region):
-        # TODO: test if it would be more efficient
-        # to not compute datasets_to_fit in parallel
-        # to avoid copying the full datasets
-        datasets_to_fit = datasets.to_spectrum_datasets(region=region)
-        for dataset_spec, dataset_map in zip(datasets_to_fit, datasets):
-            dataset_spec.background.data = (
-                dataset_map.npred()
-                .to_region_nd_map(region, func=np.sum, weights=dataset_map.mask_safe)
-                .data
+    def _to_spectrum_datasets(self, datasets):
+        """Spectrum datasets for each region, with the npred as background.
+
+        The maps of each dataset are reduced in all regions at once, see
+        `~gammapy.datasets.MapDataset.to_spectrum_datasets`.
+        """
+        datasets_regions = [Datasets() for _ in self.regions]
+
+        for dataset in datasets:
+            reduce = dataset._get_regions_reducer(self.regions)
+            spectrum_datasets = dataset._to_spectrum_datasets(
+                regions=self.regions,
+                reduce=reduce,
+                containment_correction=False,
+                name=dataset.name,
             )
-        datasets_to_fit.models = SkyModel(self.spectral_model, name="test-source")
+            npred_regions = reduce(dataset.npred(), np.sum, weights=dataset.mask_safe)
+
+            for datasets_region, dataset_spec, npred_region in zip(
+                datasets_regions, spectrum_datasets, npred_regions
+            ):
+                dataset_spec.background.data = npred_region.data
+                datasets_region.append(dataset_spec)
+
+        return datasets_regions
+
+    def _run_region(self, datasets):
+        datasets.models = SkyModel(self.spectral_model, name="test-source")
         estimator = self.copy()
         estimator.n_jobs = self._n_child_jobs
-        return estimator._run_flux_points(datasets_to_fit)
+        return estimator._run_flux_points(datasets)
 
     def _run_flux_points(self, datasets):
         return super().run(datasets)
@@ -93,6 +93,11 @@ class FluxPointsEstimator(FluxEstimator, parallel.ParallelMixin):
         scan_min=0.2, scan_max=5, and scan_n_values = 11. By default, the min and max are not set
         (consider setting them if errors or upper limits computation fails). If a dict is given,
         the entries should be a subset of `~gammapy.modeling.Parameter` arguments.
+    scan_accuracy : float, optional
+        If given, the norm fit statistic profiles are computed with an adaptive scan,
+        refined until the interpolated profile is accurate to ``scan_accuracy`` in the
+        region of interest. See `~gammapy.estimators.ParameterEstimator`.
+        Default is None, which evaluates the fit statistic at all norm scan values.
     allow_multiple_telescopes : bool, optional
         Whether to allow the computation for different telescopes.
         **WARNING**: This is currently an experimental feature.
@@ -198,7 +203,20 @@ class FluxPointsEstimator(FluxEstimator, parallel.ParallelMixin):
             "sed_type_init": "likelihood",
         }
 
-        rows = parallel.run_multiprocessing(
+        rows = self._estimate_flux_points(datasets)
+
+        table = Table(rows, meta=meta)
+        model = _get_reference_model(datasets.models[self.source], self.energy_edges)
+        return FluxPoints.from_table(
+            table=table,
+            reference_model=model.copy(),
+            gti=datasets.gti,
+            format="gadf-sed",
+        )
+
+    def _estimate_flux_points(self, datasets):
+        """Estimate the flux points of all energy groups."""
+        return parallel.run_multiprocessing(
             self.estimate_flux_point,
             zip(
                 repeat(datasets),
@@ -210,15 +228,6 @@ class FluxPointsEstimator(FluxEstimator, parallel.ParallelMixin):
             task_name="Energy bins",
         )
 
-        table = Table(rows, meta=meta)
-        model = _get_reference_model(datasets.models[self.source], self.energy_edges)
-        return FluxPoints.from_table(
-            table=table,
-            reference_model=model.copy(),
-            gti=datasets.gti,
-            format="gadf-sed",
-        )
-
     def estimate_flux_point(self, datasets, energy_min, energy_max):
         """Estimate flux point for a single energy group.
 
@@ -71,23 +71,26 @@ class SensitivityEstimator(Estimator):
         excess : `~gammapy.maps.RegionNDMap`
             Minimal excess.
         """
-        n_off = dataset.counts_off.data
-
-        stat = WStatCountsStatistic(
-            n_on=dataset.alpha.data * n_off, n_off=n_off, alpha=dataset.alpha.data
+        excess_counts = self._estimate_min_excess(
+            n_off=dataset.counts_off.data,
+            alpha=dataset.alpha.data,
+            background=dataset.background.data,
         )
+        excess = Map.from_geom(geom=dataset._geom, data=excess_counts)
+        return excess
+
+    def _estimate_min_excess(self, n_off, alpha, background):
+        """Estimate minimum excess counts for arrays of any shape."""
+        stat = WStatCountsStatistic(n_on=alpha * n_off, n_off=n_off, alpha=alpha)
         excess_counts = stat.n_sig_matching_significance(self.n_sigma)
 
-        excess_counts = apply_threshold_sensitivity(
-            dataset.background.data,
+        return apply_threshold_sensitivity(
+            background,
             excess_counts,
             self.gamma_min,
             self.bkg_syst_fraction,
         )
 
-        excess = Map.from_geom(geom=dataset._geom, data=excess_counts)
-        return excess
-
     def estimate_min_e2dnde(self, excess, dataset):
         """Estimate e2dnde from a given minimum excess.
 
@@ -147,6 +150,47 @@ class SensitivityEstimator(Estimator):
                 * criterion : sensitivity-limiting criterion
 
         """
+        excess = self.estimate_min_excess(dataset)
+        return self._to_table(excess, dataset)
+
+    def run_datasets(self, datasets):
+        """Run the sensitivity estimation for several datasets at once.
+
+        The minimum excess is solved for all energy bins of all datasets
+        in a single vectorized call, which makes it cheap to compute
+        sensitivity curves for large grids of IRFs or observation times.
+
+        Parameters
+        ----------
+        datasets : list of `~gammapy.datasets.SpectrumDatasetOnOff` or `~gammapy.datasets.Datasets`
+            Datasets to compute sensitivity for.
+
+        Returns
+        -------
+        sensitivities : list of `~astropy.table.Table`
+            Sensitivity tables, one per dataset. See `SensitivityEstimator.run`.
+        """
+        excess_counts = self._estimate_min_excess(
+            n_off=np.concatenate([_.counts_off.data.ravel() for _ in datasets]),
+            alpha=np.concatenate([_.alpha.data.ravel() for _ in datasets]),
+            background=np.concatenate([_.background.data.ravel() for _ in datasets]),
+        )
+
+        sizes = [_.counts_off.data.size for _ in datasets]
+        excess_counts = np.split(excess_counts, np.cumsum(sizes)[:-1])
+
+        tables = []
+
+        for dataset, data in zip(datasets, excess_counts):
+            excess = Map.from_geom(
+                geom=dataset._geom, data=data.reshape(dataset._geom.data_shape)
+            )
+            tables.append(self._to_table(excess, dataset))
+
+        return tables
+
+    def _to_table(self, excess, dataset):
+        """Sensitivity table from the minimum excess."""
         energy = dataset._geom.axes["energy"].center
 
         if np.any(self.spectral_model(energy).value < 0.0):
@@ -154,7 +198,6 @@ class SensitivityEstimator(Estimator):
                 "Spectral model predicts negative flux. Results of estimator should be interpreted with caution"
             )
 
-        excess = self.estimate_min_excess(dataset)
         e2dnde = self.estimate_min_e2dnde(excess, dataset)
         criterion = self._get_criterion(
             excess.data.squeeze(), dataset.background.data.squeeze()
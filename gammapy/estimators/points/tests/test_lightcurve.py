@@ -884,3 +884,31 @@ def test_lightcurve_stacking():
     results_stacked = estimator.run(stacked_datasets)
     table_stack_outside = results_stacked.to_table()
     assert_allclose(table_stack["stat_null"], table_stack_outside["stat_null"])
+
+
+def test_lightcurve_warm_start():
+    datasets = get_spectrum_datasets()
+    model = SkyModel(
+        spectral_model=PowerLawSpectralModel(amplitude="3e-12 cm-2 s-1 TeV-1")
+    )
+    dataset = simulate_spectrum_dataset(model=model, random_state=1)
+    dataset._name = "dataset_3"
+    dataset.gti = GTI.create("2h", "3h", Time("2010-01-01T00:00:00").tt)
+
+    datasets = Datasets(datasets + [dataset])
+    datasets.models = SkyModel(spectral_model=PowerLawSpectralModel(), name="source")
+
+    estimator = LightCurveEstimator(energy_edges=[1, 3, 30] * u.TeV)
+    lightcurve = estimator.run(datasets)
+    norm = lightcurve.norm.data[..., 0, 0]
+    assert_allclose(norm[2], [2.807655, 3.076708], rtol=1e-3)
+
+    fp = estimator.estimate_time_bin_flux(datasets[2:], norm_init=norm[1])
+    fp_cold = estimator.estimate_time_bin_flux(datasets[2:])
+    assert_allclose(fp.norm.data[:, 0, 0], norm[2], rtol=1e-3)
+    assert_allclose(fp.norm.data, fp_cold.norm.data, rtol=1e-3)
+    assert estimator.norm.value == 1
+
+    estimator.n_jobs = 2
+    lightcurve_parallel = estimator.run(datasets)
+    assert_allclose(lightcurve_parallel.norm.data, lightcurve.norm.data, rtol=1e-3)
@@ -311,3 +311,22 @@ def test_profile_multiprocessing_ray():
     result = prof_maker.run(dataset)
     imp_prof = result.to_table(sed_type="flux")
     assert_allclose(imp_prof[7]["npred_excess"], [[-1.115967]], rtol=1e-3)
+
+
+def test_profile_spectrum_datasets():
+    dataset = get_simple_dataset_on_off()
+    dataset.counts.data = np.random.default_rng(0).poisson(5, dataset.counts.data.shape)
+    regions = make_boxes(dataset.counts.geom.wcs)
+
+    estimator = FluxProfileEstimator(regions=regions, energy_edges=[0.1, 10] * u.TeV)
+    datasets_regions = estimator._to_spectrum_datasets([dataset])
+
+    for region, datasets in zip(regions, datasets_regions):
+        actual = datasets[0]
+        desired = dataset.to_spectrum_dataset(on_region=region, name=dataset.name)
+        assert actual.name == desired.name
+        for name in ["counts", "counts_off", "acceptance", "acceptance_off"]:
+            assert getattr(actual, name).geom == getattr(desired, name).geom
+            assert_allclose(getattr(actual, name).data, getattr(desired, name).data)
+        assert_allclose(actual.exposure.quantity, desired.exposure.quantity)
+        assert_allclose(actual.mask_safe.data, desired.mask_safe.data)
@@ -603,6 +603,25 @@ def test_run_pwl_parameter_range(fpe_pwl):
     assert_allclose(actual, [-1.006081, -0.364848, -0.927819], rtol=1e-2)
 
 
+def test_flux_points_estimator_adaptive_scan():
+    pl = PowerLawSpectralModel(amplitude="1e-12 cm-2s-1TeV-1")
+
+    datasets, fpe = create_fpe(pl)
+    fpe.selection_optional = ["scan"]
+    fpe.norm.scan_n_values = 41
+
+    stat_scan = fpe.run(datasets).stat_scan.data
+
+    fpe.scan_accuracy = 0.01
+    fp = fpe.run(datasets)
+    assert fp.stat_scan.data.shape == stat_scan.shape
+    assert_allclose(fp.stat_scan.data[:, [0, -1]], stat_scan[:, [0, -1]])
+
+    delta_stat = stat_scan - stat_scan.min(axis=1, keepdims=True)
+    in_roi = delta_stat < 9
+    assert_allclose(fp.stat_scan.data[in_roi], stat_scan[in_roi], atol=0.02)
+
+
 def test_flux_points_estimator_small_edges():
     pl = PowerLawSpectralModel(amplitude="1e-11 cm-2s-1TeV-1")
 
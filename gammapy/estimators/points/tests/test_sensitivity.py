@@ -82,6 +82,32 @@ def test_cta_sensitivity_estimator(spectrum_dataset):
     assert row["criterion"] == "gamma"
 
 
+def test_sensitivity_estimator_run_datasets(spectrum_dataset):
+    geom = spectrum_dataset.background.geom
+
+    datasets = []
+    for acceptance_off in [5, 20]:
+        dataset_on_off = SpectrumDatasetOnOff.from_spectrum_dataset(
+            dataset=spectrum_dataset,
+            acceptance=RegionNDMap.from_geom(geom=geom, data=1),
+            acceptance_off=RegionNDMap.from_geom(geom=geom, data=acceptance_off),
+        )
+        datasets.append(dataset_on_off)
+
+    sens = SensitivityEstimator(gamma_min=25, bkg_syst_fraction=0.075)
+    tables = sens.run_datasets(datasets)
+
+    assert len(tables) == 2
+    assert_allclose(tables[0]["excess"][1], 334.454, rtol=1e-3)
+    assert_allclose(tables[1]["excess"][1], 311.967, rtol=1e-3)
+
+    for dataset, table in zip(datasets, tables):
+        expected = sens.run(dataset)
+        assert_allclose(table["e2dnde"], expected["e2dnde"])
+        assert_allclose(table["excess"], expected["excess"])
+        assert list(table["criterion"]) == list(expected["criterion"])
+
+
 def test_integral_estimation(spectrum_dataset):
     dataset = spectrum_dataset.to_image()
     geom = dataset.background.geom
@@ -19,6 +19,8 @@ __all__ = ["PSFMap", "RecoPSFMap"]
 
 PSF_MAX_OVERSAMPLING = 4  # for backward compatibility
 
+PSF_KERNEL_CACHE_SIZE = 8
+
 
 def _psf_upsampling_factor(psf, geom, position, energy=None, precision_factor=12):
     """Minimal factor between the bin half-width of the geom and the median R68% containment radius."""
@@ -96,6 +98,7 @@ class PSFMap(IRFMap):
 
     def __init__(self, psf_map, exposure_map=None):
         super().__init__(irf_map=psf_map, exposure_map=exposure_map)
+        self._kernel_cache = None
 
     @property
     def energy_name(self):
@@ -109,10 +112,52 @@ class PSFMap(IRFMap):
     def psf_map(self, value):
         del self.has_single_spatial_bin
         self._irf_map = value
+        self._clear_kernel_cache()
+
+    def _clear_kernel_cache(self):
+        """Clear the PSF kernel cache, shared with the slices of this map."""
+        if self._kernel_cache is not None:
+            self._kernel_cache.clear()
 
     def normalize(self):
         """Normalize PSF map."""
         self.psf_map.normalize(axis_name="rad")
+        self._clear_kernel_cache()
+
+    def stack(self, other, weights=None, nan_to_num=True):
+        super().stack(other=other, weights=weights, nan_to_num=nan_to_num)
+        self._clear_kernel_cache()
+
+    stack.__doc__ = IRFMap.stack.__doc__
+
+    def slice_by_idx(self, slices):
+        """Slice sub dataset.
+
+        If the slices do not apply to the PSF axes, the PSF kernels computed
+        by `get_psf_kernel` are cached and shared between this map and the
+        sliced one.
+
+        Parameters
+        ----------
+        slices : dict
+            Dictionary of axes names and integers or `slice` object pairs. Contains one
+            element for each non-spatial dimension. For integer indexing the
+            corresponding axes is dropped from the map. Axes not specified in the
+            dictionary are kept unchanged.
+
+        Returns
+        -------
+        map_out : `PSFMap`
+            Sliced PSF map object.
+        """
+        psf_map = super().slice_by_idx(slices=slices)
+
+        if not set(slices).intersection(self.required_axes):
+            if self._kernel_cache is None:
+                self._kernel_cache = []
+            psf_map._kernel_cache = self._kernel_cache
+
+        return psf_map
 
     @classmethod
     def from_geom(cls, geom):
@@ -287,6 +332,72 @@ class PSFMap(IRFMap):
         if position is None:
             position = self.psf_map.geom.center_skydir
 
+        key = self._get_kernel_cache_key(
+            geom=geom,
+            position=position,
+            max_radius=max_radius,
+            containment=containment,
+            precision_factor=precision_factor,
+        )
+
+        if key is not None:
+            for cached_key, cached_geom, kernel in self._kernel_cache:
+                if cached_key == key and cached_geom == geom:
+                    return kernel
+
+        kernel = self._get_psf_kernel(
+            geom=geom,
+            position=position,
+            max_radius=max_radius,
+            containment=containment,
+            precision_factor=precision_factor,
+        )
+
+        if key is not None:
+            if len(self._kernel_cache) >= PSF_KERNEL_CACHE_SIZE:
+                self._kernel_cache.pop(0)
+            self._kernel_cache.append((key, geom, kernel))
+
+        return kernel
+
+    def _get_kernel_cache_key(
+        self, geom, position, max_radius, containment, precision_factor
+    ):
+        """Kernel cache key, None if the kernel should not be cached.
+
+        The key includes a hash of the PSF and exposure data, so that kernels
+        are recomputed if the maps are modified in place.
+        """
+        if self._kernel_cache is None or not geom.is_regular or not position.isscalar:
+            return None
+
+        data = [self.psf_map]
+        if self.exposure_map is not None:
+            data.append(self.exposure_map)
+
+        fingerprint = tuple(
+            (str(m.unit), hash(np.ascontiguousarray(m.data).tobytes())) for m in data
+        )
+
+        frame = position.frame.name
+        position = position.spherical
+        if max_radius is not None:
+            max_radius = u.Quantity(max_radius).to_value("deg")
+
+        return (
+            frame,
+            float(position.lon.deg),
+            float(position.lat.deg),
+            max_radius,
+            containment,
+            precision_factor,
+            fingerprint,
+        )
+
+    def _get_psf_kernel(
+        self, geom, position, max_radius, containment, precision_factor
+    ):
+        """Compute the PSF kernel, see `get_psf_kernel`."""
         position = self._get_nearest_valid_position(position)
 
         energy_axis = self.psf_map.geom.axes[self.energy_name]
@@ -157,6 +157,49 @@ def test_psfmap_to_psf_kernel():
     assert_allclose(psfkernel.psf_kernel_map.data.sum(axis=(1, 2)), 1.0, atol=1e-7)
 
 
+def test_psfmap_psf_kernel_cache():
+    psfmap = make_test_psfmap(0.15 * u.deg)
+
+    energy_axis = psfmap.psf_map.geom.axes["energy_true"]
+    kern_geom = WcsGeom.create(binsz=0.02, width=5.0, axes=[energy_axis])
+    position = SkyCoord(1, 1, unit="deg")
+
+    psfmap_sliced = psfmap.slice_by_idx({"energy": slice(0, 2)})
+    kernel = psfmap.get_psf_kernel(position=position, geom=kern_geom)
+    kernel_sliced = psfmap_sliced.get_psf_kernel(position=position, geom=kern_geom)
+    assert kernel_sliced is kernel
+
+    kernel_other = psfmap_sliced.get_psf_kernel(
+        position=position, geom=kern_geom, max_radius=1 * u.deg
+    )
+    assert kernel_other is not kernel
+    assert_allclose(kernel_other.psf_kernel_map.geom.width, 2.02 * u.deg)
+
+    psfmap_true = psfmap.slice_by_idx({"energy_true": slice(0, 2)})
+    assert psfmap_true._kernel_cache is None
+
+    psfmap.normalize()
+    assert len(psfmap_sliced._kernel_cache) == 0
+
+
+def test_psfmap_psf_kernel_cache_modified_data():
+    psfmap = make_test_psfmap(0.1 * u.deg)
+    psfmap_wide = make_test_psfmap(0.2 * u.deg)
+
+    energy_axis = psfmap.psf_map.geom.axes["energy_true"]
+    kern_geom = WcsGeom.create(binsz=0.02, width=2.0, axes=[energy_axis])
+
+    psfmap = psfmap.slice_by_idx({})
+    kernel = psfmap.get_psf_kernel(geom=kern_geom)
+
+    psfmap.psf_map.data[...] = psfmap_wide.psf_map.data
+    kernel_wide = psfmap.get_psf_kernel(geom=kern_geom)
+    assert kernel_wide is not kernel
+
+    expected = psfmap_wide.get_psf_kernel(geom=kern_geom)
+    assert_allclose(kernel_wide.data, expected.data)
+
+
 def test_psfmap_to_from_hdulist():
     psfmap = make_test_psfmap(0.15 * u.deg)
     hdulist = psfmap.to_hdulist()
@@ -3,7 +3,9 @@ import logging
 from astropy.coordinates import Angle
 from astropy.nddata import NoOverlapError
 import gammapy.utils.parallel as parallel
+from gammapy.data import Observations
 from gammapy.datasets import Datasets, MapDataset, MapDatasetOnOff, SpectrumDataset
+from gammapy.utils.pbar import progress_bar
 from .core import Maker
 from .safe import SafeMaskMaker
 
@@ -41,6 +43,11 @@ class DatasetsMaker(Maker, parallel.ParallelMixin):
     parallel_backend : {'multiprocessing', 'ray'}, optional
         Which backend to use for multiprocessing.
         Default is None.
+    n_prefetch : int, optional
+        Number of observations loaded ahead in a background thread while the
+        current one is reduced, see `~gammapy.data.Observations.iter_prefetch`.
+        Only used when running with a single process. Set to 0 to disable.
+        Default is 1.
     """
 
     tag = "DatasetsMaker"
@@ -53,6 +60,7 @@ class DatasetsMaker(Maker, parallel.ParallelMixin):
         cutout_mode="trim",
         cutout_width=None,
         parallel_backend=None,
+        n_prefetch=1,
     ):
         self.log = logging.getLogger(__name__)
         self.makers = makers
@@ -73,6 +81,7 @@ class DatasetsMaker(Maker, parallel.ParallelMixin):
         self.n_jobs = n_jobs
         self.parallel_backend = parallel_backend
         self.stack_datasets = stack_datasets
+        self.n_prefetch = n_prefetch
 
         self._datasets = []
         self._error = False
@@ -145,6 +154,30 @@ class DatasetsMaker(Maker, parallel.ParallelMixin):
         # parallel run could cause a memory error with non-explicit message.
         self._error = True
 
+    def _run_prefetch(self, datasets, observations):
+        """Reduce observations serially while loading the next ones in the background."""
+        inputs = zip(datasets, observations.iter_prefetch(n_prefetch=self.n_prefetch))
+
+        for dataset, observation in progress_bar(
+            inputs, desc="Data reduction", total=len(observations)
+        ):
+            self.callback(self.make_dataset(dataset, observation))
+
+    def _run_parallel(self, datasets, observations, n_jobs):
+        """Reduce observations with the configured parallel backend."""
+        parallel.run_multiprocessing(
+            self.make_dataset,
+            zip(datasets, observations),
+            backend=self.parallel_backend,
+            pool_kwargs=dict(processes=n_jobs),
+            method="apply_async",
+            method_kwargs=dict(
+                callback=self.callback,
+                error_callback=self.error_callback,
+            ),
+            task_name="Data reduction",
+        )
+
     def run(self, dataset, observations, datasets=None):
         """Run data reduction.
 
@@ -179,18 +212,10 @@ class DatasetsMaker(Maker, parallel.ParallelMixin):
 
         n_jobs = min(self.n_jobs, len(observations))
 
-        parallel.run_multiprocessing(
-            self.make_dataset,
-            zip(datasets, observations),
-            backend=self.parallel_backend,
-            pool_kwargs=dict(processes=n_jobs),
-            method="apply_async",
-            method_kwargs=dict(
-                callback=self.callback,
-                error_callback=self.error_callback,
-            ),
-            task_name="Data reduction",
-        )
+        if n_jobs == 1 and self.n_prefetch and isinstance(observations, Observations):
+            self._run_prefetch(datasets, observations)
+        else:
+            self._run_parallel(datasets, observations, n_jobs)
 
         if self._error:
             raise RuntimeError("Execution of a sub-process failed")
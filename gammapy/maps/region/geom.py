@@ -26,6 +26,7 @@ import matplotlib.pyplot as plt
 from gammapy.utils.regions import (
     compound_region_center,
     compound_region_to_regions,
+    region_contains,
     regions_to_compound_region,
 )
 from gammapy.visualization.utils import ARTIST_TO_LINE_PROPERTIES
@@ -251,7 +252,7 @@ class RegionGeom(Geom):
         if self.is_all_point_sky_regions:
             return np.ones(coords.skycoord.shape, dtype=bool)
 
-        return self.region.contains(coords.skycoord, self.wcs)
+        return region_contains(self.region, coords.skycoord, self.wcs)
 
     def contains_wcs_pix(self, pix):
         """Check if a given WCS pixel coordinate is contained in the region.
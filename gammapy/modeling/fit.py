@@ -1,11 +1,14 @@
 # Licensed under a 3-clause BSD style license - see LICENSE.rst
+import contextlib
 import html
 import itertools
 import logging
+import time
 import numpy as np
 from astropy.table import Table
-from gammapy.utils.pbar import progress_bar
+import gammapy.utils.parallel as parallel
 from gammapy.modeling.utils import _parse_datasets
+from gammapy.utils.timing import TimingRecorder
 from .covariance import Covariance
 from .iminuit import (
     confidence_iminuit,
@@ -65,8 +68,10 @@ class Registry:
 
 registry = Registry()
 
+GRADIENT_BACKENDS = ["minuit", "scipy"]
 
-class Fit:
+
+class Fit(parallel.ParallelMixin):
     """Fit class.
 
     The fit class provides a uniform interface to multiple fitting backends.
@@ -111,6 +116,21 @@ class Fit:
         interval can be adapted by modifying the upper bound of the interval (``b``) value.
     store_trace : bool
         Whether to store the trace of the fit.
+    use_gradient : bool
+        Whether to pass the derivatives of the fit statistic, computed with
+        `~gammapy.datasets.Datasets.stat_sum_gradient`, to the optimizer.
+        Only supported by the "minuit" and "scipy" backends. Default is False.
+    store_timing : bool
+        Whether to record the number of calls, cumulative time and cache hit rate
+        of the computation stages during the optimization, available as
+        `OptimizeResult.timing`. Default is False.
+    n_jobs : int, optional
+        Number of processes used in parallel for the computation of the statistic
+        profiles and surfaces. If None, defaults to `~gammapy.utils.parallel.N_JOBS_DEFAULT`.
+        Default is None.
+    parallel_backend : {"multiprocessing", "ray"}, optional
+        Which backend to use for multiprocessing. If None, defaults to
+        `~gammapy.utils.parallel.BACKEND_DEFAULT`.
     """
 
     def __init__(
@@ -120,9 +140,17 @@ class Fit:
         covariance_opts=None,
         confidence_opts=None,
         store_trace=False,
+        use_gradient=False,
+        store_timing=False,
+        n_jobs=None,
+        parallel_backend=None,
     ):
         self.store_trace = store_trace
+        self.use_gradient = use_gradient
+        self.store_timing = store_timing
         self.backend = backend
+        self.n_jobs = n_jobs
+        self.parallel_backend = parallel_backend
 
         if optimize_opts is None:
             optimize_opts = {"backend": backend}
@@ -206,15 +234,31 @@ class Fit:
         backend = kwargs.pop("backend", self.backend)
 
         compute = registry.get("optimize", backend)
+
+        if self.use_gradient:
+            if backend in GRADIENT_BACKENDS:
+                kwargs["gradient"] = datasets.stat_sum_gradient
+            else:
+                log.warning(f"Gradient not supported by backend {backend!r}, ignored.")
+
         # TODO: change this calling interface!
         # probably should pass a fit statistic, which has a model, which has parameters
         # and return something simpler, not a tuple of three things
-        factors, info, optimizer = compute(
-            parameters=parameters,
-            function=datasets.stat_sum,
-            store_trace=self.store_trace,
-            **kwargs,
-        )
+        recorder = TimingRecorder() if self.store_timing else None
+
+        with recorder or contextlib.nullcontext():
+            start = time.perf_counter()
+            factors, info, optimizer = compute(
+                parameters=parameters,
+                function=datasets.stat_sum,
+                store_trace=self.store_trace,
+                **kwargs,
+            )
+
+        timing = None
+        if recorder is not None:
+            recorder.add("Fit.optimize", time.perf_counter() - start)
+            timing = recorder.to_table()
 
         if backend == "minuit":
             self._minuit = optimizer
@@ -241,6 +285,7 @@ class Fit:
             method=kwargs.get("method", backend),
             trace=trace,
             minuit=optimizer,
+            timing=timing,
             **info,
         )
 
@@ -359,6 +404,10 @@ class Fit:
         -----
         The progress bar can be displayed for this function.
 
+        The scan values are distributed over ``n_jobs`` processes. When re-optimizing,
+        the scan values are split in contiguous blocks and each fit starts from the
+        best-fit values of the previous scan value.
+
         Parameters
         ----------
         datasets : `Datasets` or list of `Dataset`
@@ -399,19 +448,19 @@ class Fit:
         parameter = parameters[parameter]
         values = parameter.scan_values
 
-        stats = []
-        fit_results = []
-        with parameters.restore_status():
-            for value in progress_bar(values, desc="Scan values"):
-                parameter.value = value
-                if reoptimize:
-                    parameter.frozen = True
-                    result = self.optimize(datasets=datasets)
-                    stat = result.total_stat
-                    fit_results.append(result)
-                else:
-                    stat = datasets.stat_sum()
-                stats.append(stat)
+        if reoptimize:
+            # contiguous blocks, so that each fit starts from the previous best fit
+            chunks = np.array_split(values, min(self.n_jobs, len(values)))
+        else:
+            chunks = self._split_scan_values(values)
+
+        stats, fit_results = self._stat_scan(
+            datasets=datasets,
+            parameters=[parameter],
+            chunks=[chunk[:, np.newaxis] for chunk in chunks],
+            reoptimize=reoptimize,
+            task_name="Scan values",
+        )
 
         idx = datasets.parameters.index(parameter)
         name = datasets.models.parameters_unique_names[idx]
@@ -436,6 +485,10 @@ class Fit:
         -----
         The progress bar can be displayed for this function.
 
+        The trial values are distributed over ``n_jobs`` processes. When re-optimizing,
+        the surface is computed row by row, and each fit starts from the best-fit values
+        of the previous trial value in the row.
+
         Parameters
         ----------
         datasets : `Datasets` or list of `Dataset`
@@ -483,24 +536,22 @@ class Fit:
         x = parameters[x]
         y = parameters[y]
 
-        stats = []
-        fit_results = []
+        values = np.array(list(itertools.product(x.scan_values, y.scan_values)))
 
-        with parameters.restore_status():
-            for x_value, y_value in progress_bar(
-                itertools.product(x.scan_values, y.scan_values), desc="Trial values"
-            ):
-                x.value, y.value = x_value, y_value
-
-                if reoptimize:
-                    x.frozen, y.frozen = True, True
-                    result = self.optimize(datasets=datasets)
-                    stat = result.total_stat
-                    fit_results.append(result)
-                else:
-                    stat = datasets.stat_sum()
-
-                stats.append(stat)
+        if reoptimize:
+            # one row per x value, so that each fit starts from the best fit
+            # of the neighbouring y value
+            chunks = np.split(values, len(x.scan_values))
+        else:
+            chunks = self._split_scan_values(values)
+
+        stats, fit_results = self._stat_scan(
+            datasets=datasets,
+            parameters=[x, y],
+            chunks=chunks,
+            reoptimize=reoptimize,
+            task_name="Trial values",
+        )
 
         shape = (len(x.scan_values), len(y.scan_values))
         stats = np.array(stats).reshape(shape)
@@ -519,6 +570,47 @@ class Fit:
             "fit_results": fit_results,
         }
 
+    def _split_scan_values(self, values):
+        """Split scan values in one chunk per process, or one chunk per value."""
+        if self.n_jobs > 1:
+            return np.array_split(values, min(self.n_jobs, len(values)))
+        return np.array_split(values, len(values))
+
+    def _stat_scan(self, datasets, parameters, chunks, reoptimize, task_name):
+        """Evaluate the fit statistic on chunks of parameter values in parallel."""
+        indices = [datasets.parameters.index(par) for par in parameters]
+
+        fit = Fit(
+            backend=self.backend,
+            optimize_opts=self.optimize_opts,
+            covariance_opts=self.covariance_opts,
+            confidence_opts=self.confidence_opts,
+            store_trace=self.store_trace,
+            use_gradient=self.use_gradient,
+            store_timing=self.store_timing,
+            n_jobs=1,
+        )
+
+        results = parallel.run_multiprocessing(
+            _stat_scan,
+            zip(
+                itertools.repeat(fit),
+                itertools.repeat(datasets),
+                itertools.repeat(indices),
+                chunks,
+                itertools.repeat(reoptimize),
+            ),
+            backend=self.parallel_backend,
+            pool_kwargs=dict(processes=self.n_jobs),
+            method="starmap",
+            method_kwargs={},
+            task_name=task_name,
+        )
+
+        stats = list(itertools.chain.from_iterable(_[0] for _ in results))
+        fit_results = list(itertools.chain.from_iterable(_[1] for _ in results))
+        return stats, fit_results
+
     def stat_contour(self, datasets, x, y, numpoints=10, sigma=1):
         """Compute stat contour.
 
@@ -600,6 +692,54 @@ class Fit:
         }
 
 
+def _stat_scan(fit, datasets, indices, values, reoptimize):
+    """Compute the fit statistic for a sequence of parameter values.
+
+    When re-optimizing, each fit starts from the best-fit values of the previous
+    point in the sequence.
+
+    Parameters
+    ----------
+    fit : `Fit`
+        Fit instance used to re-optimize.
+    datasets : `~gammapy.datasets.Datasets`
+        Datasets.
+    indices : list of int
+        Indices of the scanned parameters in ``datasets.parameters``.
+    values : `~numpy.ndarray`
+        Parameter values with shape ``(n_values, len(indices))``.
+    reoptimize : bool
+        Re-optimize other parameters.
+
+    Returns
+    -------
+    stats, fit_results : list
+        Fit statistic values and optimize results (empty if not re-optimizing).
+    """
+    parameters = datasets.parameters
+    scanned = [parameters[idx] for idx in indices]
+
+    stats, fit_results = [], []
+
+    with parameters.restore_status():
+        for row in values:
+            for par, value in zip(scanned, row):
+                par.value = value
+
+            if reoptimize:
+                for par in scanned:
+                    par.frozen = True
+                result = fit.optimize(datasets=datasets)
+                stat = result.total_stat
+                fit_results.append(result)
+            else:
+                stat = datasets.stat_sum()
+
+            stats.append(stat)
+
+    return stats, fit_results
+
+
 class FitStepResult:
     """Fit result base class."""
 
@@ -692,16 +832,22 @@ class OptimizeResult(FitStepResult):
         Parameter trace from the optimisation.
     minuit : `~iminuit.minuit.Minuit`, optional
         Minuit object. Default is None.
+    timing : `~astropy.table.Table`, optional
+        Number of calls, cumulative time and cache hit rate of the computation
+        stages. Default is None.
     kwargs : dict
         Extra ``kwargs`` are passed to the backend.
     """
 
-    def __init__(self, models, nfev, total_stat, trace, minuit=None, **kwargs):
+    def __init__(
+        self, models, nfev, total_stat, trace, minuit=None, timing=None, **kwargs
+    ):
         self._models = models
         self._nfev = nfev
         self._total_stat = total_stat
         self._trace = trace
         self._minuit = minuit
+        self._timing = timing
         super().__init__(**kwargs)
 
     @property
@@ -729,6 +875,14 @@ class OptimizeResult(FitStepResult):
         """Number of function evaluations."""
         return self._nfev
 
+    @property
+    def timing(self):
+        """Number of calls, cumulative time and cache hit rate of the computation stages.
+
+        Only recorded if `Fit` is created with ``store_timing=True``, otherwise None.
+        """
+        return self._timing
+
     @property
     def total_stat(self):
         """Value of the fit statistic at minimum."""
@@ -795,6 +949,11 @@ class FitResult:
         """Number of function evaluations of the optimisation step."""
         return self.optimize_result.nfev
 
+    @property
+    def timing(self):
+        """Timing of the computation stages of the optimisation step."""
+        return self.optimize_result.timing
+
     @property
     def backend(self):
         """Optimizer backend used for the fit."""
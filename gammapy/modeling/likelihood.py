@@ -1,5 +1,7 @@
 # Licensed under a 3-clause BSD style license - see LICENSE.rst
 import html
+import numpy as np
+from gammapy.utils.timing import timed
 
 __all__ = ["Likelihood"]
 
@@ -22,10 +24,16 @@ class Likelihood:
         Parameters with starting values.
     function : callable
         Likelihood function.
+    store_trace : bool
+        Store trace of the fit.
+    gradient : callable, optional
+        Function returning the derivatives of the likelihood with respect
+        to the free parameter values. Default is None.
     """
 
-    def __init__(self, function, parameters, store_trace):
+    def __init__(self, function, parameters, store_trace, gradient=None):
         self.function = function
+        self.gradient = gradient
         self.parameters = parameters
         self.trace = []
         self.store_trace = store_trace
@@ -39,14 +47,27 @@ class Likelihood:
         self.trace.append(row)
 
     def fcn(self, factors):
-        self.parameters.set_parameter_factors(factors)
-        total_stat = self.function()
+        with timed("Likelihood.fcn"):
+            self.parameters.set_parameter_factors(factors)
+            total_stat = self.function()
 
         if self.store_trace:
             self.store_trace_iteration(total_stat)
 
         return total_stat
 
+    def grad(self, factors):
+        self.parameters.set_parameter_factors(factors)
+        return self._gradient_factors()
+
+    def _gradient_factors(self):
+        """Derivatives with respect to the parameter factors seen by the optimiser."""
+        derivatives = [
+            par._inverse_transform_derivative(par.factor)
+            for par in self.parameters.free_parameters
+        ]
+        return np.asarray(self.gradient()) * np.array(derivatives)
+
     def _repr_html_(self):
         try:
             return self.to_html()
@@ -27,6 +27,7 @@ from gammapy.utils.gauss import Gauss2DPDF
 from gammapy.utils.interpolation import interpolation_scale
 from gammapy.utils.regions import region_circle_to_ellipse, region_to_frame
 from gammapy.utils.scripts import make_path
+from ..utils import _central_difference
 from .core import ModelBase, _build_parameters_from_dict
 from gammapy.utils.units import wrap_at
 
@@ -305,6 +306,49 @@ class SpatialModel(ModelBase):
             )
         return result
 
+    def integrate_geom_gradient(
+        self, geom, parameters=None, epsilon=1e-3, oversampling_factor=None
+    ):
+        """Compute the derivatives of the integrated model with respect to the parameters.
+
+        The derivatives are computed numerically using central differences of
+        `integrate_geom`.
+
+        Parameters
+        ----------
+        geom : `~gammapy.maps.WcsGeom` or `~gammapy.maps.RegionGeom`
+            The geom on which the integration is performed.
+        parameters : list of `~gammapy.modeling.Parameter`, optional
+            Parameters to compute the derivatives for. Default is None,
+            which uses the free parameters of the model.
+        epsilon : float, optional
+            Relative step size used for the numerical derivatives. Default is 1e-3.
+        oversampling_factor : int or None
+            The oversampling factor to use for integration.
+            Default is None: the factor is estimated from the model minimal bin size.
+
+        Returns
+        -------
+        gradient : list of `~gammapy.maps.Map`
+            Derivatives of the integrated model per unit of the parameter value,
+            one per parameter.
+        """
+        if parameters is None:
+            parameters = self.parameters.free_parameters
+
+        gradient = []
+        for par in parameters:
+            value = _central_difference(
+                lambda: self.integrate_geom(
+                    geom, oversampling_factor=oversampling_factor
+                ),
+                parameter=par,
+                epsilon=epsilon,
+            )
+            gradient.append(value)
+
+        return gradient
+
     def to_dict(self, full_output=False):
         """Create dictionary for YAML serilisation."""
         data = super().to_dict(full_output)
@@ -30,6 +30,7 @@ from gammapy.utils.roots import find_roots
 from gammapy.utils.scripts import make_path
 import gammapy.utils.parallel as parallel
 from ..covariance import CovarianceMixin
+from ..utils import _central_difference
 from .core import ModelBase
 
 log = logging.getLogger(__name__)
@@ -421,6 +422,58 @@ class SpectralModel(ModelBase):
         )
         return self._get_errors(propagated_samples)
 
+    def integral_gradient(
+        self, energy_min, energy_max, parameters=None, epsilon=1e-3, **kwargs
+    ):
+        """Compute the derivatives of the integral flux with respect to the parameters.
+
+        If the model defines an ``evaluate_integral_gradient`` method, the analytical
+        derivatives are used for the parameters it supports. The remaining derivatives
+        are computed numerically using central differences of `integral`.
+
+        Parameters
+        ----------
+        energy_min, energy_max : `~astropy.units.Quantity`
+            Lower and upper bound of integration range.
+        parameters : list of `~gammapy.modeling.Parameter`, optional
+            Parameters to compute the derivatives for. Default is None,
+            which uses the free parameters of the model.
+        epsilon : float, optional
+            Relative step size used for the numerical derivatives. Default is 1e-3.
+        **kwargs : dict
+            Keyword arguments passed to `integral`.
+
+        Returns
+        -------
+        gradient : list of `~astropy.units.Quantity`
+            Derivatives of the integral flux, one per parameter.
+        """
+        if parameters is None:
+            parameters = self.parameters.free_parameters
+
+        analytical = {}
+        if hasattr(self, "evaluate_integral_gradient"):
+            kwargs_ref = {par.name: par.quantity for par in self.parameters}
+            kwargs_ref = self._convert_evaluate_unit(kwargs_ref, energy_min)
+            analytical = self.evaluate_integral_gradient(
+                energy_min, energy_max, **kwargs_ref
+            )
+
+        gradient = []
+        for par in parameters:
+            if par.name in analytical and par in self.parameters:
+                value = analytical[par.name]
+            else:
+                value = _central_difference(
+                    lambda: self.integral(energy_min, energy_max, **kwargs),
+                    parameter=par,
+                    epsilon=epsilon,
+                )
+                value = value / par.unit
+            gradient.append(value)
+
+        return gradient
+
     def energy_flux(self, energy_min, energy_max, **kwargs):
         r"""Compute energy flux in given energy range.
 
@@ -1067,6 +1120,44 @@ class PowerLawSpectralModel(SpectralModel):
 
         return integral
 
+    @staticmethod
+    def evaluate_integral_gradient(energy_min, energy_max, index, amplitude, reference):
+        """Derivatives of the integral flux with respect to amplitude and index (static function).
+
+        Parameters
+        ----------
+        energy_min, energy_max : `~astropy.units.Quantity`
+            Lower and upper bound of integration range.
+
+        Returns
+        -------
+        gradient : dict of `~astropy.units.Quantity`
+            Derivatives of the integral flux for the "amplitude" and "index" parameters.
+        """
+        val = u.Quantity(-1 * index + 1).to_value("")
+
+        log_upper = np.log((energy_max / reference).to_value(""))
+        log_lower = np.log((energy_min / reference).to_value(""))
+        upper = np.exp(val * log_upper)
+        lower = np.exp(val * log_lower)
+
+        with np.errstate(invalid="ignore", divide="ignore"):
+            derivative = (upper * log_upper - lower * log_lower) / val
+            derivative -= (upper - lower) / val**2
+
+        mask = np.isclose(val, 0)
+        if mask.any():
+            derivative = np.where(mask, (log_upper**2 - log_lower**2) / 2, derivative)
+
+        integral = PowerLawSpectralModel.evaluate_integral(
+            energy_min, energy_max, index, amplitude, reference
+        )
+
+        return {
+            "amplitude": integral / amplitude,
+            "index": -amplitude * reference * derivative,
+        }
+
     @staticmethod
     def evaluate_energy_flux(energy_min, energy_max, index, amplitude, reference):
         r"""Compute energy flux in given energy range analytically (static function).
@@ -35,6 +35,7 @@ from gammapy.modeling.models import (
     TemplateNDSpectralModel,
     TemplateSpectralModel,
 )
+from gammapy.modeling.utils import _central_difference
 from gammapy.utils.compat import COPY_IF_NEEDED
 from gammapy.utils.scripts import make_path
 from gammapy.utils.testing import (
@@ -1209,6 +1210,39 @@ def test_integral_error_power_law():
     assert_allclose(flux_errp.value[0] / 1e-14, 8.674678, rtol=7e-1)
 
 
+@pytest.mark.parametrize("index", [2.3, 1.0])
+def test_integral_gradient_power_law(index):
+    energy = np.geomspace(1 * u.TeV, 10 * u.TeV, 5)
+    energy_min, energy_max = energy[:-1], energy[1:]
+
+    model = PowerLawSpectralModel(index=index)
+    gradient = model.integral_gradient(energy_min, energy_max)
+
+    for value, par in zip(gradient, model.parameters.free_parameters):
+        expected = _central_difference(
+            lambda: model.integral(energy_min, energy_max), parameter=par
+        )
+        assert_quantity_allclose(value, expected / par.unit, rtol=1e-5)
+
+
+def test_integral_gradient_exp_cut_off_power_law():
+    energy = np.geomspace(1 * u.TeV, 10 * u.TeV, 5)
+    energy_min, energy_max = energy[:-1], energy[1:]
+
+    model = ExpCutoffPowerLawSpectralModel()
+    gradient = model.integral_gradient(
+        energy_min, energy_max, parameters=[model.amplitude, model.lambda_]
+    )
+
+    assert len(gradient) == 2
+    assert gradient[0].unit == "TeV"
+    assert_allclose(
+        gradient[0].value, model.integral(energy_min, energy_max).value / 1e-12
+    )
+    assert gradient[1].unit == "cm-2 s-1 TeV"
+    assert np.all(gradient[1].value < 0)
+
+
 def test_integral_error_exp_cut_off_power_law():
     energy = np.linspace(1 * u.TeV, 10 * u.TeV, 10)
     energy_min = energy[:-1]
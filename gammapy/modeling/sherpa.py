@@ -20,13 +20,7 @@ class SherpaLikelihood(Likelihood):
     """Likelihood function interface for Sherpa."""
 
     def fcn(self, factors):
-        self.parameters.set_parameter_factors(factors)
-        total_stat = self.function()
-
-        if self.store_trace:
-            self.store_trace_iteration(total_stat)
-
-        return total_stat, 0
+        return super().fcn(factors), 0
 
 
 def optimize_sherpa(parameters, function, store_trace=False, **kwargs):
@@ -2,6 +2,7 @@
 """Unit tests for the Fit class"""
 
 import pytest
+import numpy as np
 from numpy.testing import assert_allclose
 from astropy.table import Table
 from gammapy.datasets import Dataset, Datasets, SpectrumDatasetOnOff
@@ -93,6 +94,49 @@ def test_optimize_backend_and_covariance(backend):
     assert_allclose(correlation[1, 2], 0, atol=1e-7)
 
 
+@pytest.mark.parametrize(
+    "backend, optimize_opts",
+    [("minuit", {}), ("scipy", {"method": "L-BFGS-B"})],
+)
+def test_optimize_use_gradient(backend, optimize_opts):
+    dataset = MyDataset()
+    optimize_opts["backend"] = backend
+
+    fit = Fit(backend=backend, optimize_opts=optimize_opts, use_gradient=True)
+    result = fit.optimize([dataset])
+    pars = dataset.models.parameters
+
+    assert result.success
+    assert_allclose(pars["x"].value, 2, rtol=1e-3)
+    assert_allclose(pars["y"].value, 3e2, rtol=1e-3)
+    assert_allclose(pars["z"].value, 4e-2, rtol=1e-2)
+
+
+def test_optimize_store_timing():
+    dataset = MyDataset()
+
+    result = Fit().optimize([dataset])
+    assert result.timing is None
+
+    result = Fit(store_timing=True).run([dataset])
+    timing = result.timing
+
+    assert "Fit.optimize" in timing["name"]
+    assert "Datasets.stat_sum" in timing["name"]
+
+    row = timing[list(timing["name"]).index("Likelihood.fcn")]
+    assert row["n_calls"] == result.nfev
+    assert row["time"] > 0
+
+
+def test_datasets_stat_sum_gradient():
+    datasets = Datasets([MyDataset()])
+    gradient = datasets.stat_sum_gradient()
+    assert_allclose(
+        gradient, [2 * (1.99 - 2), 2 * (2.99e3 - 3e2), 2 * (3.99e-2 - 4e-2)], rtol=1e-2
+    )
+
+
 @pytest.mark.parametrize("backend", ["minuit"])
 def test_run(backend):
     dataset = MyDataset()
@@ -389,6 +433,34 @@ def test_stat_surface_reoptimize():
     )
 
 
+@pytest.mark.parametrize("reoptimize", [False, True])
+def test_stat_profile_surface_parallel(reoptimize):
+    dataset = MyDataset()
+    fit = Fit()
+    fit.run([dataset])
+
+    dataset.models.parameters["z"].value = 0
+    dataset.models.parameters["x"].scan_values = [1, 2, 3]
+    dataset.models.parameters["y"].scan_values = [2e2, 3e2, 4e2]
+
+    profile = fit.stat_profile(datasets=[dataset], parameter="x", reoptimize=reoptimize)
+    surface = fit.stat_surface(datasets=[dataset], x="x", y="y", reoptimize=reoptimize)
+
+    fit = Fit(n_jobs=2)
+    profile_parallel = fit.stat_profile(
+        datasets=[dataset], parameter="x", reoptimize=reoptimize
+    )
+    surface_parallel = fit.stat_surface(
+        datasets=[dataset], x="x", y="y", reoptimize=reoptimize
+    )
+
+    assert_allclose(profile_parallel["stat_scan"], profile["stat_scan"], atol=1e-7)
+    assert_allclose(surface_parallel["stat_scan"], surface["stat_scan"], atol=1e-7)
+    assert len(profile_parallel["fit_results"]) == len(profile["fit_results"])
+    assert np.shape(surface_parallel["fit_results"]) == np.shape(surface["fit_results"])
+    assert_allclose(dataset.models.parameters["x"].value, 2)
+
+
 def test_stat_contour():
     dataset = MyDataset()
     dataset.models.parameters["x"].frozen = True
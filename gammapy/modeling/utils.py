@@ -1,4 +1,6 @@
 # Licensed under a 3-clause BSD style license - see LICENSE.rst
+import numpy as np
+import astropy.units as u
 
 
 def _parse_datasets(datasets):
@@ -8,3 +10,43 @@ def _parse_datasets(datasets):
     if isinstance(datasets, (list, Dataset)):
         datasets = Datasets(datasets)
     return datasets, datasets.parameters
+
+
+def _central_difference(function, parameter, epsilon=1e-3):
+    """Numerical derivative of a function with respect to a parameter value.
+
+    The step size is relative to the parameter value, or absolute if the value is zero.
+    For angles, the step size is relative to at most 1 deg, as sky positions have an
+    arbitrary zero point. The parameter value is restored on exit.
+
+    Parameters
+    ----------
+    function : callable
+        Function without arguments depending on the parameter value.
+    parameter : `~gammapy.modeling.Parameter`
+        Parameter to differentiate with respect to.
+    epsilon : float, optional
+        Relative step size. Default is 1e-3.
+
+    Returns
+    -------
+    derivative : object
+        Derivative of the function output, per unit of the parameter value.
+    """
+    value = parameter.value
+    scale = np.abs(value)
+
+    if parameter.unit.physical_type == "angle":
+        scale = min(scale, u.Quantity(1, "deg").to_value(parameter.unit))
+
+    step = epsilon * scale if scale != 0 else epsilon
+
+    try:
+        parameter.value = value + step
+        upper = function()
+        parameter.value = value - step
+        lower = function()
+    finally:
+        parameter.value = value
+
+    return (upper - lower) / (2 * step)
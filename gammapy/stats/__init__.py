@@ -4,6 +4,7 @@
 from .counts_statistic import CashCountsStatistic, WStatCountsStatistic
 from .fit_statistics import (
     cash,
+    cash_derivative,
     cstat,
     get_wstat_gof_terms,
     get_wstat_mu_bkg,
@@ -39,6 +40,7 @@ FIT_STATISTICS_REGISTRY = {
 
 __all__ = [
     "cash",
+    "cash_derivative",
     "CashCountsStatistic",
     "Chi2FitStatistic",
     "Chi2AsymmetricErrorFitStatistic",
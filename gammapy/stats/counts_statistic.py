@@ -10,6 +10,62 @@ from .fit_statistics import cash, wstat
 __all__ = ["WStatCountsStatistic", "CashCountsStatistic"]
 
 
+def _secant_roots(f, x0, x1, args=(), xtol=1.48e-8, maxiter=50):
+    """Find roots element-wise with the secant method.
+
+    Vectorized version of the secant iteration of `~scipy.optimize.newton`,
+    elements that do not converge are set to NaN.
+
+    Parameters
+    ----------
+    f : callable
+        Function evaluated on the full array of trial values.
+    x0, x1 : `~numpy.ndarray`
+        Starting values.
+    args : tuple, optional
+        Extra arguments passed to the function. Default is ().
+    xtol : float, optional
+        Absolute tolerance for termination. Default is 1.48e-8.
+    maxiter : int, optional
+        Maximum number of iterations. Default is 50.
+
+    Returns
+    -------
+    roots : `~numpy.ndarray`
+        Roots.
+    """
+    p0, p1 = np.broadcast_arrays(np.asarray(x0, dtype=float), x1)
+    roots = np.full(p0.shape, np.nan)
+    active = np.ones(p0.shape, dtype=bool)
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        q0, q1 = f(p0, *args), f(p1, *args)
+
+        swap = np.abs(q1) < np.abs(q0)
+        p0, p1 = np.where(swap, p1, p0), np.where(swap, p0, p1)
+        q0, q1 = np.where(swap, q1, q0), np.where(swap, q0, q1)
+
+        for _ in range(maxiter):
+            active &= q1 != q0
+            p = np.where(
+                np.abs(q1) > np.abs(q0),
+                (-q0 / q1 * p1 + p0) / (1 - q0 / q1),
+                (-q1 / q0 * p0 + p1) / (1 - q1 / q0),
+            )
+            converged = active & np.isclose(p, p1, rtol=0, atol=xtol)
+            roots[converged] = p[converged]
+            active &= ~converged
+
+            if not np.any(active):
+                break
+
+            p0, q0 = p1, q1
+            p1 = np.where(active, p, p1)
+            q1 = f(p1, *args)
+
+    return roots
+
+
 class CountsStatistic(abc.ABC):
     """Counts statistics base class."""
 
@@ -196,7 +252,8 @@ class CountsStatistic(abc.ABC):
     def n_sig_matching_significance(self, significance):
         """Compute excess matching a given significance.
 
-        This function is the inverse of `significance`.
+        This function is the inverse of `significance`. The secant method
+        is applied to all elements at once.
 
         Parameters
         ----------
@@ -208,26 +265,15 @@ class CountsStatistic(abc.ABC):
         n_sig : `numpy.ndarray`
             Excess.
         """
-        n_sig = np.zeros_like(self.n_bkg, dtype="float")
-        it = np.nditer(n_sig, flags=["multi_index"])
-
-        while not it.finished:
-            lower_bound = np.sqrt(self.n_bkg[it.multi_index]) * significance
-            # find upper bounds for secant method as in scipy
-            eps = 1e-4
-            upper_bound = lower_bound * (1 + eps)
-            upper_bound += eps if upper_bound >= 0 else -eps
-            roots, res = find_roots(
-                self._n_sig_matching_significance_fcn,
-                lower_bound=lower_bound,
-                upper_bound=upper_bound,
-                args=(significance, it.multi_index),
-                nbin=1,
-                method="secant",
-            )
-            n_sig[it.multi_index] = roots[0]  # return NaN if fail
-            it.iternext()
-        return n_sig
+        # find upper bounds for secant method as in scipy
+        eps = 1e-4
+        p0 = np.sqrt(self.n_bkg) * significance
+        p1 = p0 * (1 + eps)
+        p1 += np.where(p1 >= 0, eps, -eps)
+
+        return _secant_roots(
+            self._n_sig_matching_significance_fcn, p0, p1, args=(significance, ...)
+        )
 
     @abc.abstractmethod
     def sum(self, axis=None):
@@ -14,6 +14,7 @@ from gammapy.utils.compilation import get_fit_statistics_compiled
 
 __all__ = [
     "cash",
+    "cash_derivative",
     "cstat",
     "wstat",
     "get_wstat_mu_bkg",
@@ -79,6 +80,43 @@ def cash(n_on, mu_on, truncation_value=None):
     return stat
 
 
+def cash_derivative(n_on, mu_on, truncation_value=None):
+    r"""Derivative of the Cash statistic with respect to the expected counts.
+
+    The derivative is given by:
+
+    .. math::
+        \frac{\partial C}{\partial \mu_{on}} = 2 \left( 1 - \frac{n_{on}}{\mu_{on}} \right)
+
+    and is zero where ``mu_on`` <= ``truncation_value``, since the statistic
+    is constant in that range.
+
+    Parameters
+    ----------
+    n_on : `~numpy.ndarray` or array_like
+        Observed counts.
+    mu_on : `~numpy.ndarray` or array_like
+        Expected counts.
+    truncation_value : `~numpy.ndarray` or array_like
+        Minimum value use for ``mu_on``. Default is 1e-25.
+
+    Returns
+    -------
+    derivative : ndarray
+        Derivative of the statistic per bin.
+    """
+    if truncation_value is None:
+        truncation_value = get_fit_statistics_compiled()["TRUNCATION_VALUE"]
+
+    n_on = np.asanyarray(n_on, dtype=np.float64)
+    mu_on = np.asanyarray(mu_on, dtype=np.float64)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        derivative = 2 * (1 - n_on / mu_on)
+
+    return np.where(mu_on <= truncation_value, 0, derivative)
+
+
 def cstat(n_on, mu_on, truncation_value=None):
     r"""C statistic, for Poisson data.
 
@@ -253,7 +291,14 @@ def get_wstat_gof_terms(n_on, n_off):
 
 
 class FitStatistic(ABC):
-    """Abstract base class for FitStatistic objects."""
+    """Abstract base class for FitStatistic objects.
+
+    Subclasses setting ``has_derivative`` to True implement
+    ``stat_derivative_array_dataset``, the derivative of -2 * log(L) with
+    respect to npred. Bins excluded by the dataset mask have a zero derivative.
+    """
+
+    has_derivative = False
 
     @classmethod
     def stat_sum_dataset(cls, dataset):
@@ -278,6 +323,8 @@ class FitStatistic(ABC):
 class CashFitStatistic(FitStatistic):
     """Cash statistic class for Poisson with known background."""
 
+    has_derivative = True
+
     @classmethod
     def stat_sum_dataset(cls, dataset):
         mask = dataset.mask
@@ -288,6 +335,8 @@ class CashFitStatistic(FitStatistic):
             counts, npred = counts[mask], npred[mask]
 
         counts = counts.astype(float)  # This might be done in the Dataset
+        # the sum is always accumulated in double precision
+        npred = npred.astype(float, copy=False)
         return get_fit_statistics_compiled()["cash_sum_compiled"](
             counts.ravel(), npred.ravel()
         )
@@ -297,13 +346,26 @@ class CashFitStatistic(FitStatistic):
         counts, npred = dataset.counts.data, dataset.npred().data
         return cash(n_on=counts, mu_on=npred)
 
+    @classmethod
+    def stat_derivative_array_dataset(cls, dataset):
+        counts, npred = dataset.counts.data, dataset.npred().data
+        derivative = cash_derivative(n_on=counts, mu_on=npred)
+
+        if dataset.mask is not None:
+            derivative = derivative * dataset.mask.data
+        return derivative
+
 
 class WeightedCashFitStatistic(FitStatistic):
     """Cash statistic class for Poisson with known background applying weights."""
 
+    has_derivative = True
+
     @classmethod
     def stat_sum_dataset(cls, dataset):
         counts, npred = dataset.counts.data.astype(float), dataset.npred().data
+        # the sum is always accumulated in double precision
+        npred = npred.astype(float, copy=False)
 
         if dataset.mask is not None:
             mask = ~(dataset.mask.data == False)  # noqa
@@ -328,10 +390,21 @@ class WeightedCashFitStatistic(FitStatistic):
             weights = dataset.mask.astype("float")
         return cash(n_on=counts, mu_on=npred) * weights
 
+    @classmethod
+    def stat_derivative_array_dataset(cls, dataset):
+        counts, npred = dataset.counts.data, dataset.npred().data
+        derivative = cash_derivative(n_on=counts, mu_on=npred)
+
+        if dataset.mask is not None:
+            derivative = derivative * dataset.mask.data.astype("float")
+        return derivative
+
 
 class WStatFitStatistic(FitStatistic):
     """WStat fit statistic class for ON-OFF Poisson measurements."""
 
+    has_derivative = True
+
     @classmethod
     def stat_array_dataset(cls, dataset):
         """Statistic function value per bin given the current model parameters."""
@@ -349,6 +422,33 @@ class WStatFitStatistic(FitStatistic):
         )
         return np.nan_to_num(on_stat_)
 
+    @classmethod
+    def stat_derivative_array_dataset(cls, dataset):
+        """Derivative of the statistic with respect to the predicted signal counts.
+
+        The background is profiled, so the derivative of the profile
+        likelihood equals the partial derivative at fixed ``mu_bkg``.
+        """
+        counts, counts_off, alpha = (
+            dataset.counts.data,
+            dataset.counts_off.data,
+            dataset.alpha.data,
+        )
+        npred_signal = dataset.npred_signal().data
+        mu_bkg = get_wstat_mu_bkg(
+            n_on=counts, n_off=counts_off, alpha=alpha, mu_sig=npred_signal
+        )
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            derivative = 2 * (1 - counts / (npred_signal + alpha * mu_bkg))
+
+        derivative = np.where(counts == 0, 2, derivative)
+        derivative = np.nan_to_num(derivative)
+
+        if dataset.mask is not None:
+            derivative = derivative * dataset.mask.data
+        return derivative
+
     @classmethod
     def stat_sum_dataset(cls, dataset):
         """Statistic function value per bin given the current model parameters."""
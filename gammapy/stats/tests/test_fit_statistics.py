@@ -119,6 +119,21 @@ def test_cash(test_data, reference_values):
     assert_allclose(statsvec, reference_values["cash"])
 
 
+def test_cash_derivative(test_data):
+    n_on = np.array(test_data["n_on"], dtype=float)
+    mu_on = np.array(test_data["mu_sig"], dtype=float) + 0.5
+
+    derivative = stats.cash_derivative(n_on=n_on, mu_on=mu_on)
+
+    step = 1e-6
+    expected = stats.cash(n_on=n_on, mu_on=mu_on + step)
+    expected -= stats.cash(n_on=n_on, mu_on=mu_on - step)
+    assert_allclose(derivative, expected / (2 * step), rtol=1e-5)
+
+    derivative = stats.cash_derivative(n_on=[1, 0], mu_on=[0, 0])
+    assert_allclose(derivative, [0, 0])
+
+
 def test_cstat(test_data, reference_values):
     statsvec = stats.cstat(n_on=test_data["n_on"], mu_on=test_data["mu_sig"])
     assert_allclose(statsvec, reference_values["cstat"])
@@ -402,6 +417,21 @@ def test_chi2_fit_statistic_with_mask_false(mock_fp_dataset):
     assert stat_sum == 0
 
 
+@pytest.mark.parametrize(
+    "fit_statistic, has_derivative",
+    [
+        (CashFitStatistic, True),
+        (WeightedCashFitStatistic, True),
+        (WStatFitStatistic, True),
+        (Chi2FitStatistic, False),
+        (Chi2AsymmetricErrorFitStatistic, False),
+    ],
+)
+def test_fit_statistic_has_derivative(fit_statistic, has_derivative):
+    assert fit_statistic.has_derivative is has_derivative
+    assert hasattr(fit_statistic, "stat_derivative_array_dataset") is has_derivative
+
+
 def test_chi2_asym_fit_statistic_stat_sum_nomask(mock_fp_dataset):
     mock_fp_dataset.mask = None
     stat_sum = Chi2AsymmetricErrorFitStatistic.stat_sum_dataset(mock_fp_dataset)
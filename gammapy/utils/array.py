@@ -1,6 +1,7 @@
 # Licensed under a 3-clause BSD style license - see LICENSE.rst
 """Utility functions to deal with arrays and quantities."""
 import numpy as np
+import scipy.fft
 import scipy.ndimage
 import scipy.signal
 from astropy.convolution import Gaussian2DKernel
@@ -185,3 +186,82 @@ def scale_cube(data, kernels):
         Array of the shape (len(kernels), data.shape).
     """
     return np.dstack([_fftconvolve_wrap(kernel, data) for kernel in kernels])
+
+
+def _get_kernel_array(kernel):
+    """Kernel array, as applied by `_fftconvolve_wrap`."""
+    if isinstance(kernel, Gaussian2DKernel):
+        width = kernel.model.x_stddev.value
+        # same truncation and sampling as `scipy.ndimage.gaussian_filter`
+        radius = int(4 * width + 0.5)
+        delta = np.zeros((2 * radius + 1, 2 * radius + 1))
+        delta[radius, radius] = 1
+        kernel_array = scipy.ndimage.gaussian_filter(delta, width, mode="constant")
+        return kernel.array.sum() * kernel_array
+    else:
+        return kernel.array
+
+
+def _scale_cubes_fft(arrays, kernels, n_threads=None):
+    """Compute scale space cubes of several arrays using FFTs.
+
+    The Fourier transform of each array is computed once and multiplied with
+    the transform of each kernel. As in `scale_cube`, the image boundaries are
+    reflected for Gaussian kernels and zero padded for the other kernels.
+
+    Parameters
+    ----------
+    arrays : list of `~numpy.ndarray`
+        Input 2D arrays, all of the same shape.
+    kernels : list of `~astropy.convolution.Kernel`
+        List of convolution kernels.
+    n_threads : int, optional
+        Number of threads used to process the kernels.
+        Default is None, see `~gammapy.utils.parallel.run_threads`.
+
+    Returns
+    -------
+    cubes : list of `~numpy.ndarray`
+        Arrays of the shape (data.shape, len(kernels)), one per input array.
+    """
+    from gammapy.utils.parallel import run_threads
+
+    shape_image = arrays[0].shape
+    kernel_arrays = [_get_kernel_array(kernel) for kernel in kernels]
+    reflect = [isinstance(kernel, Gaussian2DKernel) for kernel in kernels]
+
+    pad = max(
+        [(k.shape[0] - 1) // 2 for k, r in zip(kernel_arrays, reflect) if r],
+        default=0,
+    )
+    kernel_shape = np.max([k.shape for k in kernel_arrays], axis=0)
+    shape = [
+        scipy.fft.next_fast_len(int(n + 2 * pad + k - 1), real=True)
+        for n, k in zip(shape_image, kernel_shape)
+    ]
+
+    transforms = {}
+    for mode in set(reflect):
+        width = pad if mode else 0
+        transforms[mode] = [
+            scipy.fft.rfft2(np.pad(data, width, mode="symmetric"), s=shape)
+            for data in arrays
+        ]
+
+    cubes = [np.empty(shape_image + (len(kernels),)) for _ in arrays]
+
+    def convolve(idx, kernel_array, mode):
+        kernel_transform = scipy.fft.rfft2(kernel_array, s=shape)
+        width = pad if mode else 0
+        y_lo, x_lo = [width + (k - 1) // 2 for k in kernel_array.shape]
+        slices = slice(y_lo, y_lo + shape_image[0]), slice(x_lo, x_lo + shape_image[1])
+        for cube, transform in zip(cubes, transforms[mode]):
+            data = scipy.fft.irfft2(transform * kernel_transform, s=shape)
+            cube[..., idx] = data[slices]
+
+    run_threads(
+        convolve,
+        zip(range(len(kernels)), kernel_arrays, reflect),
+        n_threads=n_threads,
+    )
+    return cubes
@@ -22,6 +22,9 @@ class HDULocation:
     usually those objects will be used to access data.
 
     See also `HDU index table <https://gamma-astro-data-formats.readthedocs.io/en/latest/data_storage/hdu_index/index.html#hdu-index>`__.
+
+    For event lists, ``columns`` restricts the columns read in addition to
+    the required ones, see `~gammapy.data.EventList.read`.
     """
 
     def __init__(
@@ -33,6 +36,7 @@ class HDULocation:
         hdu_name=None,
         cache=True,
         format=None,
+        columns=None,
     ):
         self.hdu_class = hdu_class
         self.base_dir = base_dir
@@ -41,6 +45,7 @@ class HDULocation:
         self.hdu_name = hdu_name
         self.cache = cache
         self.format = format
+        self.columns = columns
 
     def _repr_html_(self):
         try:
@@ -89,7 +94,7 @@ class HDULocation:
         if hdu_class == "events":
             from gammapy.data import EventList
 
-            return EventList.read(filename, hdu=hdu)
+            return EventList.read(filename, hdu=hdu, columns=self.columns)
         elif hdu_class == "gti":
             from gammapy.data.gti import GTI
 
@@ -102,10 +107,20 @@ class HDULocation:
             # FIXME: support loading the pointing table
             from gammapy.data import FixedPointingInfo
 
+            if filename.suffix == ".parquet":
+                from gammapy.data.io import read_header_parquet
+
+                return FixedPointingInfo.from_fits_header(read_header_parquet(filename))
+
             return FixedPointingInfo.read(filename, hdu=hdu)
         elif hdu_class == "observation_metadata":
             from gammapy.data import ObservationMetaData
 
+            if filename.suffix == ".parquet":
+                from gammapy.data.io import read_header_parquet
+
+                return ObservationMetaData.from_header(read_header_parquet(filename))
+
             with fits.open(filename) as hdulist:
                 header = hdulist[hdu].header
                 return ObservationMetaData.from_header(header)
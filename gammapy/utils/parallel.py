@@ -3,6 +3,9 @@
 
 import importlib
 import logging
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from enum import Enum
 from gammapy.utils.pbar import progress_bar
 
@@ -11,11 +14,13 @@ log = logging.getLogger(__name__)
 __all__ = [
     "multiprocessing_manager",
     "run_multiprocessing",
+    "run_threads",
     "BACKEND_DEFAULT",
     "N_JOBS_DEFAULT",
     "POOL_KWARGS_DEFAULT",
     "METHOD_DEFAULT",
     "METHOD_KWARGS_DEFAULT",
+    "N_THREADS_DEFAULT",
 ]
 
 
@@ -48,6 +53,11 @@ ALLOW_CHILD_JOBS = False
 POOL_KWARGS_DEFAULT = dict(processes=N_JOBS_DEFAULT)
 METHOD_DEFAULT = PoolMethodEnum.starmap
 METHOD_KWARGS_DEFAULT = {}
+N_THREADS_DEFAULT = 1
+
+_THREAD_POOLS = {}
+_THREAD_POOLS_LOCK = threading.Lock()
+_THREAD_PREFIX = "gammapy-thread"
 
 
 def get_multiprocessing():
@@ -103,6 +113,9 @@ class multiprocessing_manager:
         Pool method to use.
     method_kwargs : dict
         Keyword arguments passed to the method
+    n_threads : int
+        Number of threads used to evaluate the datasets in
+        `~gammapy.datasets.Datasets.stat_sum`.
 
     Examples
     --------
@@ -118,20 +131,34 @@ class multiprocessing_manager:
                 pool_kwargs=dict(processes=2),
             ):
             fpe.run(datasets)
+
+        from gammapy.modeling import Fit
+
+        with parallel.multiprocessing_manager(n_threads=8):
+            Fit().run(datasets)
     """
 
-    def __init__(self, backend=None, pool_kwargs=None, method=None, method_kwargs=None):
+    def __init__(
+        self,
+        backend=None,
+        pool_kwargs=None,
+        method=None,
+        method_kwargs=None,
+        n_threads=None,
+    ):
         global \
             BACKEND_DEFAULT, \
             POOL_KWARGS_DEFAULT, \
             METHOD_DEFAULT, \
             METHOD_KWARGS_DEFAULT, \
-            N_JOBS_DEFAULT
+            N_JOBS_DEFAULT, \
+            N_THREADS_DEFAULT
         self._backend = BACKEND_DEFAULT
         self._pool_kwargs = POOL_KWARGS_DEFAULT
         self._method = METHOD_DEFAULT
         self._method_kwargs = METHOD_KWARGS_DEFAULT
         self._n_jobs = N_JOBS_DEFAULT
+        self._n_threads = N_THREADS_DEFAULT
         if backend is not None:
             BACKEND_DEFAULT = ParallelBackendEnum.from_str(backend).value
         if pool_kwargs is not None:
@@ -141,6 +168,8 @@ class multiprocessing_manager:
             METHOD_DEFAULT = PoolMethodEnum(method).value
         if method_kwargs is not None:
             METHOD_KWARGS_DEFAULT = method_kwargs
+        if n_threads is not None:
+            N_THREADS_DEFAULT = n_threads
 
     def __enter__(self):
         pass
@@ -151,12 +180,14 @@ class multiprocessing_manager:
             POOL_KWARGS_DEFAULT, \
             METHOD_DEFAULT, \
             METHOD_KWARGS_DEFAULT, \
-            N_JOBS_DEFAULT
+            N_JOBS_DEFAULT, \
+            N_THREADS_DEFAULT
         BACKEND_DEFAULT = self._backend
         POOL_KWARGS_DEFAULT = self._pool_kwargs
         METHOD_DEFAULT = self._method
         METHOD_KWARGS_DEFAULT = self._method_kwargs
         N_JOBS_DEFAULT = self._n_jobs
+        N_THREADS_DEFAULT = self._n_threads
 
 
 class ParallelMixin:
@@ -339,6 +370,82 @@ def run_pool_async(pool, func, inputs, method_kwargs=None, task_name=""):
     return results
 
 
+def get_thread_pool(n_threads):
+    """Get the persistent thread pool for a given number of threads.
+
+    One pool is kept per number of threads, so that callers using different
+    numbers of threads do not shut down each other's pools. Pools are created
+    on first use, again in a forked process, and creation is thread-safe.
+
+    Parameters
+    ----------
+    n_threads : int
+        Number of threads.
+
+    Returns
+    -------
+    pool : `~concurrent.futures.ThreadPoolExecutor`
+        Thread pool.
+    """
+    key = (os.getpid(), n_threads)
+
+    with _THREAD_POOLS_LOCK:
+        if key not in _THREAD_POOLS:
+            # pools inherited from the parent process have no running threads
+            for key_pool in [_ for _ in _THREAD_POOLS if _[0] != key[0]]:
+                del _THREAD_POOLS[key_pool]
+
+            _THREAD_POOLS[key] = ThreadPoolExecutor(
+                max_workers=n_threads, thread_name_prefix=_THREAD_PREFIX
+            )
+
+        return _THREAD_POOLS[key]
+
+
+def _reset_thread_pools_lock():
+    global _THREAD_POOLS_LOCK
+    _THREAD_POOLS_LOCK = threading.Lock()
+
+
+if hasattr(os, "register_at_fork"):
+    # the lock may be held by another thread of the parent at fork time
+    os.register_at_fork(after_in_child=_reset_thread_pools_lock)
+
+
+def run_threads(func, inputs, n_threads=None):
+    """Run function in a loop or in a persistent thread pool.
+
+    Threads share the memory of the main process, so no arguments are copied.
+    This is efficient for functions which release the GIL, such as numpy
+    operations on large arrays or the compiled fit statistics.
+
+    Parameters
+    ----------
+    func : function
+        Function to run.
+    inputs : list
+        List of arguments to pass to the function.
+    n_threads : int, optional
+        Number of threads. If None, defaults to `N_THREADS_DEFAULT`.
+        Default is None.
+
+    Returns
+    -------
+    results : list
+        Results in the order of the inputs.
+    """
+    if n_threads is None:
+        n_threads = N_THREADS_DEFAULT
+
+    # nested calls run in the calling thread, to avoid waiting on the pool itself
+    if n_threads == 1 or threading.current_thread().name.startswith(_THREAD_PREFIX):
+        return [func(*arguments) for arguments in inputs]
+
+    pool = get_thread_pool(n_threads)
+    futures = [pool.submit(func, *arguments) for arguments in inputs]
+    return [future.result() for future in futures]
+
+
 POOL_METHODS = {
     PoolMethodEnum.starmap: run_pool_star_map,
     PoolMethodEnum.apply_async: run_pool_async,
@@ -30,13 +30,14 @@ except ImportError:
 SHOW_PROGRESS_BAR = False
 
 
-def progress_bar(iterable, desc=None):
-    # Necessary because iterable may be a zip
-    iterable_to_list = list(iterable)
-    total = len(iterable_to_list)
+def progress_bar(iterable, desc=None, total=None):
+    # Necessary because iterable may be a zip, unless the total is known
+    if total is None:
+        iterable = list(iterable)
+        total = len(iterable)
 
     return tqdm(
-        iterable_to_list,
+        iterable,
         total=total,
         disable=not SHOW_PROGRESS_BAR,
         desc=desc,
@@ -23,6 +23,7 @@ from regions import (
     EllipseSkyRegion,
     RectangleSkyRegion,
     Regions,
+    SkyRegion,
     PolygonSkyRegion,
     PolygonPixelRegion,
 )
@@ -142,6 +143,52 @@ def regions_to_compound_region(regions):
     return region_union
 
 
+def region_contains(region, skycoord, wcs):
+    """Check which sky coordinates are contained in a sky region.
+
+    Gives the same result as ``region.contains(skycoord, wcs)``. For compound
+    regions, the sky coordinates are converted to pixel coordinates only once
+    and shared by all sub-regions, instead of being converted again for each
+    of them. This makes the check much faster for compound regions made of
+    many regions, such as a set of reflected OFF regions.
+
+    Parameters
+    ----------
+    region : `~regions.SkyRegion`
+        Sky region or compound sky region.
+    skycoord : `~astropy.coordinates.SkyCoord`
+        Sky coordinates to check.
+    wcs : `~astropy.wcs.WCS`
+        World coordinate system transformation.
+
+    Returns
+    -------
+    contains : `~numpy.ndarray`
+        Boolean array with the same shape as ``skycoord``.
+    """
+    pixcoord = []
+
+    def contains(region):
+        if isinstance(region, CompoundSkyRegion):
+            in_region = region.operator(
+                contains(region.region1), contains(region.region2)
+            )
+            if not region.meta.get("include", True):
+                in_region = np.logical_not(in_region)
+            return in_region
+
+        # regions which define their own sky containment, e.g. spherical circles
+        if type(region).contains is not SkyRegion.contains:
+            return region.contains(skycoord, wcs)
+
+        if not pixcoord:
+            pixcoord.append(PixCoord.from_sky(skycoord, wcs))
+
+        return region.to_pixel(wcs).contains(pixcoord[0])
+
+    return contains(region)
+
+
 def get_centroid(vertices):
     """Compute centroid of a polygon. Implicitly assumes a flat
     cartesian projection, will probably break for very large polygons.
@@ -78,6 +78,40 @@ def test_run_multiprocessing_simple_apply_async():
     assert task.sum_squared == N * (N + 1) * (2 * N + 1) / 6
 
 
+def test_run_threads():
+    inputs = [(_,) for _ in range(10)]
+
+    with parallel.multiprocessing_manager(n_threads=3):
+        assert parallel.N_THREADS_DEFAULT == 3
+        result = parallel.run_threads(func=square, inputs=inputs)
+
+    assert parallel.N_THREADS_DEFAULT == 1
+    assert result == [_**2 for _ in range(10)]
+
+    result = parallel.run_threads(func=square, inputs=inputs, n_threads=2)
+    assert result == [_**2 for _ in range(10)]
+
+
+def test_get_thread_pool_concurrent():
+    from concurrent.futures import ThreadPoolExecutor
+
+    pool_2 = parallel.get_thread_pool(n_threads=2)
+    pool_3 = parallel.get_thread_pool(n_threads=3)
+    assert pool_2 is not pool_3
+    assert parallel.get_thread_pool(n_threads=2) is pool_2
+
+    inputs = [(_,) for _ in range(10)]
+
+    def run(n_threads):
+        return parallel.run_threads(func=square, inputs=inputs, n_threads=n_threads)
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        results = list(executor.map(run, [2, 3, 2, 3, 4, 2, 4, 3]))
+
+    assert all(result == [_**2 for _ in range(10)] for result in results)
+    assert parallel.get_thread_pool(n_threads=3) is pool_3
+
+
 @requires_dependency("ray")
 def test_run_multiprocessing_simple_ray_starmap():
     N = 10
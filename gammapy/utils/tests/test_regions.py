@@ -26,6 +26,7 @@ from gammapy.utils.regions import (
     SphericalCircleSkyRegion,
     compound_region_center,
     region_circle_to_ellipse,
+    region_contains,
     region_to_frame,
     regions_to_compound_region,
     get_centroid,
@@ -98,6 +99,29 @@ def test_spherical_circle_sky_region():
     assert_equal(mask, [True, False])
 
 
+def test_region_contains():
+    center = SkyCoord(83.6, 22.0, unit="deg")
+    circles = [
+        CircleSkyRegion(center.directional_offset_by(angle, 0.7 * u.deg), 0.3 * u.deg)
+        for angle in [0, 90, 180, 270] * u.deg
+    ]
+    spherical = SphericalCircleSkyRegion(center, 0.8 * u.deg)
+    excluded = CircleSkyRegion(center, 0.2 * u.deg, meta=RegionMeta(include=False))
+
+    region = regions_to_compound_region(circles + [spherical])
+    region = (region ^ circles[0]) & excluded
+
+    wcs = WcsGeom.create(skydir=center, width=3 * u.deg, binsz=0.02).wcs
+    rng = np.random.default_rng(0)
+    coords = SkyCoord(
+        83.6 + rng.normal(0, 1, 1000), 22 + rng.normal(0, 1, 1000), unit="deg"
+    ).galactic
+
+    expected = region.contains(coords, wcs)
+    assert_equal(region_contains(region, coords, wcs), expected)
+    assert 0 < expected.sum() < 1000
+
+
 def test_region_to_frame():
     region = EllipseSkyRegion(
         center=SkyCoord(20, 17, unit="deg"),
@@ -0,0 +1,42 @@
+# Licensed under a 3-clause BSD style license - see LICENSE.rst
+import numpy as np
+from numpy.testing import assert_allclose
+from gammapy.utils.timing import TimingRecorder, record_cache, timed
+
+
+def test_timing_recorder():
+    with timed("outside"):
+        pass
+
+    with TimingRecorder() as recorder:
+        for _ in range(3):
+            with timed("stage"):
+                pass
+
+        record_cache("cache", cache_hit=True)
+        record_cache("cache", cache_hit=False)
+
+        with timed("cache", cache_hit=True):
+            pass
+
+    record_cache("cache", cache_hit=False)
+
+    table = recorder.to_table()
+    assert list(table["name"]) == ["stage", "cache"]
+    assert list(table["n_calls"]) == [3, 3]
+    assert table["time"].unit == "s"
+    assert np.isnan(table["cache_hit_rate"][0])
+    assert_allclose(table["cache_hit_rate"][1], 2 / 3)
+
+
+def test_timing_recorder_nested():
+    with TimingRecorder() as outer:
+        with TimingRecorder() as inner:
+            with timed("inner"):
+                pass
+
+        with timed("outer"):
+            pass
+
+    assert list(inner.to_table()["name"]) == ["inner"]
+    assert list(outer.to_table()["name"]) == ["outer"]
@@ -0,0 +1,145 @@
+# Licensed under a 3-clause BSD style license - see LICENSE.rst
+"""Lightweight timing instrumentation of computation stages."""
+
+import threading
+from time import perf_counter
+from astropy.table import Table
+
+__all__ = ["TimingRecorder", "record_cache", "timed"]
+
+_RECORDER = None
+
+
+class TimingRecorder:
+    """Record call counts, cumulative time and cache hits of named stages.
+
+    The instrumentation is opt-in: stages are only recorded while a recorder
+    is active, i.e. inside its context. Otherwise `timed` and `record_cache`
+    return immediately.
+
+    Examples
+    --------
+    ::
+
+        from gammapy.utils.timing import TimingRecorder
+
+        with TimingRecorder() as recorder:
+            datasets.stat_sum()
+
+        print(recorder.to_table())
+    """
+
+    def __init__(self):
+        self._stats = {}
+        self._lock = threading.Lock()
+        self._previous = None
+
+    def __enter__(self):
+        global _RECORDER
+        self._previous = _RECORDER
+        _RECORDER = self
+        return self
+
+    def __exit__(self, type, value, traceback):
+        global _RECORDER
+        _RECORDER = self._previous
+        self._previous = None
+
+    def add(self, name, time=0.0, cache_hit=None):
+        """Add a call to a stage.
+
+        Parameters
+        ----------
+        name : str
+            Stage name.
+        time : float, optional
+            Time spent in the call in seconds. Default is 0.
+        cache_hit : bool, optional
+            Whether the call used a cached value. Default is None,
+            which does not count the call in the cache statistics.
+        """
+        with self._lock:
+            stats = self._stats.setdefault(name, [0, 0.0, 0, 0])
+            stats[0] += 1
+            stats[1] += time
+            if cache_hit is not None:
+                stats[2] += 1
+                stats[3] += int(cache_hit)
+
+    def to_table(self):
+        """Recorded stages as a table.
+
+        Returns
+        -------
+        table : `~astropy.table.Table`
+            Table with one row per stage and columns "name", "n_calls", "time",
+            "time_per_call" and "cache_hit_rate". The cache hit rate is NaN for
+            stages without a cache.
+        """
+        rows = []
+        for name, (n_calls, time, n_cache, n_cache_hits) in self._stats.items():
+            rows.append(
+                {
+                    "name": name,
+                    "n_calls": n_calls,
+                    "time": time,
+                    "time_per_call": time / n_calls,
+                    "cache_hit_rate": n_cache_hits / n_cache
+                    if n_cache
+                    else float("nan"),
+                }
+            )
+
+        names = ["name", "n_calls", "time", "time_per_call", "cache_hit_rate"]
+        table = Table(rows=rows, names=names, dtype=[str, int, float, float, float])
+
+        for name in ["time", "time_per_call"]:
+            table[name].unit = "s"
+            table[name].format = ".4g"
+
+        table["cache_hit_rate"].format = ".3f"
+        return table
+
+
+class timed:
+    """Context manager adding the time spent in its block to the active recorder.
+
+    Parameters
+    ----------
+    name : str
+        Stage name.
+    cache_hit : bool, optional
+        Whether the stage used a cached value. Default is None.
+    """
+
+    __slots__ = ("name", "cache_hit", "_recorder", "_start")
+
+    def __init__(self, name, cache_hit=None):
+        self.name = name
+        self.cache_hit = cache_hit
+
+    def __enter__(self):
+        self._recorder = _RECORDER
+        if self._recorder is not None:
+            self._start = perf_counter()
+        return self
+
+    def __exit__(self, type, value, traceback):
+        if self._recorder is not None:
+            self._recorder.add(
+                self.name, perf_counter() - self._start, cache_hit=self.cache_hit
+            )
+
+
+def record_cache(name, cache_hit):
+    """Add a call to a stage to the active recorder, without timing.
+
+    Parameters
+    ----------
+    name : str
+        Stage name.
+    cache_hit : bool
+        Whether the stage used a cached value.
+    """
+    if _RECORDER is not None:
+        _RECORDER.add(name, cache_hit=cache_hit)